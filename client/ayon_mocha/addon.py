@@ -2,9 +2,11 @@
 from __future__ import annotations
 
 import os
-from typing import Any
+import sys
+from pathlib import Path
+from typing import Any, Optional
 
-from ayon_core.addon import AYONAddon, IHostAddon
+from ayon_core.addon import AYONAddon, IHostAddon, click_wrap
 
 from .version import __version__
 
@@ -28,3 +30,93 @@ class MochaAddon(AYONAddon, IHostAddon):
     def get_workfile_extensions(self) -> list[str]:  # noqa: PLR6301
         """Return supported workfile extensions."""
         return [".mocha"]
+
+    def cli(self, click_group: Any) -> None:  # noqa: ANN401, PLR6301
+        """Add addon commands to the AYON command line."""
+        click_group.add_command(cli_main.to_command())
+
+
+@click_wrap.group(MochaAddon.name, help="Mocha Pro commands.")
+def cli_main() -> None:
+    """Mocha Pro addon commands."""
+
+
+@cli_main.command("scan-workfiles")
+@click_wrap.option(
+    "--root", required=True,
+    help="Directory to search for Mocha Pro workfiles.")
+@click_wrap.option(
+    "--output", required=True,
+    help="Path to the index file.")
+@click_wrap.option(
+    "--format", "output_format", default=None,
+    help="Index format (json or csv), defaults to output file extension.")
+@click_wrap.option(
+    "--workers", type=int, default=None,
+    help="Number of worker processes.")
+def scan_workfiles_command(
+        root: str,
+        output: str,
+        output_format: Optional[str],
+        workers: Optional[int]) -> None:
+    """Index loaded containers and publish instances of workfiles."""
+    from .api.workfile_scanner import (
+        find_workfiles,
+        scan_workfiles,
+        write_index,
+    )
+
+    records = scan_workfiles(find_workfiles(Path(root)), workers)
+    write_index(records, Path(output), output_format)
+    print(f"Indexed {len(records)} workfiles to {output}")  # noqa: T201
+
+
+@cli_main.command("create-workfiles")
+@click_wrap.argument("workfiles", nargs=-1, required=True)
+@click_wrap.option(
+    "--mocha-executable", required=True,
+    help="Path to Mocha Pro executable.")
+def create_workfiles_command(
+        workfiles: tuple[str, ...],
+        mocha_executable: str) -> None:
+    """Create new workfiles from the template without Mocha Pro UI."""
+    from .api.bootstrap import run_bootstrap
+    from .api.headless import get_mocha_python_paths
+
+    mocha_python_path, _ = get_mocha_python_paths(Path(mocha_executable))
+    process = run_bootstrap(
+        [Path(workfile) for workfile in workfiles], mocha_python_path)
+    print(process.stdout.decode("utf-8", errors="replace"))  # noqa: T201
+    if process.returncode:
+        sys.exit(process.returncode)
+
+
+@cli_main.command("publish")
+@click_wrap.argument("workfiles", nargs=-1, required=True)
+@click_wrap.option(
+    "--mocha-executable", required=True,
+    help="Path to Mocha Pro executable.")
+@click_wrap.option(
+    "--workers", type=int, default=None,
+    help="Number of workfiles published concurrently.")
+def publish_command(
+        workfiles: tuple[str, ...],
+        mocha_executable: str,
+        workers: Optional[int]) -> None:
+    """Publish workfiles without Mocha Pro UI."""
+    from .api.headless import get_mocha_python_paths, run_batch_publish
+
+    mocha_python_path, _ = get_mocha_python_paths(Path(mocha_executable))
+    results = run_batch_publish(
+        [Path(workfile) for workfile in workfiles],
+        mocha_python_path,
+        workers,
+    )
+    failed = [result for result in results if not result.success]
+    for result in failed:
+        print(f"Failed to publish {result.workfile}:\n{result.output}")  # noqa: T201
+    print(  # noqa: T201
+        f"Published {len(results) - len(failed)} of {len(results)} "
+        "workfiles")
+    if failed:
+        sys.exit(1)
@@ -1,8 +1,32 @@
 """API for Mocha Pro AYON plugin."""
-from .pipeline import (
-    MochaProHost,
-)
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .pipeline import MochaProHost
 
 __all__ = [
     "MochaProHost",
 ]
+
+
+def __getattr__(name: str) -> Any:  # noqa: ANN401
+    """Import host lazily.
+
+    Pipeline requires running Mocha Pro, so it is imported only when
+    needed. This way the offline parts of the api (like
+    `project_reader`) can be used outside of Mocha Pro.
+
+    Returns:
+        Any: Requested attribute.
+
+    Raises:
+        AttributeError: If the attribute doesn't exist.
+
+    """
+    if name == "MochaProHost":
+        from .pipeline import MochaProHost
+        return MochaProHost
+    msg = f"module {__name__!r} has no attribute {name!r}"
+    raise AttributeError(msg)
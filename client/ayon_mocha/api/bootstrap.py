@@ -0,0 +1,84 @@
+"""Bootstrap new workfiles without Mocha Pro UI.
+
+New workfiles are created from the cached template by Mocha Pro's
+bundled Python interpreter, so no Mocha Pro window is started or
+restarted. All workfiles are created in one process running this
+module::
+
+    <mocha python> -m ayon_mocha.api.bootstrap <workfile> [<workfile> ...]
+
+Note:
+    Only `main` needs `mocha`, it is imported there so the rest can be
+    used from AYON launcher.
+
+"""
+from __future__ import annotations
+
+import logging
+import os
+import subprocess
+import sys
+from pathlib import Path
+from typing import Iterable, Optional
+
+log = logging.getLogger("ayon_mocha.bootstrap")
+BOOTSTRAP_MODULE = "ayon_mocha.api.bootstrap"
+
+
+def run_bootstrap(
+        workfiles: Iterable[Path],
+        mocha_python_path: Path,
+        env: Optional[dict[str, str]] = None,
+) -> subprocess.CompletedProcess:
+    """Create workfiles in a new Mocha Pro python process.
+
+    Args:
+        workfiles (Iterable[Path]): Paths of the new workfiles.
+        mocha_python_path (Path): Path to Mocha Pro python.
+        env (Optional[dict[str, str]]): Base environment.
+
+    Returns:
+        subprocess.CompletedProcess: Finished process with its output.
+
+    """
+    args = [
+        mocha_python_path.as_posix(),
+        "-m", BOOTSTRAP_MODULE,
+        *(workfile.as_posix() for workfile in workfiles),
+    ]
+    bootstrap_env = dict(os.environ if env is None else env)
+    bootstrap_env["PYTHONPATH"] = os.pathsep.join(sys.path)
+    return subprocess.run(
+        args,
+        env=bootstrap_env,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        check=False,
+    )
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    """Create workfiles passed as arguments.
+
+    Returns:
+        int: Exit code.
+
+    """
+    args = sys.argv[1:] if argv is None else argv
+    if not args:
+        log.error(
+            "Usage: python -m %s <workfile> [<workfile> ...]",
+            BOOTSTRAP_MODULE)
+        return 2
+    logging.basicConfig(level=logging.INFO)
+
+    from .workio import create_workfile
+
+    for workfile in args:
+        create_workfile(Path(workfile))
+        log.info("Created %s", workfile)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,133 @@
+"""Unique names of clips in Mocha Pro project.
+
+Note:
+    This module must not import `mocha` or anything that does.
+
+"""
+from __future__ import annotations
+
+import re
+from typing import Any, Callable, Iterable, Optional
+
+CLIP_NAME_PATTERN = re.compile(r"^(?P<base>.+)_(?P<index>\d+)$")
+
+
+def get_unique_clip_name(name: str, clip_names: Iterable[str]) -> str:
+    """Return clip name not used in the project.
+
+    Mocha Pro allows clips with the same name, but shows just one of
+    them in the UI. Clip names are parsed in a single pass and the
+    highest numeric suffix of the name is used, so the unique name
+    isn't probed one suffix at a time. Pass the current clips of
+    the project, so clips added outside of AYON are respected too.
+
+    Args:
+        name (str): Requested clip name.
+        clip_names (Iterable[str]): Names of the clips in the project.
+
+    Returns:
+        str: `name` if it isn't used, otherwise `name` with the
+            next free numeric suffix.
+
+    """
+    used = False
+    highest = 0
+    for clip_name in clip_names:
+        if clip_name == name:
+            used = True
+            continue
+        match = CLIP_NAME_PATTERN.match(clip_name)
+        if match and match["base"] == name:
+            highest = max(highest, int(match["index"]))
+    if not used:
+        return name
+    return f"{name}_{highest + 1}"
+
+
+class ClipNameAllocator:
+    """Allocate unique clip names without rescanning the project.
+
+    Clip names of the project are scanned once, allocated names are
+    added to the scanned ones. The project is scanned again only if
+    the requested name collides with a known name, so clips removed
+    outside of AYON don't get a needless suffix.
+    """
+
+    def __init__(self, get_clip_names: Callable[[], Iterable[str]]) -> None:
+        """Initialize the allocator.
+
+        Args:
+            get_clip_names (Callable[[], Iterable[str]]): Return names
+                of the clips currently in the project.
+
+        """
+        self._get_clip_names = get_clip_names
+        self._names: Optional[set[str]] = None
+        self._highest: dict[str, int] = {}
+
+    def rescan(self) -> None:
+        """Scan clip names of the project again."""
+        self._names = set()
+        self._highest = {}
+        for clip_name in self._get_clip_names():
+            self._add(clip_name)
+
+    def allocate(self, name: str) -> str:
+        """Return unique clip name and reserve it.
+
+        Args:
+            name (str): Requested clip name.
+
+        Returns:
+            str: `name` if it isn't used, otherwise `name` with the
+                next free numeric suffix.
+
+        """
+        if self._names is None or name in self._names:
+            self.rescan()
+        if name in self._names:
+            name = f"{name}_{self._highest.get(name, 0) + 1}"
+        self._add(name)
+        return name
+
+    def _add(self, clip_name: str) -> None:
+        """Add clip name to the known names."""
+        self._names.add(clip_name)
+        match = CLIP_NAME_PATTERN.match(clip_name)
+        if match:
+            base = match["base"]
+            self._highest[base] = max(
+                self._highest.get(base, 0), int(match["index"]))
+
+
+_ALLOCATOR_CACHE: Optional[tuple[Any, ClipNameAllocator]] = None
+
+
+def get_clip_name_allocator(project: Any) -> ClipNameAllocator:  # noqa: ANN401
+    """Return clip name allocator of the project.
+
+    Allocator is cached for the live project object, so a batch of
+    loads scans the clip names only once. Opening another project
+    replaces the cached allocator.
+
+    Args:
+        project (Any): Mocha Pro project.
+
+    Returns:
+        ClipNameAllocator: Allocator of the project.
+
+    """
+    global _ALLOCATOR_CACHE  # noqa: PLW0603
+    if _ALLOCATOR_CACHE is None or _ALLOCATOR_CACHE[0] is not project:
+        _ALLOCATOR_CACHE = (project, ClipNameAllocator(project.get_clips))
+    return _ALLOCATOR_CACHE[1]
+
+
+def invalidate_clip_name_allocator() -> None:
+    """Drop cached clip name allocator.
+
+    Call this when clips are removed or renamed, the project
+    is scanned again on the next allocation.
+    """
+    global _ALLOCATOR_CACHE  # noqa: PLW0603
+    _ALLOCATOR_CACHE = None
@@ -0,0 +1,70 @@
+"""Cache of AYON entities of the current context.
+
+Fetching entities from AYON server blocks the UI thread, so entities
+of the current context are kept for a while. Cached value is used
+only for the same context key and until it expires or the cache is
+invalidated (like on context change).
+
+Note:
+    This module must not import `mocha` or anything that does.
+
+"""
+from __future__ import annotations
+
+import threading
+import time
+from typing import Any, Callable, Hashable, Optional
+
+DEFAULT_TTL = 60.0
+
+
+class ContextCache:
+    """Cache of values per context key with time to live."""
+
+    def __init__(
+            self,
+            ttl: float = DEFAULT_TTL,
+            clock: Callable[[], float] = time.monotonic) -> None:
+        """Initialize the cache.
+
+        Args:
+            ttl (float): Time in seconds the value is valid.
+            clock (Callable[[], float]): Function returning current time.
+
+        """
+        self.ttl = ttl
+        self._clock = clock
+        self._key: Optional[Hashable] = None
+        self._value: Any = None
+        self._expires = 0.0
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, fetch: Callable[[], Any]) -> Any:  # noqa: ANN401
+        """Return cached value of the key or fetch a new one.
+
+        Only the value of the last key is kept.
+
+        Args:
+            key (Hashable): Context key.
+            fetch (Callable[[], Any]): Function returning the value.
+
+        Returns:
+            Any: Value of the key.
+
+        """
+        with self._lock:
+            if key == self._key and self._clock() < self._expires:
+                return self._value
+        value = fetch()
+        with self._lock:
+            self._key = key
+            self._value = value
+            self._expires = self._clock() + self.ttl
+        return value
+
+    def invalidate(self) -> None:
+        """Drop the cached value."""
+        with self._lock:
+            self._key = None
+            self._value = None
+            self._expires = 0.0
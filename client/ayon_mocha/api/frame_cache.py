@@ -0,0 +1,233 @@
+"""Local cache of published frames.
+
+Frames of clips loaded from network storage can be copied to local
+disk, so scrubbing and tracking doesn't read them over the network.
+Each source directory gets its own cache directory, so the cached
+sequence can be linked to the clip the same way as the original one.
+
+Cache size is bounded, least recently used files are evicted first.
+Eviction runs before every chunk of copied files, so a large batch
+doesn't overfill the disk before it finishes.
+Use of the cached file is recorded by its access time. Modification
+time of the cached file is kept the same as of the source, so a source
+file changed in place is copied again.
+
+Note:
+    This module must not import `mocha` or anything that does.
+
+"""
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import shutil
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Iterable, Optional
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+log = logging.getLogger("ayon_mocha.frame_cache")
+
+GIGABYTE = 1024 ** 3
+DEFAULT_MAX_SIZE = 50 * GIGABYTE
+DEFAULT_MAX_WORKERS = 8
+DEFAULT_EVICT_INTERVAL = 64
+
+
+class FrameCache:
+    """Size bounded local cache of frame files."""
+
+    def __init__(
+            self,
+            root: Path,
+            max_size: int = DEFAULT_MAX_SIZE,
+            max_workers: int = DEFAULT_MAX_WORKERS,
+            evict_interval: int = DEFAULT_EVICT_INTERVAL) -> None:
+        """Initialize the cache.
+
+        Args:
+            root (Path): Cache directory.
+            max_size (int): Maximum size of the cache in bytes.
+            max_workers (int): Number of parallel copies.
+            evict_interval (int): Number of files copied between
+                evictions.
+
+        """
+        self.root = root
+        self.max_size = max_size
+        self.max_workers = max_workers
+        self.evict_interval = max(1, evict_interval)
+
+    def get_cached_path(self, source: Path) -> Path:
+        """Return path of the cached copy of the file.
+
+        Args:
+            source (Path): Path to the source file.
+
+        Returns:
+            Path: Path in the cache, the file may not exist.
+
+        """
+        key = hashlib.sha1(  # noqa: S324
+            source.parent.as_posix().encode("utf-8")).hexdigest()[:16]
+        return self.root / key / source.name
+
+    def is_cached(self, sources: Iterable[Path]) -> bool:
+        """Whether all the files are in the cache and up to date.
+
+        Returns:
+            bool: True if all the files are cached.
+
+        """
+        try:
+            return all(
+                self._is_valid(source.stat(), self.get_cached_path(source))
+                for source in sources)
+        except OSError:
+            return False
+
+    @staticmethod
+    def _is_valid(source_stat: os.stat_result, target: Path) -> bool:
+        """Whether the cached file matches the source file.
+
+        Args:
+            source_stat (os.stat_result): Status of the source file.
+            target (Path): Cached file.
+
+        Returns:
+            bool: True if size and modification time of the files match.
+
+        """
+        try:
+            target_stat = target.stat()
+        except OSError:
+            return False
+        return (
+            target_stat.st_size == source_stat.st_size
+            and target_stat.st_mtime_ns == source_stat.st_mtime_ns
+        )
+
+    def cache_files(self, sources: Iterable[Path]) -> list[Path]:
+        """Copy files to the cache.
+
+        Files are copied in parallel in the given order (like
+        tracking order of the frames). Already cached files are only
+        marked as used. Files are copied in chunks of
+        `evict_interval`, before each chunk older files are evicted
+        to make room for it. Files of this batch are never evicted.
+
+        Args:
+            sources (Iterable[Path]): Files to cache.
+
+        Returns:
+            list[Path]: Cached files in the order of sources.
+
+        """
+        sources = list(sources)
+        protected = {self.get_cached_path(source) for source in sources}
+        cached: list[Path] = []
+        with ThreadPoolExecutor(
+                max_workers=self.max_workers,
+                thread_name_prefix="ayon_mocha_frame_cache") as executor:
+            for start in range(0, len(sources), self.evict_interval):
+                chunk = sources[start:start + self.evict_interval]
+                self.evict(
+                    protected=protected,
+                    reserve=sum(source.stat().st_size for source in chunk))
+                cached.extend(executor.map(self._cache_file, chunk))
+        self.evict(protected=protected)
+        return cached
+
+    def _cache_file(self, source: Path) -> Path:
+        """Copy file to the cache if needed.
+
+        Returns:
+            Path: Cached file.
+
+        """
+        target = self.get_cached_path(source)
+        source_stat = source.stat()
+        if not self._is_valid(source_stat, target):
+            target.parent.mkdir(parents=True, exist_ok=True)
+            # copy to temporary file first so incomplete copy
+            # is never considered cached
+            temp_target = target.with_name(
+                f".{target.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+            try:
+                shutil.copyfile(source, temp_target)
+                os.replace(temp_target, target)
+            except Exception:
+                try:
+                    temp_target.unlink(missing_ok=True)
+                except OSError:
+                    log.debug(
+                        "Failed to remove %s", temp_target, exc_info=True)
+                raise
+        os.utime(target, ns=(time.time_ns(), source_stat.st_mtime_ns))
+        return target
+
+    def get_size(self) -> int:
+        """Return size of all cached files.
+
+        Returns:
+            int: Size in bytes.
+
+        """
+        return sum(entry.stat().st_size for entry in self._iter_files())
+
+    def evict(
+            self,
+            protected: Optional[set[Path]] = None,
+            reserve: int = 0) -> list[Path]:
+        """Remove least recently used files over the cache size.
+
+        Args:
+            protected (Optional[set[Path]]): Files that must be kept.
+            reserve (int): Size in bytes to keep free for files
+                about to be cached.
+
+        Returns:
+            list[Path]: Removed files.
+
+        """
+        protected = protected or set()
+        entries = [
+            (entry, entry.stat())
+            for entry in self._iter_files()
+        ]
+        size = sum(stat.st_size for _, stat in entries)
+        removed: list[Path] = []
+        for entry, stat in sorted(entries, key=lambda item: item[1].st_atime):
+            if size + reserve <= self.max_size:
+                break
+            if entry in protected:
+                continue
+            try:
+                entry.unlink()
+            except OSError:
+                log.debug("Failed to evict %s", entry, exc_info=True)
+                continue
+            size -= stat.st_size
+            removed.append(entry)
+        log.debug("Evicted %d files from frame cache", len(removed))
+        return removed
+
+    def _iter_files(self) -> Iterable[Path]:
+        """Iterate over cached files.
+
+        Yields:
+            Path: Cached file.
+
+        """
+        if not self.root.is_dir():
+            return
+        for dir_path in self.root.iterdir():
+            if not dir_path.is_dir():
+                continue
+            for entry in dir_path.iterdir():
+                if entry.is_file() and not entry.name.startswith("."):
+                    yield entry
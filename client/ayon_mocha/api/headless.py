@@ -0,0 +1,225 @@
+"""Headless publishing of Mocha Pro workfiles.
+
+Workfiles are published by Mocha Pro's bundled Python interpreter,
+no UI is needed. Each workfile is published in its own process
+running this module::
+
+    <mocha python> -m ayon_mocha.api.headless <workfile>
+
+`run_batch_publish` starts these processes for many workfiles
+concurrently and sets AYON context for each of them from metadata
+stored in the workfile.
+
+Note:
+    Only `publish_workfile` needs `mocha`, it is imported there so
+    the rest can be used from AYON launcher.
+
+"""
+from __future__ import annotations
+
+import dataclasses
+import logging
+import os
+import platform
+import subprocess
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Iterable, Optional
+
+from .project_reader import read_workfile_metadata
+
+log = logging.getLogger("ayon_mocha.headless")
+HEADLESS_MODULE = "ayon_mocha.api.headless"
+
+
+@dataclasses.dataclass
+class BatchPublishResult:
+    """Result of a headless publish of one workfile."""
+    workfile: Path
+    returncode: int
+    output: str
+
+    @property
+    def success(self) -> bool:
+        """Whether the workfile was published."""
+        return self.returncode == 0
+
+
+def get_mocha_python_paths(mocha_executable_path: Path) -> tuple[Path, Path]:
+    """Return paths to Mocha Pro python and its export script.
+
+    Args:
+        mocha_executable_path (Path): Path to Mocha Pro executable.
+
+    Returns:
+        tuple[Path, Path]: Python executable and `mochaexport.py` paths.
+
+    Raises:
+        NotImplementedError: If the platform is not supported.
+
+    """
+    mocha_install_dir = mocha_executable_path.parent.parent
+
+    if platform.system().lower() == "windows":
+        mocha_python_path = (
+            mocha_install_dir / "python" / "python.exe")
+        mocha_exporter_path = (
+            mocha_install_dir / "python" / "mochaexport.py")
+    elif platform.system().lower() == "darwin":
+        mocha_python_path = (
+            mocha_install_dir / "python3")
+        mocha_exporter_path = (
+            mocha_install_dir / "mochaexport.py")
+    elif platform.system().lower() == "linux":
+        mocha_python_path = (
+            mocha_install_dir / "python" / "bin" / "python3")
+        mocha_exporter_path = (
+            mocha_install_dir / "python" / "mochaexport.py")
+    else:
+        msg = f"Unsupported platform: {platform.system()}"
+        raise NotImplementedError(msg)
+    return mocha_python_path, mocha_exporter_path
+
+
+def publish_workfile(workfile: Path) -> bool:
+    """Publish workfile using its stored publish instances.
+
+    This must run in Mocha Pro python.
+
+    Args:
+        workfile (Path): Path to the workfile.
+
+    Returns:
+        bool: True if publishing succeeded.
+
+    """
+    import pyblish.api
+    import pyblish.util
+    from ayon_core.pipeline import install_host
+    from ayon_core.pipeline.create import CreateContext
+    from mocha.project import Project
+
+    from .pipeline import HeadlessMochaProHost
+
+    project = Project(workfile.as_posix())
+    host = HeadlessMochaProHost(project)
+    install_host(host)
+
+    create_context = CreateContext(host, headless=True)
+    pyblish_context = pyblish.api.Context()
+    pyblish_context.data["create_context"] = create_context
+
+    error_format = "Failed {plugin.__name__}: {error} -- {error.traceback}"
+    success = True
+    for result in pyblish.util.publish_iter(
+            pyblish_context, create_context.publish_plugins):
+        if result["error"]:
+            log.error(error_format.format(**result))
+            success = False
+    return success
+
+
+def _get_workfile_env(
+        workfile: Path, env: Optional[dict[str, str]] = None) -> dict:
+    """Return environment for publishing the workfile.
+
+    Args:
+        workfile (Path): Path to the workfile.
+        env (Optional[dict[str, str]]): Base environment.
+
+    Returns:
+        dict: Environment with AYON context of the workfile.
+
+    """
+    workfile_env = dict(os.environ if env is None else env)
+    workfile_env["PYTHONPATH"] = os.pathsep.join(sys.path)
+    metadata = read_workfile_metadata(workfile)
+    if metadata.folder_path:
+        workfile_env["AYON_FOLDER_PATH"] = metadata.folder_path
+    if metadata.task_name:
+        workfile_env["AYON_TASK_NAME"] = metadata.task_name
+    return workfile_env
+
+
+def run_headless_publish(
+        workfile: Path,
+        mocha_python_path: Path,
+        env: Optional[dict[str, str]] = None) -> BatchPublishResult:
+    """Publish workfile in a new Mocha Pro python process.
+
+    Args:
+        workfile (Path): Path to the workfile.
+        mocha_python_path (Path): Path to Mocha Pro python.
+        env (Optional[dict[str, str]]): Base environment.
+
+    Returns:
+        BatchPublishResult: Result of the publishing.
+
+    """
+    args = [
+        mocha_python_path.as_posix(),
+        "-m", HEADLESS_MODULE,
+        workfile.as_posix(),
+    ]
+    log.info("Publishing %s", workfile)
+    process = subprocess.run(
+        args,
+        env=_get_workfile_env(workfile, env),
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        check=False,
+    )
+    return BatchPublishResult(
+        workfile=workfile,
+        returncode=process.returncode,
+        output=process.stdout.decode("utf-8", errors="replace"),
+    )
+
+
+def run_batch_publish(
+        workfiles: Iterable[Path],
+        mocha_python_path: Path,
+        max_workers: Optional[int] = None,
+        env: Optional[dict[str, str]] = None) -> list[BatchPublishResult]:
+    """Publish workfiles concurrently.
+
+    Every workfile is published in its own Mocha Pro python process.
+
+    Args:
+        workfiles (Iterable[Path]): Paths to the workfiles.
+        mocha_python_path (Path): Path to Mocha Pro python.
+        max_workers (Optional[int]): Maximum of concurrent publishes.
+            Defaults to number of CPUs.
+        env (Optional[dict[str, str]]): Base environment.
+
+    Returns:
+        list[BatchPublishResult]: Results in the order of workfiles.
+
+    """
+    workers = max_workers or os.cpu_count() or 1
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(
+            lambda workfile: run_headless_publish(
+                workfile, mocha_python_path, env),
+            workfiles,
+        ))
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    """Publish workfile passed as an argument.
+
+    Returns:
+        int: Exit code.
+
+    """
+    args = sys.argv[1:] if argv is None else argv
+    if len(args) != 1:
+        log.error("Usage: python -m %s <workfile>", HEADLESS_MODULE)
+        return 2
+    logging.basicConfig(level=logging.INFO)
+    return 0 if publish_workfile(Path(args[0])) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,181 @@
+"""Reduce sampled curves to keyframes.
+
+Tracking is sampled on every frame, but most of the curves can be
+represented by far fewer linearly interpolated keyframes. Keyframes
+are selected by Ramer-Douglas-Peucker algorithm, where the error of
+the sample is its distance from the value interpolated in time between
+the keyframes. All curves of the data share the same keyframes.
+
+Note:
+    This module must not import `mocha` or anything that does.
+
+"""
+from __future__ import annotations
+
+import dataclasses
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from .track_data import TrackData
+
+# first and last frame are always keyframes
+MIN_KEYFRAMES = 2
+
+
+@dataclasses.dataclass(frozen=True)
+class KeyframeReport:
+    """Result of the keyframe reduction.
+
+    Attributes:
+        sample_count (int): Number of the samples.
+        keyframe_count (int): Number of the kept keyframes.
+        max_error (float): Maximal difference of the interpolated
+            curves from the samples.
+
+    """
+    sample_count: int
+    keyframe_count: int
+    max_error: float
+
+    @property
+    def compression_ratio(self) -> float:
+        """Ratio of the samples to the keyframes."""
+        return self.sample_count / max(1, self.keyframe_count)
+
+    def to_dict(self) -> dict[str, float]:
+        """Return the report as serializable data.
+
+        Returns:
+            dict[str, float]: Report values with the compression ratio.
+
+        """
+        return {
+            **dataclasses.asdict(self),
+            "compression_ratio": self.compression_ratio,
+        }
+
+
+def _get_segment_errors(
+        frames: np.ndarray,
+        values: np.ndarray,
+        start: int,
+        end: int) -> np.ndarray:
+    """Return errors of the samples between two keyframes.
+
+    Returns:
+        np.ndarray: Maximal error over all curves for every sample
+            between the keyframes.
+
+    """
+    weights = (
+        (frames[start + 1:end] - frames[start])
+        / (frames[end] - frames[start])
+    )[:, np.newaxis]
+    interpolated = values[start] + weights * (values[end] - values[start])
+    return np.abs(values[start + 1:end] - interpolated).max(axis=1)
+
+
+def simplify_keyframes(
+        frames: np.ndarray,
+        values: np.ndarray,
+        tolerance: float) -> np.ndarray:
+    """Return indices of the keyframes needed to keep the tolerance.
+
+    Args:
+        frames (np.ndarray): Increasing frame numbers, shape (N,).
+        values (np.ndarray): Values of the curves, first axis
+            is the frame.
+        tolerance (float): Maximal allowed error.
+
+    Returns:
+        np.ndarray: Sorted indices of the keyframes, first and last
+            frames are always kept.
+
+    """
+    count = len(frames)
+    if count <= MIN_KEYFRAMES:
+        return np.arange(count)
+
+    frames = np.asarray(frames, dtype=np.float64)
+    values = np.asarray(values, dtype=np.float64).reshape(count, -1)
+    keep = np.zeros(count, dtype=bool)
+    keep[[0, -1]] = True
+    segments = [(0, count - 1)]
+    while segments:
+        start, end = segments.pop()
+        if end - start < MIN_KEYFRAMES:
+            continue
+        errors = _get_segment_errors(frames, values, start, end)
+        index = int(np.argmax(errors))
+        if errors[index] > tolerance:
+            split = start + 1 + index
+            keep[split] = True
+            segments.extend(((start, split), (split, end)))
+    return np.flatnonzero(keep)
+
+
+def get_interpolation_error(
+        frames: np.ndarray,
+        values: np.ndarray,
+        keyframes: np.ndarray) -> float:
+    """Return maximal error of curves interpolated between keyframes.
+
+    Args:
+        frames (np.ndarray): Frame numbers, shape (N,).
+        values (np.ndarray): Values of the curves, first axis
+            is the frame.
+        keyframes (np.ndarray): Indices of the keyframes.
+
+    Returns:
+        float: Maximal error over all frames and curves.
+
+    """
+    if len(frames) < MIN_KEYFRAMES:
+        return 0.0
+    frames = np.asarray(frames, dtype=np.float64)
+    values = np.asarray(values, dtype=np.float64).reshape(len(frames), -1)
+    key_frames = frames[keyframes]
+    segment = np.clip(
+        np.searchsorted(key_frames, frames, side="right") - 1,
+        0, len(keyframes) - 2)
+    start = keyframes[segment]
+    end = keyframes[segment + 1]
+    weights = ((frames - frames[start]) / (frames[end] - frames[start]))
+    interpolated = values[start] + weights[:, np.newaxis] * (
+        values[end] - values[start])
+    return float(np.abs(values - interpolated).max())
+
+
+def simplify_track_data(
+        track_data: TrackData,
+        tolerance: float) -> tuple[TrackData, KeyframeReport]:
+    """Return track data reduced to keyframes.
+
+    Keyframes are selected by the surface corners, which are the data
+    written by the track writers.
+
+    Args:
+        track_data (TrackData): Data sampled on every frame.
+        tolerance (float): Maximal allowed error in pixels.
+
+    Returns:
+        tuple[TrackData, KeyframeReport]: Reduced data and the report.
+
+    """
+    keyframes = simplify_keyframes(
+        track_data.frames, track_data.surface, tolerance)
+    report = KeyframeReport(
+        sample_count=len(track_data),
+        keyframe_count=len(keyframes),
+        max_error=get_interpolation_error(
+            track_data.frames, track_data.surface, keyframes),
+    )
+    simplified = dataclasses.replace(
+        track_data,
+        frames=track_data.frames[keyframes],
+        transform=track_data.transform[keyframes],
+        surface=track_data.surface[keyframes],
+    )
+    return simplified, report
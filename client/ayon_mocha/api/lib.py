@@ -2,6 +2,8 @@
 from __future__ import annotations
 
 import dataclasses
+import logging
+import os
 import re
 import subprocess
 import sys
@@ -13,19 +15,31 @@ from typing import TYPE_CHECKING, Any, Optional, Union
 
 from ayon_core.lib.transcoding import get_oiio_info_for_input
 from mocha import REGISTRY_APPLICATION_NAME, ui
-from mocha.exporters import ShapeDataExporter, TrackingDataExporter
+from mocha.exporters import (
+    CameraSolveExporter,
+    ShapeDataExporter,
+    TrackingDataExporter,
+)
 from mocha.project import Clip, Project
 from qtpy.QtWidgets import QApplication
 
 from ayon_mocha.addon import MOCHA_ADDON_ROOT
+from ayon_mocha.version import __version__
 
+from .frame_cache import DEFAULT_MAX_SIZE, GIGABYTE, FrameCache
 from .mocha_exporter_mappings import EXPORTER_MAPPING
+from .solve_cache import SolveCache
 
 if TYPE_CHECKING:
     from qtpy import QtWidgets
 
+    from .track_data import TrackData
+
 
 EXTENSION_PATTERN = re.compile(r"(?P<name>.+)\(\*\.(?P<ext>\w+)\)")
+NON_WORD_PATTERN = re.compile(r"\W+")
+
+log = logging.getLogger("ayon_mocha.lib")
 
 """
 These dataclasses are here because they
@@ -42,7 +56,8 @@ class ExporterInfo:
     """Exporter information."""
     id: str
     label: str
-    exporter: Union[TrackingDataExporter, ShapeDataExporter]
+    exporter: Union[
+        TrackingDataExporter, ShapeDataExporter, CameraSolveExporter]
     short_name: str
 
 
@@ -54,6 +69,8 @@ class ExporterProcessInfo:
     current_project_path: Path
     staging_dir: Path
     options: dict[str, bool]
+    track_data: Optional[TrackData] = None
+    proxy_scale: float = 1.0
 
 
 def get_mocha_exec_name(_: str) -> str:
@@ -80,11 +97,6 @@ def get_main_window() -> QtWidgets.QWidget:
     return ui.get_widgets()["MainWindow"]
 
 
-def update_ui() -> None:
-    """Update the UI."""
-    QApplication.processEvents()
-
-
 def run_mocha(
         app: str = "mochapro",
         footage_path: str = "",
@@ -206,6 +218,123 @@ def create_empty_project(
     return Project(clip)
 
 
+def get_cache_dir(*subdirs: str) -> Path:
+    """Return local cache directory of the addon.
+
+    The root of the cache can be set by `AYON_MOCHA_CACHE_DIR`
+    environment variable, otherwise it is placed in the temp directory.
+
+    Args:
+        *subdirs (str): Subdirectories to append to the cache root.
+
+    Returns:
+        Path: Existing cache directory.
+
+    """
+    root = os.getenv("AYON_MOCHA_CACHE_DIR") or (
+        Path(tempfile.gettempdir()) / "ayon_mocha")
+    cache_dir = Path(root, *subdirs)
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    return cache_dir
+
+
+def get_frame_cache() -> FrameCache:
+    """Return local cache of published frames.
+
+    Size of the cache in gigabytes can be set by
+    `AYON_MOCHA_FRAME_CACHE_SIZE` environment variable.
+
+    Returns:
+        FrameCache: Frame cache.
+
+    """
+    max_size = DEFAULT_MAX_SIZE
+    env_size = os.getenv("AYON_MOCHA_FRAME_CACHE_SIZE")
+    if env_size:
+        try:
+            max_size = int(float(env_size) * GIGABYTE)
+        except ValueError:
+            log.warning("Invalid frame cache size: %s", env_size)
+    return FrameCache(get_cache_dir("frames"), max_size=max_size)
+
+
+def get_solve_cache() -> SolveCache:
+    """Return local cache of camera solve exports.
+
+    Returns:
+        SolveCache: Camera solve cache.
+
+    """
+    return SolveCache(get_cache_dir("camera_solves"))
+
+
+def get_workfile_template() -> Path:
+    """Return the cached template workfile.
+
+    Template is an empty project with the placeholder clip already
+    linked to it. It is created only once per addon and Mocha version
+    and then reused, so bootstrapping new workfiles is just a file copy.
+
+    Returns:
+        Path: Path to the template workfile.
+
+    """
+    template_dir = get_cache_dir(
+        "templates", __version__, get_mocha_version() or "unknown")
+    template_path = template_dir / "empty.mocha"
+    if template_path.is_file() and (template_dir / "empty.exr").is_file():
+        return template_path
+
+    project = create_empty_project(template_path)
+    project.save_as(template_path.as_posix())
+    return template_path
+
+
+def create_workfile_from_template(destination: Path) -> Path:
+    """Create new workfile from the cached template.
+
+    Template is copied to the destination and opened without UI.
+    Its clips are relinked to the placeholder clip copied beside the
+    new workfile, so the workfile doesn't depend on the template cache.
+    Current project of Mocha Pro is not changed.
+
+    Args:
+        destination (Path): Path of the new workfile.
+
+    Returns:
+        Path: Path to the created workfile.
+
+    Raises:
+        RuntimeError: If the template has no clip to relink.
+
+    """
+    destination.parent.mkdir(parents=True, exist_ok=True)
+    template_path = get_workfile_template()
+    copyfile(template_path, destination)
+    clip_path = copy_placeholder_clip(destination.parent)
+
+    project = Project(destination.as_posix())
+    clips = list(project.get_clips().values())
+    if not clips:
+        destination.unlink()
+        msg = f"Workfile template {template_path} has no clip to relink."
+        raise RuntimeError(msg)
+    for clip in clips:
+        clip.relink(clip_path.as_posix())
+    project.save()
+    return destination
+
+
+def is_interactive() -> bool:
+    """Return whether Mocha Pro runs with UI.
+
+    Returns:
+        bool: True if there is a widget application.
+
+    """
+    return isinstance(QApplication.instance(), QApplication)
+
+
 def get_tracking_exporters() -> list[ExporterInfo]:
     """Return all registered exporters as a list."""
     version = get_mocha_version() or "2024"
@@ -258,6 +387,41 @@ def sanitize_unknown_exporter_name(name: str) -> str:
     return re.sub(r"[^a-zA-Z0-9]", "_", name)
 
 
+def get_camera_solve_exporters() -> list[ExporterInfo]:
+    """Return all registered camera solve exporters as a list.
+
+    Exporters missing in the mapping get short name made of the word
+    characters of their label.
+    """
+    version = get_mocha_version() or "2024"
+    try:
+        mapping = EXPORTER_MAPPING["camera"][version]
+    except KeyError:
+        mapping = EXPORTER_MAPPING["camera"]["2024.5"]
+
+    return [
+        ExporterInfo(
+            id=sha256(k.encode()).hexdigest(),
+            label=k,
+            exporter=v,
+            short_name=mapping.get(k) or NON_WORD_PATTERN.sub("", k),
+        )
+        for k, v in sorted(
+            CameraSolveExporter.registered_exporters().items())
+    ]
+
+
+def write_exported_files(result: dict[str, bytes]) -> None:
+    """Write files returned by Mocha Pro exporter.
+
+    Args:
+        result (dict[str, bytes]): File paths and their content.
+
+    """
+    for file_path, content in result.items():
+        Path(file_path).write_bytes(content)
+
+
 def get_mocha_version() -> Optional[str]:
     """Return Mocha version."""
     app_name = REGISTRY_APPLICATION_NAME
@@ -0,0 +1,295 @@
+"""Render mattes of layers in parallel headless processes.
+
+Frame range of the render is split to chunks and every chunk is
+rendered by `Project.export_rendered_shapes` in its own Mocha Pro
+python process running this module::
+
+    <mocha python> -m ayon_mocha.api.matte_render <arguments>
+
+All chunks render to the same directory with the same file naming,
+so together they make one image sequence.
+
+Note:
+    Only `render_matte_chunk` needs `mocha`, it is imported there so
+    the rest can be used from the host and AYON launcher.
+
+"""
+from __future__ import annotations
+
+import argparse
+import dataclasses
+import logging
+import os
+import subprocess
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Optional
+
+log = logging.getLogger("ayon_mocha.matte_render")
+MATTE_RENDER_MODULE = "ayon_mocha.api.matte_render"
+MATTE_EXTENSIONS = ("png", "tif", "exr", "dpx")
+
+
+@dataclasses.dataclass
+class MatteRenderJob:
+    """Matte render of layers of the workfile.
+
+    Attributes:
+        workfile (Path): Saved workfile to render.
+        layer_names (list[str]): Names of the rendered layers.
+        output_dir (Path): Directory of the rendered images.
+        prefix (str): File name prefix of the images.
+        extension (str): Image format extension.
+        index_width (int): Padding of the frame numbers.
+        colorize (bool): Render layers in their colors instead
+            of a single channel matte.
+
+    """
+    workfile: Path
+    layer_names: list[str]
+    output_dir: Path
+    prefix: str
+    extension: str = "png"
+    index_width: int = 4
+    colorize: bool = False
+
+    def get_file_name(self, index: int) -> str:
+        """Return file name of the rendered frame.
+
+        Args:
+            index (int): Frame number of the image.
+
+        Returns:
+            str: File name.
+
+        """
+        return f"{self.prefix}{index:0{self.index_width}d}.{self.extension}"
+
+
+@dataclasses.dataclass
+class MatteRenderResult:
+    """Result of rendering one chunk."""
+    start: int
+    end: int
+    returncode: int
+    output: str
+
+    @property
+    def success(self) -> bool:
+        """Whether the chunk was rendered."""
+        return self.returncode == 0
+
+
+def split_frame_range(
+        start: int, end: int, chunk_count: int) -> list[tuple[int, int]]:
+    """Split inclusive frame range to chunks of similar size.
+
+    Args:
+        start (int): First frame.
+        end (int): Last frame.
+        chunk_count (int): Maximal number of chunks.
+
+    Returns:
+        list[tuple[int, int]]: First and last frame of every chunk.
+
+    """
+    frame_count = end - start + 1
+    if frame_count <= 0:
+        return []
+    chunk_count = max(1, min(chunk_count, frame_count))
+    size, remainder = divmod(frame_count, chunk_count)
+    chunks = []
+    chunk_start = start
+    for index in range(chunk_count):
+        chunk_end = chunk_start + size - 1 + (1 if index < remainder else 0)
+        chunks.append((chunk_start, chunk_end))
+        chunk_start = chunk_end + 1
+    return chunks
+
+
+def get_chunk_args(
+        job: MatteRenderJob, start: int, end: int,
+        frame_offset: int) -> list[str]:
+    """Return command line arguments of the chunk render.
+
+    Args:
+        job (MatteRenderJob): Render job.
+        start (int): First project time of the chunk.
+        end (int): Last project time of the chunk.
+        frame_offset (int): Offset of frame numbers to project times.
+
+    Returns:
+        list[str]: Arguments for this module.
+
+    """
+    args = [
+        job.workfile.as_posix(),
+        "--output-dir", job.output_dir.as_posix(),
+        "--prefix", job.prefix,
+        "--extension", job.extension,
+        "--index-width", str(job.index_width),
+        "--index-start", str(start + frame_offset),
+        "--start", str(start),
+        "--end", str(end),
+    ]
+    if job.colorize:
+        args.append("--colorize")
+    return [*args, "--", *job.layer_names]
+
+
+def render_matte_chunk(
+        job: MatteRenderJob, start: int, end: int, index_start: int) -> None:
+    """Render the chunk of the matte.
+
+    This must run in Mocha Pro python.
+
+    Args:
+        job (MatteRenderJob): Render job.
+        start (int): First project time to render.
+        end (int): Last project time to render.
+        index_start (int): Frame number of the first image.
+
+    Raises:
+        ValueError: If some of the layers do not exist.
+        RuntimeError: If some of the images were not rendered.
+
+    """
+    from mocha.project import Project, View
+
+    project = Project(job.workfile.as_posix())
+    layers_by_name = {layer.name: layer for layer in project.layers}
+    missing = set(job.layer_names) - set(layers_by_name)
+    if missing:
+        msg = f"Layers not found: {', '.join(sorted(missing))}"
+        raise ValueError(msg)
+
+    job.output_dir.mkdir(parents=True, exist_ok=True)
+    project.export_rendered_shapes(
+        [layers_by_name[name] for name in job.layer_names],
+        job.colorize,
+        job.output_dir.as_posix(),
+        f".{job.extension}",
+        job.prefix,
+        "",
+        index_start,
+        job.index_width,
+        start,
+        end,
+        View(0),
+    )
+
+    missing_files = [
+        file_name
+        for file_name in (
+            job.get_file_name(index_start + index)
+            for index in range(end - start + 1)
+        )
+        if not (job.output_dir / file_name).exists()
+    ]
+    if missing_files:
+        msg = f"Frames were not rendered: {', '.join(missing_files)}"
+        raise RuntimeError(msg)
+
+
+def run_matte_render(
+        job: MatteRenderJob,
+        mocha_python_path: Path,
+        frame_range: tuple[int, int],
+        frame_offset: int = 0,
+        workers: Optional[int] = None) -> list[MatteRenderResult]:
+    """Render the job in parallel Mocha Pro python processes.
+
+    Args:
+        job (MatteRenderJob): Render job.
+        mocha_python_path (Path): Path to Mocha Pro python.
+        frame_range (tuple[int, int]): First and last project time.
+        frame_offset (int): Offset of frame numbers to project times.
+        workers (Optional[int]): Number of processes. Defaults
+            to number of CPUs.
+
+    Returns:
+        list[MatteRenderResult]: Results of the chunks in frame order.
+
+    """
+    workers = workers or os.cpu_count() or 1
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(sys.path)
+
+    def _render(chunk: tuple[int, int]) -> MatteRenderResult:
+        start, end = chunk
+        args = [
+            mocha_python_path.as_posix(),
+            "-m", MATTE_RENDER_MODULE,
+            *get_chunk_args(job, start, end, frame_offset),
+        ]
+        log.info("Rendering frames %d-%d of %s", start, end, job.prefix)
+        process = subprocess.run(
+            args,
+            env=env,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            check=False,
+        )
+        return MatteRenderResult(
+            start=start,
+            end=end,
+            returncode=process.returncode,
+            output=process.stdout.decode("utf-8", errors="replace"),
+        )
+
+    chunks = split_frame_range(*frame_range, workers)
+    with ThreadPoolExecutor(max_workers=max(1, len(chunks))) as executor:
+        return list(executor.map(_render, chunks))
+
+
+def parse_args(argv: list[str]) -> argparse.Namespace:
+    """Parse arguments of the chunk render.
+
+    Returns:
+        argparse.Namespace: Parsed arguments.
+
+    """
+    parser = argparse.ArgumentParser(prog=f"python -m {MATTE_RENDER_MODULE}")
+    parser.add_argument("workfile", type=Path)
+    parser.add_argument("--output-dir", type=Path, required=True)
+    parser.add_argument("--prefix", required=True)
+    parser.add_argument(
+        "--extension", choices=MATTE_EXTENSIONS, default="png")
+    parser.add_argument("--index-width", type=int, default=4)
+    parser.add_argument("--index-start", type=int, required=True)
+    parser.add_argument("--start", type=int, required=True)
+    parser.add_argument("--end", type=int, required=True)
+    parser.add_argument("--colorize", action="store_true")
+    parser.add_argument("layers", nargs="+")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    """Render chunk of the matte passed as arguments.
+
+    Returns:
+        int: Exit code.
+
+    """
+    args = parse_args(sys.argv[1:] if argv is None else argv)
+    logging.basicConfig(level=logging.INFO)
+    job = MatteRenderJob(
+        workfile=args.workfile,
+        layer_names=args.layers,
+        output_dir=args.output_dir,
+        prefix=args.prefix,
+        extension=args.extension,
+        index_width=args.index_width,
+        colorize=args.colorize,
+    )
+    try:
+        render_matte_chunk(job, args.start, args.end, args.index_start)
+    except (ValueError, RuntimeError):
+        log.exception("Matte render failed")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,206 @@
+"""Sampled mesh vertex tracks of layers.
+
+Tracked positions of all mesh vertices over all frames are stored
+in one array of shape (frames, vertices, 2). Meshes can have thousands
+of vertices tracked over thousands of frames, so the layer is sampled
+in chunks of frames and every chunk is written to the archive before
+the next one is sampled.
+
+Sampled data are stored as uncompressed `.npz` archive, which is
+readable by `numpy.load`.
+
+Note:
+    This module must not import `mocha` or anything that does, meshes
+    and their vertices are used only through their methods.
+
+"""
+from __future__ import annotations
+
+import dataclasses
+import json
+import math
+import zipfile
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Generator, Iterable, Optional, Union
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from mocha.project import Layer, MeshVertex, View
+
+MESH_DATA_VERSION = 1
+DEFAULT_CHUNK_SIZE = 64
+POSITION_DTYPE = np.dtype(np.float32)
+
+
+@dataclasses.dataclass
+class MeshData:
+    """Mesh vertex tracks of one layer.
+
+    Attributes:
+        layer_name (str): Name of the layer.
+        frames (np.ndarray): Frame numbers, shape (N,).
+        positions (np.ndarray): Tracked vertex positions in pixels,
+            shape (N, V, 2).
+
+    """
+    layer_name: str
+    frames: np.ndarray
+    positions: np.ndarray
+
+    def __len__(self) -> int:
+        """Return number of the mesh vertices.
+
+        Returns:
+            int: Number of vertices.
+
+        """
+        return self.positions.shape[1]
+
+
+def get_mesh_vertices(layer: Layer) -> list[MeshVertex]:
+    """Return mesh vertices of the layer.
+
+    Args:
+        layer (Layer): Layer with mesh.
+
+    Returns:
+        list[MeshVertex]: Vertices, empty if the layer has no mesh.
+
+    """
+    mesh = layer.get_mesh()
+    if not mesh:
+        return []
+    return list(mesh.get_vertices())
+
+
+def iter_mesh_chunks(
+        vertices: list[MeshVertex],
+        times: np.ndarray,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        view: Optional[View] = None,
+) -> Generator[np.ndarray, None, None]:
+    """Sample tracked positions of the vertices in chunks of frames.
+
+    The chunk buffer is reused, so every chunk has to be consumed
+    before the next one is requested.
+
+    Args:
+        vertices (list[MeshVertex]): Vertices to sample.
+        times (np.ndarray): Times to sample.
+        chunk_size (int): Number of frames in one chunk.
+        view (Optional[View]): View to sample.
+
+    Yields:
+        np.ndarray: Positions of the chunk, shape (n, V, 2).
+
+    """
+    buffer = np.empty(
+        (max(1, chunk_size), len(vertices), 2), dtype=POSITION_DTYPE)
+    view_args = () if view is None else (view,)
+    for start in range(0, len(times), len(buffer)):
+        chunk_times = times[start:start + len(buffer)].tolist()
+        chunk = buffer[:len(chunk_times)]
+        for index, time in enumerate(chunk_times):
+            frame_positions = chunk[index]
+            for vertex_index, vertex in enumerate(vertices):
+                frame_positions[vertex_index] = vertex.get_track_position(
+                    float(time), *view_args)
+        yield chunk
+
+
+def _write_npy(
+        archive: zipfile.ZipFile,
+        name: str,
+        shape: tuple[int, ...],
+        chunks: Iterable[np.ndarray],
+        dtype: np.dtype) -> None:
+    """Write array member of the archive from its chunks.
+
+    Args:
+        archive (zipfile.ZipFile): Opened archive.
+        name (str): Name of the array.
+        shape (tuple[int, ...]): Shape of the whole array.
+        chunks (Iterable[np.ndarray]): Consecutive parts
+            of the array along the first axis.
+        dtype (np.dtype): Data type of the array.
+
+    """
+    with archive.open(f"{name}.npy", "w", force_zip64=True) as stream:
+        np.lib.format.write_array_header_1_0(stream, {
+            "descr": np.lib.format.dtype_to_descr(dtype),
+            "fortran_order": False,
+            "shape": shape,
+        })
+        for chunk in chunks:
+            stream.write(np.ascontiguousarray(chunk, dtype=dtype).tobytes())
+
+
+def write_mesh_data(
+        layer: Layer,
+        path: Union[str, Path],
+        frame_offset: int = 0,
+        scale: float = 1.0,
+        chunk_size: int = DEFAULT_CHUNK_SIZE) -> int:
+    """Sample mesh vertex tracks of the layer directly to the archive.
+
+    Only one chunk of frames is kept in memory.
+
+    Args:
+        layer (Layer): Layer with mesh.
+        path (Union[str, Path]): Output `.npz` file path.
+        frame_offset (int): Offset of the project frames, added
+            to the sampled times to get frame numbers.
+        scale (float): Scale applied to the positions, like 2.0 for
+            layer tracked on half resolution clip.
+        chunk_size (int): Number of frames sampled at once.
+
+    Returns:
+        int: Number of written vertices.
+
+    """
+    vertices = get_mesh_vertices(layer)
+    times = np.arange(int(layer.in_point()), int(layer.out_point()) + 1)
+    metadata = {"version": MESH_DATA_VERSION, "layer": layer.name}
+    chunks = iter_mesh_chunks(vertices, times, chunk_size)
+    if not math.isclose(scale, 1.0):
+        chunks = (chunk * scale for chunk in chunks)
+
+    with zipfile.ZipFile(
+            path, "w", compression=zipfile.ZIP_STORED,
+            allowZip64=True) as archive:
+        metadata_array = np.array(json.dumps(metadata))
+        _write_npy(
+            archive, "metadata", (), [metadata_array],
+            metadata_array.dtype)
+        frames = times + frame_offset
+        _write_npy(archive, "frames", frames.shape, [frames], frames.dtype)
+        _write_npy(
+            archive,
+            "positions",
+            (len(times), len(vertices), 2),
+            chunks,
+            POSITION_DTYPE,
+        )
+    return len(vertices)
+
+
+def read_mesh_data(path: Union[str, Path]) -> MeshData:
+    """Read the data written by `write_mesh_data`.
+
+    Args:
+        path (Union[str, Path]): Path to `.npz` file.
+
+    Returns:
+        MeshData: Read data.
+
+    """
+    with np.load(Path(path)) as archive:
+        metadata: dict[str, Any] = json.loads(str(archive["metadata"]))
+        frames = archive["frames"]
+        positions = archive["positions"]
+    return MeshData(
+        layer_name=metadata["layer"],
+        frames=frames,
+        positions=positions,
+    )
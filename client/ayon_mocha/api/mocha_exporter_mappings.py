@@ -138,6 +138,20 @@ SHAPE_MAPPING_2025 = {
 }
 
 
+CAMERA_MAPPING = {
+    "3D Equalizer Camera Solve": "Equalizer3DCamera",
+    "Adobe After Effects Camera Solve": "AfxCamera",
+    "Alembic Camera Solve": "AlembicCamera",
+    "Autodesk 3ds Max Camera Solve": "MaxCamera",
+    "Autodesk Maya Camera Solve": "MayaCamera",
+    "Blender Camera Solve": "BlenderCamera",
+    "Cinema 4D Camera Solve": "Cinema4DCamera",
+    "Fusion Camera Solve": "FusionCamera",
+    "Nuke Camera Solve": "NukeCamera",
+    "SynthEyes Camera Solve": "SynthEyesCamera",
+}
+
+
 EXPORTER_MAPPING = {
     "shape": {
         "2024.5": SHAPE_MAPPING_2024_5,
@@ -146,5 +160,9 @@ EXPORTER_MAPPING = {
     "tracking": {
         "2024.5": TRACKING_MAPPING_2024_5,
         "2025": TRACKING_MAPPING_2025,
-    }
+    },
+    "camera": {
+        "2024.5": CAMERA_MAPPING,
+        "2025": CAMERA_MAPPING,
+    },
 }
@@ -16,6 +16,7 @@ from functools import partial
 from pathlib import Path
 from typing import TYPE_CHECKING, Generator, Optional, Union
 
+import ayon_api
 import pyblish.api
 from ayon_core.host import (
     HostBase,
@@ -23,6 +24,7 @@ from ayon_core.host import (
     IPublishHost,
     IWorkfileHost,
 )
+from ayon_core.lib import register_event_callback
 from ayon_core.pipeline import (
     AYON_CONTAINER_ID,
     CreatedInstance,
@@ -30,14 +32,23 @@ from ayon_core.pipeline import (
     register_loader_plugin_path,
     registered_host,
 )
-from ayon_core.pipeline.context_tools import get_current_task_entity
 from ayon_core.tools.utils import host_tools
 from ayon_core.tools.utils.dialogs import show_message_dialog
 from mocha.project import Project
 from mocha.project import get_current_project as _get_current_project
 
-from ayon_mocha.api.lib import create_empty_project, get_main_window, update_ui
+from ayon_mocha.api.lib import create_empty_project, get_main_window
 
+from .context_cache import DEFAULT_TTL, ContextCache
+from .project_reader import (
+    AYON_METADATA_END,
+    AYON_METADATA_START,
+    MOCHA_CONTAINERS_KEY,
+    MOCHA_CONTEXT_KEY,
+    MOCHA_INSTANCES_KEY,
+)
+from .ui_refresh import update_ui
+from .worker import TASK_MONITOR
 from .workio import current_file, file_extensions, open_file, save_file
 
 if TYPE_CHECKING:
@@ -53,15 +64,11 @@ INVENTORY_PATH = PLUGINS_DIR / "inventory"
 STARTUP_PATH = PLUGINS_DIR / "startup"
 
 AYON_CONTEXT_CREATOR_ID = "io.ayon.create.context"
-AYON_METADATA_GUARD = "AYON_CONTEXT::{}::AYON_CONTEXT_END"
+AYON_METADATA_GUARD = f"{AYON_METADATA_START}{{}}{AYON_METADATA_END}"
 AYON_METADATA_REGEX = re.compile(
     AYON_METADATA_GUARD.format("(?P<context>.*?)"),
     re.DOTALL)
 
-MOCHA_CONTEXT_KEY = "context"
-MOCHA_INSTANCES_KEY = "publish_instances"
-MOCHA_CONTAINERS_KEY = "containers"
-
 
 class AYONJSONEncoder(json.JSONEncoder):
     """Custom JSON encoder for dataclasses."""
@@ -95,20 +102,32 @@ class Container:
     objectName: Optional[str] = None  # noqa: N815
     timestamp: int = 0
     version: Optional[str] = None
+    resolution: str = "full"
+    proxy_scale: float = 1.0
+    local_cache: bool = False
+    keyframe_tolerance: float = 0.0
 
 
-class MochaProHost(HostBase, IWorkfileHost, ILoadHost, IPublishHost):
+class MochaProHost(HostBase, IWorkfileHost, ILoadHost, IPublishHost):  # noqa: PLR0904
     """Mocha Pro host implementation."""
 
     name = "mochapro"
     _uninitialized_project_warning_shown = False
 
+    def __init__(self) -> None:
+        """Initialize the host."""
+        super().__init__()
+        self._context_cache = ContextCache(
+            ttl=float(os.getenv("AYON_MOCHA_CONTEXT_CACHE_TTL", DEFAULT_TTL)))
+
     def install(self) -> None:
         """Initialize the host."""
         pyblish.api.register_host(self.name)
         pyblish.api.register_plugin_path(PUBLISH_PATH.as_posix())
         register_loader_plugin_path(LOAD_PATH.as_posix())
         register_creator_plugin_path(CREATE_PATH.as_posix())
+        register_event_callback(
+            "taskChanged", lambda _event: self.invalidate_context_cache())
 
         # QtCore.QTimer.singleShot(0, self._install_menu)
         self._install_menu()
@@ -132,38 +151,49 @@ class MochaProHost(HostBase, IWorkfileHost, ILoadHost, IPublishHost):
         menu.aboutToShow.connect(partial(_on_menu_about_to_show, action))
         menu.addSeparator()
 
+        # actions starting other host operations are disabled
+        # while a host task (like export) is running
+        guarded_actions: list[QtWidgets.QAction] = []
+
         action = menu.addAction("Create...")
+        guarded_actions.append(action)
         action.triggered.connect(
             lambda: host_tools.show_publisher(
                 parent=main_window, tab="create"))
 
         action = menu.addAction("Load...")
+        guarded_actions.append(action)
         action.triggered.connect(
             lambda: host_tools.show_loader(
                 parent=main_window, use_context=True))
 
         action = menu.addAction("Publish...")
+        guarded_actions.append(action)
         action.triggered.connect(
             lambda: host_tools.show_publisher(
                 parent=main_window, tab="publish"))
 
         action = menu.addAction("Manage...")
+        guarded_actions.append(action)
         action.triggered.connect(
             lambda: host_tools.show_scene_inventory(parent=main_window))
 
         action = menu.addAction("Library...")
+        guarded_actions.append(action)
         action.triggered.connect(
             lambda: host_tools.show_library_loader(parent=main_window))
 
         menu.addSeparator()
 
         action = menu.addAction("Work Files...")
+        guarded_actions.append(action)
         action.triggered.connect(
             lambda: host_tools.show_workfiles(parent=main_window))
 
         menu.addSeparator()
 
         action = menu.addAction("Reset Frame Range and FPS")
+        guarded_actions.append(action)
         action.triggered.connect(
             lambda: reset_frame_range(self.get_current_project()))
 
@@ -174,6 +204,45 @@ class MochaProHost(HostBase, IWorkfileHost, ILoadHost, IPublishHost):
             lambda: host_tools.show_experimental_tools_dialog(
                 parent=main_window))
 
+        def _on_busy_changed(busy: bool) -> None:  # noqa: FBT001
+            for guarded_action in guarded_actions:
+                guarded_action.setEnabled(not busy)
+
+        TASK_MONITOR.busy_changed.connect(_on_busy_changed)
+
+    def get_current_context_entities(self) -> dict:
+        """Return entities of the current context.
+
+        Entities are cached, so the server is not queried every time
+        the context is needed (like on every menu open).
+
+        Returns:
+            dict: Project, folder and task entities under `project`,
+                `folder` and `task` keys. Folder and task can be None.
+
+        """
+        context = self.get_current_context()
+        key = (
+            context["project_name"],
+            context["folder_path"],
+            context["task_name"],
+        )
+        return self._context_cache.get(
+            key, lambda: _get_context_entities(*key))
+
+    def get_current_task_entity(self) -> Optional[dict]:
+        """Return cached task entity of the current context.
+
+        Returns:
+            Optional[dict]: Task entity.
+
+        """
+        return self.get_current_context_entities()["task"]
+
+    def invalidate_context_cache(self) -> None:
+        """Drop cached entities of the current context."""
+        self._context_cache.invalidate()
+
     def get_workfile_extensions(self) -> list[str]:  # noqa: PLR6301
         """Get the workfile extensions.
 
@@ -194,7 +263,13 @@ class MochaProHost(HostBase, IWorkfileHost, ILoadHost, IPublishHost):
             isn't initialized yet.
             https://github.com/ynput/ayon-core/issues/1075
 
+        Raises:
+            RuntimeError: If a host task is running.
+
         """
+        if TASK_MONITOR.is_busy:
+            msg = "Cannot save the workfile while a host task is running."
+            raise RuntimeError(msg)
         if dst_path:
             save_file(Path(dst_path))
         else:
@@ -203,7 +278,15 @@ class MochaProHost(HostBase, IWorkfileHost, ILoadHost, IPublishHost):
             reset_frame_range(_get_current_project())
 
     def open_workfile(self, filepath: str) -> None:  # noqa: PLR6301
-        """Open the workfile."""
+        """Open the workfile.
+
+        Raises:
+            RuntimeError: If a host task is running.
+
+        """
+        if TASK_MONITOR.is_busy:
+            msg = "Cannot open the workfile while a host task is running."
+            raise RuntimeError(msg)
         open_file(Path(filepath))
 
     def get_current_workfile(self) -> Optional[str]:  # noqa: PLR6301
@@ -235,23 +318,36 @@ class MochaProHost(HostBase, IWorkfileHost, ILoadHost, IPublishHost):
         Args:
             container (Container): Container to add.
 
+        """
+        self.add_containers([container])
+
+    def add_containers(self, new_containers: list[Container]) -> None:
+        """Add multiple containers to the current workfile.
+
+        Metadata are updated only once for all of them.
+
+        Args:
+            new_containers (list[Container]): Containers to add.
+
         """
         data = self.get_ayon_data()
         containers_dicts = list(self.get_containers())
         containers = [
             Container(**_container) for _container in containers_dicts
         ]
-        to_remove = [
-            idx
-            for idx, _container in enumerate(containers)
-            if _container.name == container.name
-            and _container.namespace == container.namespace
+        new_keys = {
+            (container.name, container.namespace)
+            for container in new_containers
+        }
+        containers = [
+            _container for _container in containers
+            if (_container.name, _container.namespace) not in new_keys
         ]
-        for idx in reversed(to_remove):
-            containers.pop(idx)
 
         data[MOCHA_CONTAINERS_KEY] = [
-            *containers, dataclasses.asdict(container)]
+            *containers,
+            *(dataclasses.asdict(container) for container in new_containers),
+        ]
 
         self.update_ayon_data(data)
 
@@ -458,9 +554,67 @@ class MochaProHost(HostBase, IWorkfileHost, ILoadHost, IPublishHost):
         return project
 
 
+class HeadlessMochaProHost(MochaProHost):
+    """Mocha Pro host working with a project opened without UI.
+
+    Used by headless publishing, where there is no current
+    project, nor main window.
+    """
+
+    def __init__(self, project: Project) -> None:
+        """Initialize the host with the opened project."""
+        super().__init__()
+        self._project = project
+
+    def install(self) -> None:
+        """Initialize the host without the menu."""
+        pyblish.api.register_host(self.name)
+        pyblish.api.register_plugin_path(PUBLISH_PATH.as_posix())
+        register_creator_plugin_path(CREATE_PATH.as_posix())
+
+    def get_current_workfile(self) -> Optional[str]:
+        """Get the opened workfile.
+
+        Returns:
+            Optional[str]: The opened workfile.
+
+        """
+        return Path(self._project.project_file).as_posix()
+
+    def get_current_project(self) -> Project:
+        """Return the opened project."""
+        return self._project
+
+
+def _get_context_entities(
+        project_name: str,
+        folder_path: Optional[str],
+        task_name: Optional[str]) -> dict:
+    """Fetch context entities from the server.
+
+    Returns:
+        dict: Project, folder and task entities.
+
+    """
+    project_entity = ayon_api.get_project(project_name)
+    folder_entity = None
+    task_entity = None
+    if folder_path:
+        folder_entity = ayon_api.get_folder_by_path(project_name, folder_path)
+    if folder_entity and task_name:
+        task_entity = ayon_api.get_task_by_name(
+            project_name, folder_entity["id"], task_name)
+    return {
+        "project": project_entity,
+        "folder": folder_entity,
+        "task": task_entity,
+    }
+
+
 def reset_frame_range(project: Optional[Project]) -> None:
     """Reset frame range to the current task entity."""
-    task_entity = get_current_task_entity()
+    host: MochaProHost = registered_host()
+    task_entity = host.get_current_task_entity()
     frame_start = task_entity["attrib"]["frameStart"]
     frame_end = task_entity["attrib"]["frameEnd"]
     fps = task_entity["attrib"]["fps"]
@@ -469,7 +623,6 @@ def reset_frame_range(project: Optional[Project]) -> None:
     # pixel_aspect = task_entity["attrib"]["pixelAspect"]
 
     if not project:
-        host: MochaProHost = registered_host()
         project = host.get_current_project()
 
     project.length = int(frame_end) - int(frame_start) + 1
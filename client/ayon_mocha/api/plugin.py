@@ -1,15 +1,46 @@
 """Plugin API for Mocha Pro AYON addon."""
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, ClassVar
+from copy import deepcopy
+from pathlib import Path
+from typing import TYPE_CHECKING, ClassVar, Optional
 
+from ayon_core.lib import BoolDef, EnumDef, NumberDef
 from ayon_core.pipeline import (
     CreatedInstance,
     Creator,
+    KnownPublishError,
+    get_representation_path,
     load,
+    registered_host,
 )
+from ayon_core.pipeline.load import LoadError
+
+from .lib import get_frame_cache, get_image_info
+from .pipeline import Container
+from .prefetch import FRAME_PREFETCHER, PrefetchJob, get_frames_in_range
+from .product_name import get_layer_variant, get_product_names
+from .proxy import (
+    RESOLUTION_DOWNSCALED,
+    RESOLUTION_FULL,
+    RESOLUTION_ITEMS,
+    RESOLUTION_PROXY,
+    ClipSource,
+    create_downscaled_copy,
+    get_proxy_representation,
+    get_representation_files,
+    get_representation_sequence,
+)
+from .sequence import SequenceDescriptor, build_sequence_descriptor
+from .ui_refresh import update_ui
+from .worker import run_in_background
 
 if TYPE_CHECKING:
+    from concurrent.futures import Future
+
+    import pyblish.api
+    from mocha.project import Clip, Layer, Project
+
     from .pipeline import MochaProHost
 
 
@@ -94,8 +125,408 @@ class MochaCreator(Creator):
             self._remove_instance_from_context(instance)
             host.remove_create_instance(instance.id)
 
+    def get_layer_items(self) -> dict[int, str]:
+        """Return layers of the current project for layer selection.
+
+        Returns:
+            dict[int, str]: Layer names by their index.
+
+        """
+        host: MochaProHost = self.create_context.host
+        return {
+            idx: layer.name
+            for idx, layer in enumerate(host.get_current_project().layers)
+        } or {-1: "No layers"}
+
+
+def get_instance_layers(instance: pyblish.api.Instance) -> list[Layer]:
+    """Return layers of the instance by its layer mode.
+
+    Args:
+        instance (pyblish.api.Instance): Instance with `layer_mode`
+            and `layers` creator attributes.
+
+    Returns:
+        list[Layer]: Selected or all layers of the project.
+
+    Raises:
+        KnownPublishError: If the layer mode is invalid.
+
+    """
+    creator_attrs = instance.data["creator_attributes"]
+    project: Project = instance.context.data["project"]
+    if creator_attrs["layer_mode"] == "selected":
+        # negative index is the placeholder of empty layer list
+        return [
+            project.layers[selected_layer_idx]
+            for selected_layer_idx in creator_attrs["layers"]
+            if selected_layer_idx >= 0
+        ]
+    if creator_attrs["layer_mode"] == "all":
+        return list(project.layers)
+    msg = f"Invalid layer mode: {creator_attrs['layer_mode']}"
+    raise KnownPublishError(msg)
+
+
+def split_instance_by_layers(
+        instance: pyblish.api.Instance) -> list[pyblish.api.Instance]:
+    """Create instance for every layer of the instance layer mode.
+
+    Data of the instance are copied to the new instances together with
+    the layer, its frame range and product name. Original instance is
+    removed from the context.
+
+    Args:
+        instance (pyblish.api.Instance): Instance to split.
+
+    Returns:
+        list[pyblish.api.Instance]: Instances of the layers.
+
+    """
+    layers = get_instance_layers(instance)
+    product_names = get_product_names(
+        instance.context.data["create_context"],
+        instance.data["productType"],
+        [
+            get_layer_variant(layer.name, instance.data["variant"])
+            for layer in layers
+        ],
+    )
+    new_instances = []
+    for layer, product_name in zip(layers, product_names):
+        new_instance = instance.context.create_instance(
+            f"{instance.name}_{layer.name}"
+        )
+        for k, v in instance.data.items():
+            # this is needed because the data is not always
+            # "deepcopyable".
+            try:
+                new_instance.data[k] = deepcopy(v)
+            except TypeError:  # noqa: PERF203
+                new_instance.data[k] = v
+
+        new_instance.data["label"] = f"{instance.name} ({layer.name})"
+        new_instance.data["name"] = f"{instance.name}_{layer.name}"
+        new_instance.data["productName"] = product_name
+        new_instance.data["layer"] = layer
+        new_instance.data["frameStart"] = layer.in_point()
+        new_instance.data["frameEnd"] = layer.out_point()
+        new_instances.append(new_instance)
+
+    instance.context.remove(instance)
+    return new_instances
+
 
 class MochaLoader(load.LoaderPlugin):
     """Mocha Pro loader base class."""
     settings_category = "mochapro"
     hosts: ClassVar[list[str]] = ["mochapro"]
+
+
+class MochaLayerLoader(MochaLoader):
+    """Mocha Pro loader base class for layers.
+
+    Loaded data are applied to a new layer, container points to the
+    layer by its name.
+    """
+
+    def switch(self, container: dict, context: dict) -> None:
+        """Switch the layer to another representation."""
+        self.update(container, context)
+
+    def remove(self, container: dict) -> None:
+        """Remove the layer and its container."""
+        host: MochaProHost = registered_host()
+        project = host.get_current_project()
+        layer = self.get_layer(project, container["objectName"])
+        if layer is None:
+            self.log.warning("Layer %s not found", container["objectName"])
+        else:
+            layer.remove()
+        host.remove_container(Container(**container))
+
+    @staticmethod
+    def get_layer(project: Project, name: str) -> Optional[Layer]:
+        """Return layer of the project by its name.
+
+        Args:
+            project (Project): Mocha project.
+            name (str): Layer name.
+
+        Returns:
+            Optional[Layer]: Layer if found.
+
+        """
+        return next(
+            (layer for layer in project.layers if layer.name == name), None)
+
+    @staticmethod
+    def get_unique_layer_name(project: Project, name: str) -> str:
+        """Return layer name not used in the project.
+
+        Args:
+            project (Project): Mocha project.
+            name (str): Requested layer name.
+
+        Returns:
+            str: `name` or `name` with the first free numeric suffix.
+
+        """
+        names = {layer.name for layer in project.layers}
+        unique_name = name
+        index = 1
+        while unique_name in names:
+            unique_name = f"{name}_{index:02d}"
+            index += 1
+        return unique_name
+
+
+class MochaClipLoader(MochaLoader):
+    """Mocha Pro loader base class for clips.
+
+    Clips can be loaded in lower resolution for faster tracking,
+    either from the proxy representation of the version or from
+    downscaled copy in the local cache.
+
+    Published frames can be also copied to the local frame cache
+    in the background, the clip is relinked to the local copy once
+    all frames are copied.
+    """
+    options: ClassVar[list] = [
+        EnumDef(
+            "resolution",
+            label="Resolution",
+            items=RESOLUTION_ITEMS,
+            default=RESOLUTION_FULL,
+        ),
+        NumberDef(
+            "downscale",
+            label="Downscale factor",
+            default=0.5,
+            minimum=0.1,
+            maximum=1.0,
+            decimals=2,
+        ),
+        BoolDef(
+            "local_cache",
+            label="Cache frames locally",
+            default=False,
+        ),
+    ]
+    # number of relinks per clip name, used to drop background work
+    # started for previously linked frames
+    _clip_links: ClassVar[dict[str, int]] = {}
+
+    @classmethod
+    def relink_clip(cls, clip: Clip, source: ClipSource) -> None:
+        """Relink the clip to the frames.
+
+        Args:
+            clip (Clip): Clip to relink.
+            source (ClipSource): Frames to link the clip to.
+
+        """
+        cls._clip_links[clip.name] = cls._clip_links.get(clip.name, 0) + 1
+        FRAME_PREFETCHER.cancel(clip.name)
+        cls.link_frames(clip, source.path, source.sequence)
+
+    @staticmethod
+    def link_frames(
+            clip: Clip,
+            path: str,
+            sequence: Optional[SequenceDescriptor] = None) -> None:
+        """Link the clip to the frames.
+
+        Known sequence is passed to Mocha Pro with its exact frame
+        range, so it doesn't need to scan the directory.
+
+        Args:
+            clip (Clip): Clip to relink.
+            path (str): Path to the first frame.
+            sequence (Optional[SequenceDescriptor]): Sequence of
+                the frames.
+
+        """
+        if sequence is None:
+            clip.relink(path)
+            return
+        clip.relink(**sequence.get_relink_arguments())
+
+    def get_clip_source(
+            self,
+            context: dict,
+            options: Optional[dict] = None) -> ClipSource:
+        """Return frames to link the clip to.
+
+        Args:
+            context (dict): Representation context.
+            options (Optional[dict]): Loader options.
+
+        Returns:
+            ClipSource: Frames with their scale to full resolution.
+
+        """
+        options = options or {}
+        resolution = options.get("resolution") or RESOLUTION_FULL
+        file_path = get_representation_path(context["representation"])
+
+        if resolution == RESOLUTION_PROXY:
+            proxy_entity = get_proxy_representation(context)
+            if proxy_entity is None:
+                self.log.warning(
+                    "No proxy representation found, "
+                    "loading full resolution.")
+                return ClipSource(
+                    file_path,
+                    representation=context["representation"],
+                    sequence=get_representation_sequence(
+                        context["representation"]),
+                )
+            proxy_path = get_representation_path(proxy_entity)
+            full_width = self.get_frame_size(file_path)[0]
+            proxy_width = self.get_frame_size(proxy_path)[0]
+            return ClipSource(
+                proxy_path,
+                resolution,
+                proxy_width / full_width,
+                representation=proxy_entity,
+                sequence=get_representation_sequence(proxy_entity),
+            )
+
+        if resolution == RESOLUTION_DOWNSCALED:
+            scale = float(options.get("downscale") or 1.0)
+            if scale < 1.0:
+                proxy_files = create_downscaled_copy(
+                    get_representation_files(context),
+                    scale,
+                    context["representation"]["id"],
+                )
+                return ClipSource(
+                    proxy_files[0].as_posix(),
+                    resolution,
+                    scale,
+                    sequence=build_sequence_descriptor(
+                        proxy_files[0].parent,
+                        [path.name for path in proxy_files],
+                    ),
+                )
+
+        return ClipSource(
+            file_path,
+            representation=context["representation"],
+            sequence=get_representation_sequence(context["representation"]),
+        )
+
+    def cache_clip_frames(
+            self,
+            clip_name: str,
+            context: dict,
+            source: ClipSource) -> Optional[Future]:
+        """Copy clip frames to the local cache in the background.
+
+        Clip is relinked to the cached frames when all of them
+        are copied.
+
+        Args:
+            clip_name (str): Name of the clip to relink.
+            context (dict): Representation context.
+            source (ClipSource): Frames the clip is linked to.
+
+        Returns:
+            Optional[Future]: Future of the cached files or None
+                if the frames are already local.
+
+        """
+        if source.representation is None:
+            return None
+        files = get_representation_files(
+            {**context, "representation": source.representation})
+        if not files:
+            return None
+        link = self._clip_links.get(clip_name, 0)
+
+        def _relink(future: Future) -> None:
+            try:
+                cached_files = future.result()
+            except OSError:
+                self.log.warning(
+                    "Failed to cache frames of %s", clip_name, exc_info=True)
+                return
+            host: MochaProHost = registered_host()
+            clip = host.get_current_project().get_clips().get(clip_name)
+            if clip is None or self._clip_links.get(clip_name, 0) != link:
+                self.log.debug("Clip %s was removed or relinked", clip_name)
+                return
+            FRAME_PREFETCHER.cancel(clip_name)
+            self.link_frames(
+                clip,
+                cached_files[0].as_posix(),
+                build_sequence_descriptor(
+                    cached_files[0].parent,
+                    [path.name for path in cached_files],
+                ),
+            )
+            update_ui()
+            self.log.info("Clip %s linked to local frames", clip_name)
+
+        return run_in_background(
+            get_frame_cache().cache_files, files, on_done=_relink)
+
+    @staticmethod
+    def prefetch_clip_frames(
+            clip_name: str,
+            context: dict,
+            source: ClipSource) -> Optional[PrefetchJob]:
+        """Read clip frames of the task frame range in the background.
+
+        Frames are read in tracking order to get them to the OS page
+        cache before the first track pass. Prefetch is cancelled
+        when the clip is relinked.
+
+        Args:
+            clip_name (str): Name of the clip.
+            context (dict): Representation context.
+            source (ClipSource): Frames the clip is linked to.
+
+        Returns:
+            Optional[PrefetchJob]: Prefetch job or None if the frames
+                are local.
+
+        """
+        if source.representation is None:
+            return None
+        files = get_representation_files(
+            {**context, "representation": source.representation})
+        host: MochaProHost = registered_host()
+        task_entity = host.get_current_task_entity()
+        if task_entity:
+            files = get_frames_in_range(
+                files,
+                int(task_entity["attrib"]["frameStart"]),
+                int(task_entity["attrib"]["frameEnd"]),
+            )
+        return FRAME_PREFETCHER.prefetch(clip_name, files)
+
+    @staticmethod
+    def get_frame_size(file_path: str) -> tuple[int, int]:
+        """Return frame size of the image.
+
+        Args:
+            file_path (str): Path to the image.
+
+        Returns:
+            tuple[int, int]: Width and height.
+
+        Raises:
+            LoadError: If the image info cannot be retrieved.
+
+        """
+        try:
+            image_info = get_image_info(Path(file_path))
+        except ValueError as exc:
+            msg = f"Failed to get image info from {file_path}: {exc}"
+            raise LoadError(msg) from exc
+        return (
+            image_info.get("width", 1920),
+            image_info.get("height", 1080),
+        )
@@ -0,0 +1,194 @@
+"""Prefetch frames of loaded clips.
+
+Frames are read in the background in tracking order, so they are in
+the OS page cache when Mocha Pro needs them for the first track pass.
+Prefetch of a clip is cancelled when the clip is relinked again.
+
+Note:
+    This module must not import `mocha` or anything that does.
+
+"""
+from __future__ import annotations
+
+import logging
+import threading
+from collections import defaultdict
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import TYPE_CHECKING, Iterable, Optional
+
+from .sequence import build_sequence_descriptor
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+log = logging.getLogger("ayon_mocha.prefetch")
+
+READ_BUFFER_SIZE = 4 * 1024 * 1024
+DEFAULT_MAX_WORKERS = 4
+
+
+def get_frames_in_range(
+        files: Iterable[Path],
+        frame_start: int,
+        frame_end: int) -> list[Path]:
+    """Return files of the frames in range, in tracking order.
+
+    Files are filtered only if they form an image sequence, other
+    files (like single images with a number in the name) are kept.
+
+    Args:
+        files (Iterable[Path]): Files of the clip.
+        frame_start (int): First frame.
+        frame_end (int): Last frame.
+
+    Returns:
+        list[Path]: Files sorted by the frame number.
+
+    """
+    by_directory: dict[Path, list[str]] = defaultdict(list)
+    for path in files:
+        by_directory[path.parent].append(path.name)
+
+    frames: list[tuple[int, Path]] = []
+    for directory, names in by_directory.items():
+        sequence = build_sequence_descriptor(directory, names)
+        if not sequence.is_sequence:
+            frames.extend((frame_start, directory / name) for name in names)
+            continue
+        frames.extend(
+            (
+                frame,
+                directory / (
+                    f"{sequence.prefix}{frame:0{sequence.padding}d}"
+                    f"{sequence.suffix}"),
+            )
+            for frame in sequence.frames
+            if frame_start <= frame <= frame_end
+        )
+    return [path for _, path in sorted(frames)]
+
+
+class PrefetchJob:
+    """Prefetch of frames of one clip."""
+
+    def __init__(self, key: str, files: list[Path]) -> None:
+        """Initialize the job.
+
+        Args:
+            key (str): Key of the job, like clip name.
+            files (list[Path]): Files to read.
+
+        """
+        self.key = key
+        self.files = files
+        self.read_count = 0
+        self._cancelled = threading.Event()
+        self._futures: list[Future] = []
+        self._lock = threading.Lock()
+
+    @property
+    def cancelled(self) -> bool:
+        """Whether the job was cancelled."""
+        return self._cancelled.is_set()
+
+    @property
+    def done(self) -> bool:
+        """Whether all the reads finished."""
+        return all(future.done() for future in self._futures)
+
+    def start(self, executor: ThreadPoolExecutor) -> None:
+        """Queue reads of all files in the executor.
+
+        Args:
+            executor (ThreadPoolExecutor): Executor running the reads.
+
+        """
+        self._futures = [
+            executor.submit(self._read, path) for path in self.files]
+
+    def cancel(self) -> None:
+        """Cancel reads that didn't start yet."""
+        self._cancelled.set()
+        for future in self._futures:
+            future.cancel()
+
+    def wait(self) -> None:
+        """Wait until all started reads finish."""
+        for future in self._futures:
+            if not future.cancelled():
+                future.exception()
+
+    def _read(self, path: Path) -> None:
+        """Read the file to get it to the page cache."""
+        if self.cancelled:
+            return
+        buffer = bytearray(READ_BUFFER_SIZE)
+        try:
+            with open(path, "rb", buffering=0) as stream:
+                while not self.cancelled and stream.readinto(buffer):
+                    pass
+        except OSError:
+            log.debug("Failed to prefetch %s", path, exc_info=True)
+            return
+        with self._lock:
+            self.read_count += 1
+
+
+class FramePrefetcher:
+    """Read clip frames in the background with bounded concurrency."""
+
+    def __init__(self, max_workers: int = DEFAULT_MAX_WORKERS) -> None:
+        """Initialize the prefetcher.
+
+        Args:
+            max_workers (int): Number of concurrent reads.
+
+        """
+        self.max_workers = max_workers
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._jobs: dict[str, PrefetchJob] = {}
+        self._lock = threading.Lock()
+
+    def prefetch(self, key: str, files: Iterable[Path]) -> PrefetchJob:
+        """Start prefetch of the files.
+
+        Running prefetch with the same key is cancelled. Files are
+        queued in the given order.
+
+        Args:
+            key (str): Key of the prefetch, like clip name.
+            files (Iterable[Path]): Files to read.
+
+        Returns:
+            PrefetchJob: Started job.
+
+        """
+        job = PrefetchJob(key, list(files))
+        with self._lock:
+            previous_job = self._jobs.pop(key, None)
+            if previous_job is not None:
+                previous_job.cancel()
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers,
+                    thread_name_prefix="ayon_mocha_prefetch")
+            self._jobs[key] = job
+            job.start(self._executor)
+        log.debug("Prefetching %d frames of %s", len(job.files), key)
+        return job
+
+    def cancel(self, key: str) -> None:
+        """Cancel prefetch with the key.
+
+        Args:
+            key (str): Key of the prefetch.
+
+        """
+        with self._lock:
+            job = self._jobs.pop(key, None)
+        if job is not None:
+            job.cancel()
+            log.debug("Cancelled prefetch of %s", key)
+
+
+FRAME_PREFETCHER = FramePrefetcher()
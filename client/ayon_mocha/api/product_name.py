@@ -0,0 +1,64 @@
+"""Product names of instances split per layer.
+
+Collectors split one instance into an instance per layer. Product
+names are resolved by `get_product_name` of ayon_core with project
+settings and project entity cached by the create context, so no
+server requests are made for each of the layers.
+"""
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from ayon_core.pipeline.create import get_product_name
+
+if TYPE_CHECKING:
+    from ayon_core.pipeline.create import CreateContext
+
+
+def get_product_names(
+        create_context: CreateContext,
+        product_type: str,
+        variants: list[str]) -> list[str]:
+    """Return product names for the variants in the current task.
+
+    Args:
+        create_context (CreateContext): Create context.
+        product_type (str): Product type.
+        variants (list[str]): Variants of the products.
+
+    Returns:
+        list[str]: Product names in the order of variants.
+
+    """
+    project_settings = create_context.get_current_project_settings()
+    project_entity = create_context.get_current_project_entity()
+    task_name = create_context.get_current_task_name()
+    task_type = create_context.get_current_task_type()
+    return [
+        get_product_name(
+            project_name=create_context.project_name,
+            task_name=task_name,
+            task_type=task_type,
+            host_name=create_context.host_name,
+            product_type=product_type,
+            variant=variant,
+            project_settings=project_settings,
+            project_entity=project_entity,
+        )
+        for variant in variants
+    ]
+
+
+def get_layer_variant(layer_name: str, variant: str) -> str:
+    """Return variant of the product of the layer.
+
+    Args:
+        layer_name (str): Name of the layer.
+        variant (str): Variant of the instance.
+
+    Returns:
+        str: Variant with the layer name.
+
+    """
+    sanitized_layer_name = layer_name.replace(" ", "_")
+    return f"{sanitized_layer_name}{variant.capitalize()}"
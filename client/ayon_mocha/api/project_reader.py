@@ -0,0 +1,207 @@
+"""Read AYON metadata from Mocha Pro project files without Mocha.
+
+AYON stores its data in the project notes wrapped in the
+`AYON_CONTEXT::...::AYON_CONTEXT_END` guard (see `MochaProHost`).
+This module finds that block directly in the `.mocha` file, so
+it can be used on the farm or in the tools where Mocha Pro (and its
+licence) isn't available. The file is read in chunks, so only the
+metadata block itself is held in memory.
+
+Note:
+    This module must not import `mocha` or anything that does.
+
+"""
+from __future__ import annotations
+
+import dataclasses
+import gzip
+import html
+import json
+import zlib
+from pathlib import Path
+from typing import BinaryIO, Optional, Union
+
+AYON_METADATA_START = "AYON_CONTEXT::"
+AYON_METADATA_END = "::AYON_CONTEXT_END"
+
+MOCHA_CONTEXT_KEY = "context"
+MOCHA_INSTANCES_KEY = "publish_instances"
+MOCHA_CONTAINERS_KEY = "containers"
+
+CHUNK_SIZE = 1024 * 1024
+GZIP_MAGIC = b"\x1f\x8b"
+
+
+@dataclasses.dataclass
+class WorkfileMetadata:
+    """AYON metadata stored in a workfile."""
+    path: Path
+    context: dict
+    containers: list[dict]
+    publish_instances: list[dict]
+
+    @property
+    def folder_path(self) -> Optional[str]:
+        """Folder path the workfile belongs to.
+
+        Context data doesn't store the folder, so it is taken from
+        the publish instances.
+        """
+        return next(
+            (
+                instance["folderPath"]
+                for instance in self.publish_instances
+                if instance.get("folderPath")
+            ), None)
+
+    @property
+    def task_name(self) -> Optional[str]:
+        """Task name the workfile belongs to."""
+        return next(
+            (
+                instance["task"]
+                for instance in self.publish_instances
+                if instance.get("task")
+            ), None)
+
+
+def _open_project_file(project_path: Path) -> BinaryIO:
+    """Open project file for binary reading.
+
+    Compressed project files are transparently decompressed.
+
+    Args:
+        project_path (Path): Path to the project file.
+
+    Returns:
+        BinaryIO: Opened file.
+
+    """
+    with open(project_path, "rb") as stream:
+        magic = stream.read(len(GZIP_MAGIC))
+    if magic == GZIP_MAGIC:
+        return gzip.open(project_path, "rb")  # type: ignore[return-value]
+    return open(project_path, "rb")
+
+
+def read_metadata_block(
+        project_path: Path, chunk_size: int = CHUNK_SIZE) -> Optional[str]:
+    """Read raw AYON metadata block from the project file.
+
+    Args:
+        project_path (Path): Path to the project file.
+        chunk_size (int): Size of the chunks the file is read in.
+
+    Returns:
+        Optional[str]: Content between the metadata guards or None
+            if there is no metadata block in the file.
+
+    Raises:
+        ValueError: If the compressed stream of the file is corrupted.
+
+    """
+    try:
+        return _read_metadata_block(project_path, chunk_size)
+    except zlib.error as exc:
+        msg = f"Corrupted compressed project file {project_path}: {exc}"
+        raise ValueError(msg) from exc
+
+
+def _read_metadata_block(
+        project_path: Path, chunk_size: int) -> Optional[str]:
+    """Read raw AYON metadata block from the project file.
+
+    Returns:
+        Optional[str]: Content between the metadata guards or None
+            if there is no metadata block in the file.
+
+    """
+    start = AYON_METADATA_START.encode()
+    end = AYON_METADATA_END.encode()
+
+    head = b""
+    block: Optional[bytearray] = None
+    search_from = 0
+    with _open_project_file(project_path) as stream:
+        while True:
+            chunk = stream.read(chunk_size)
+            if not chunk:
+                return None
+            if block is None:
+                head += chunk
+                idx = head.find(start)
+                if idx < 0:
+                    # keep just enough to match guard split between chunks
+                    head = head[-(len(start) - 1):]
+                    continue
+                block = bytearray(head[idx + len(start):])
+            else:
+                block += chunk
+
+            idx = block.find(end, search_from)
+            if idx >= 0:
+                return block[:idx].decode("utf-8", errors="replace")
+            search_from = max(0, len(block) - len(end) + 1)
+
+
+def parse_metadata_block(block: str) -> dict:
+    """Parse metadata block to dictionary.
+
+    Project files can store notes with XML entities escaped,
+    so unescaped variant is tried if the raw one isn't valid JSON.
+
+    Args:
+        block (str): Raw metadata block.
+
+    Returns:
+        dict: Parsed data or empty dict if it cannot be parsed.
+
+    """
+    for candidate in (block, html.unescape(block)):
+        try:
+            data = json.loads(candidate)
+        except ValueError:
+            continue
+        if isinstance(data, dict):
+            return data
+    return {}
+
+
+def read_ayon_data(project_path: Union[str, Path]) -> dict:
+    """Read AYON data from the project file.
+
+    This is offline equivalent of `MochaProHost.get_ayon_data()`.
+
+    Args:
+        project_path (Union[str, Path]): Path to the project file.
+
+    Returns:
+        dict: AYON data, empty if not found or invalid.
+
+    """
+    block = read_metadata_block(Path(project_path))
+    return parse_metadata_block(block) if block else {}
+
+
+def read_workfile_metadata(
+        project_path: Union[str, Path]) -> WorkfileMetadata:
+    """Read AYON metadata from the project file.
+
+    Args:
+        project_path (Union[str, Path]): Path to the project file.
+
+    Returns:
+        WorkfileMetadata: Metadata found in the workfile.
+
+    """
+    data = read_ayon_data(project_path)
+    return WorkfileMetadata(
+        path=Path(project_path),
+        context=data.get(MOCHA_CONTEXT_KEY) or {},
+        containers=[
+            container
+            for container in data.get(MOCHA_CONTAINERS_KEY) or []
+            if container
+        ],
+        publish_instances=data.get(MOCHA_INSTANCES_KEY) or [],
+    )
@@ -0,0 +1,182 @@
+"""Low resolution clips for faster interactive tracking.
+
+Clips can be loaded from the proxy representation of the same version
+or from downscaled copy of the published frames created by OIIO in the
+local cache. Container still points to the full resolution
+representation and stores the scale of the loaded frames, so sampled
+data can be rescaled to the original frame size.
+"""
+from __future__ import annotations
+
+import dataclasses
+from pathlib import Path
+from typing import TYPE_CHECKING, Iterable, Optional
+
+import ayon_api
+import clique
+from ayon_core.lib import get_oiio_tool_args, run_subprocess
+from ayon_core.pipeline import get_representation_path
+
+from .lib import get_cache_dir
+from .sequence import SequenceDescriptor, build_sequence_descriptor
+
+if TYPE_CHECKING:
+    from mocha.project import Project
+
+RESOLUTION_FULL = "full"
+RESOLUTION_PROXY = "proxy"
+RESOLUTION_DOWNSCALED = "downscaled"
+RESOLUTION_ITEMS = {
+    RESOLUTION_FULL: "Full resolution",
+    RESOLUTION_PROXY: "Proxy representation",
+    RESOLUTION_DOWNSCALED: "Downscaled local copy",
+}
+PROXY_REPRESENTATION_NAMES = {"proxy"}
+
+
+@dataclasses.dataclass
+class ClipSource:
+    """Frames the clip is linked to."""
+    path: str
+    resolution: str = RESOLUTION_FULL
+    scale: float = 1.0
+    # published representation of the frames, None for local copies
+    representation: Optional[dict] = None
+    sequence: Optional[SequenceDescriptor] = None
+
+
+def get_proxy_representation(context: dict) -> Optional[dict]:
+    """Return proxy representation of the loaded version.
+
+    Args:
+        context (dict): Representation context.
+
+    Returns:
+        Optional[dict]: Proxy representation entity if found.
+
+    """
+    return next(
+        iter(ayon_api.get_representations(
+            context["project"]["name"],
+            representation_names=PROXY_REPRESENTATION_NAMES,
+            version_ids={context["version"]["id"]},
+        )),
+        None,
+    )
+
+
+def get_representation_sequence(
+        representation: dict) -> SequenceDescriptor:
+    """Return sequence of the representation files.
+
+    Frames are taken from the representation `files` data, the
+    directory is not listed.
+
+    Args:
+        representation (dict): Representation entity.
+
+    Returns:
+        SequenceDescriptor: Sequence of the representation.
+
+    """
+    first_file = Path(get_representation_path(representation))
+    file_names = [
+        Path(file_info["path"]).name
+        for file_info in representation.get("files") or []
+    ]
+    return build_sequence_descriptor(
+        first_file.parent, file_names or [first_file.name])
+
+
+def get_representation_files(context: dict) -> list[Path]:
+    """Return paths to all files of the representation.
+
+    Args:
+        context (dict): Representation context.
+
+    Returns:
+        list[Path]: Sorted file paths.
+
+    """
+    representation = context["representation"]
+    directory = Path(get_representation_path(representation)).parent
+    return sorted(
+        directory / Path(file_info["path"]).name
+        for file_info in representation.get("files") or []
+    )
+
+
+def create_downscaled_copy(
+        files: Iterable[Path], scale: float, cache_key: str) -> list[Path]:
+    """Create downscaled copy of the image sequence in the local cache.
+
+    Existing copy is reused.
+
+    Args:
+        files (Iterable[Path]): Frames of the sequence.
+        scale (float): Scale of the copy.
+        cache_key (str): Unique key of the sequence (like
+            representation id).
+
+    Returns:
+        list[Path]: Frames of the copy.
+
+    """
+    files = list(files)
+    source_dir = files[0].parent
+    cache_dir = get_cache_dir("proxies", cache_key, f"{scale:g}")
+
+    collections, _ = clique.assemble([file.name for file in files])
+    args = get_oiio_tool_args("oiiotool")
+    if collections:
+        collection = collections[0]
+        pattern = collection.format("{head}{padding}{tail}")
+        targets = [cache_dir / name for name in collection]
+        args += ["--frames", collection.format("{range}")]
+    else:
+        pattern = files[0].name
+        targets = [cache_dir / pattern]
+
+    if all(target.is_file() for target in targets):
+        return targets
+
+    args += [
+        (source_dir / pattern).as_posix(),
+        "--resize", f"{scale * 100:g}%",
+        "-o", (cache_dir / pattern).as_posix(),
+    ]
+    run_subprocess(args)
+    return targets
+
+
+def get_proxy_scale(containers: Iterable[dict], clip_name: str) -> float:
+    """Return scale of the clip loaded in lower resolution.
+
+    Args:
+        containers (Iterable[dict]): Containers of the workfile.
+        clip_name (str): Name of the clip.
+
+    Returns:
+        float: Scale of the clip, 1.0 for full resolution clips.
+
+    """
+    for container in containers:
+        if container.get("objectName") == clip_name:
+            return float(container.get("proxy_scale") or 1.0)
+    return 1.0
+
+
+def get_trackable_clip_scale(
+        project: Project, containers: Iterable[dict]) -> float:
+    """Return scale of the trackable clip of the project.
+
+    Args:
+        project (Project): Mocha project.
+        containers (Iterable[dict]): Containers of the workfile.
+
+    Returns:
+        float: Scale of the clip, 1.0 for full resolution clips.
+
+    """
+    clip = project.default_trackable_clip
+    return get_proxy_scale(containers, clip.name) if clip else 1.0
@@ -0,0 +1,124 @@
+"""Describe image sequences from known file names.
+
+Published representations already list all their files, so the frame
+range of the sequence can be determined without listing the directory.
+The descriptor is passed to `Clip.relink` to point Mocha Pro exactly to
+the published frames.
+
+Note:
+    This module must not import `mocha` or anything that does.
+
+"""
+from __future__ import annotations
+
+import dataclasses
+import re
+from collections import defaultdict
+from pathlib import Path
+from typing import Iterable, Union
+
+FRAME_PATTERN = re.compile(r"^(?P<prefix>.*?)(?P<frame>\d+)(?P<suffix>\D*)$")
+
+
+@dataclasses.dataclass(frozen=True)
+class SequenceDescriptor:
+    """Image sequence or single file.
+
+    Single file has no frames and empty prefix and suffix.
+    """
+    directory: Path
+    first_file: str
+    prefix: str = ""
+    suffix: str = ""
+    padding: int = 0
+    frames: tuple[int, ...] = ()
+
+    @property
+    def is_sequence(self) -> bool:
+        """Whether this is a sequence of frames."""
+        return bool(self.frames)
+
+    @property
+    def start_frame(self) -> int:
+        """First frame of the sequence."""
+        return self.frames[0] if self.frames else 0
+
+    @property
+    def end_frame(self) -> int:
+        """Last frame of the sequence."""
+        return self.frames[-1] if self.frames else 0
+
+    @property
+    def is_contiguous(self) -> bool:
+        """Whether the sequence has no missing frames."""
+        return len(self.frames) == self.end_frame - self.start_frame + 1
+
+    @property
+    def path(self) -> Path:
+        """Path to the first file."""
+        return self.directory / self.first_file
+
+    def get_relink_arguments(self) -> dict:
+        """Return arguments for `Clip.relink`.
+
+        Returns:
+            dict: Keyword arguments.
+
+        """
+        arguments: dict = {"path": self.path.as_posix()}
+        if self.is_sequence:
+            arguments.update({
+                "prefix": self.prefix,
+                "suffix": self.suffix,
+                "start_frame": self.start_frame,
+                "end_frame": self.end_frame,
+            })
+        return arguments
+
+
+def build_sequence_descriptor(
+        directory: Union[str, Path],
+        file_names: Iterable[str]) -> SequenceDescriptor:
+    """Build sequence descriptor from the file names.
+
+    If the files don't form exactly one sequence of at least two
+    frames, the first file is described as a single file.
+
+    Args:
+        directory (Union[str, Path]): Directory of the files.
+        file_names (Iterable[str]): Names of the files.
+
+    Returns:
+        SequenceDescriptor: Descriptor of the files.
+
+    Raises:
+        ValueError: If there are no files.
+
+    """
+    names = sorted(file_names)
+    if not names:
+        msg = "Cannot describe sequence without files."
+        raise ValueError(msg)
+
+    groups: dict[tuple[str, str, int], list[int]] = defaultdict(list)
+    for name in names:
+        match = FRAME_PATTERN.match(name)
+        if not match:
+            break
+        frame = match["frame"]
+        key = (match["prefix"], match["suffix"], len(frame))
+        groups[key].append(int(frame))
+    else:
+        if len(groups) == 1 and len(names) > 1:
+            (prefix, suffix, padding), frames = next(iter(groups.items()))
+            frames.sort()
+            return SequenceDescriptor(
+                directory=Path(directory),
+                first_file=f"{prefix}{frames[0]:0{padding}d}{suffix}",
+                prefix=prefix,
+                suffix=suffix,
+                padding=padding,
+                frames=tuple(frames),
+            )
+
+    return SequenceDescriptor(directory=Path(directory), first_file=names[0])
@@ -0,0 +1,378 @@
+"""Sampled contours of layers.
+
+Contours of a layer are walked once per frame and their control points
+are stored in one contiguous array of shape (frames, points, fields),
+where points of all contours follow each other. `contour_offsets`
+delimit points of every contour, so contour `i` are points
+`contour_offsets[i]:contour_offsets[i + 1]`.
+
+Sampled data are stored as compressed `.npz` archive (shape cache),
+which is published next to the Mocha Pro exporter outputs for reuse
+by later exports and diffing, or applied back to a layer of another
+project.
+
+Note:
+    This module must not import `mocha` or anything that does, contours
+    and control points are used only through their methods.
+
+"""
+from __future__ import annotations
+
+import dataclasses
+import json
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable, Optional, Union
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from mocha.project import Layer, View
+
+SHAPE_DATA_VERSION = 1
+CONTOUR_BEZIER = "bezier"
+CONTOUR_XSPLINE = "xspline"
+# fields of the control point, fields not used by the contour type
+# (handles of x-spline, weight of bezier point) are zero
+POINT_FIELDS = (
+    "x",
+    "y",
+    "handle_backward_x",
+    "handle_backward_y",
+    "handle_forward_x",
+    "handle_forward_y",
+    "weight",
+    "edge_width",
+    "edge_angle_ratio",
+    "corner",
+    "active",
+)
+FIELD_INDEX = {name: index for index, name in enumerate(POINT_FIELDS)}
+
+
+@dataclasses.dataclass
+class ShapeData:
+    """Contours of one layer.
+
+    Attributes:
+        layer_name (str): Name of the layer.
+        frames (np.ndarray): Frame numbers, shape (N,).
+        points (np.ndarray): Control points of all contours,
+            shape (N, P, len(POINT_FIELDS)).
+        contour_offsets (np.ndarray): Index of the first point of every
+            contour and the total number of points, shape (C + 1,).
+        contour_types (list[str]): Type of every contour, `bezier`
+            or `xspline`.
+        frame_size (tuple[int, int]): Width and height of the frames.
+
+    """
+    layer_name: str
+    frames: np.ndarray
+    points: np.ndarray
+    contour_offsets: np.ndarray
+    contour_types: list[str]
+    frame_size: tuple[int, int] = (0, 0)
+
+    def __len__(self) -> int:
+        """Return number of contours.
+
+        Returns:
+            int: Number of contours.
+
+        """
+        return len(self.contour_types)
+
+    def get_contour_points(self, index: int) -> np.ndarray:
+        """Return control points of the contour.
+
+        Args:
+            index (int): Index of the contour.
+
+        Returns:
+            np.ndarray: View of the points, shape (N, points, fields).
+
+        """
+        start, end = self.contour_offsets[index:index + 2]
+        return self.points[:, start:end]
+
+    def get_field(self, name: str) -> np.ndarray:
+        """Return one field of all points.
+
+        Args:
+            name (str): Field name from `POINT_FIELDS`.
+
+        Returns:
+            np.ndarray: View of the field, shape (N, P).
+
+        """
+        return self.points[..., FIELD_INDEX[name]]
+
+    def get_metadata(self) -> dict[str, Any]:
+        """Return metadata of the sampled data.
+
+        Returns:
+            dict[str, Any]: Metadata.
+
+        """
+        return {
+            "version": SHAPE_DATA_VERSION,
+            "layer": self.layer_name,
+            "frame_size": list(self.frame_size),
+            "fields": list(POINT_FIELDS),
+            "contour_types": list(self.contour_types),
+        }
+
+
+def get_contour_type(contour: object) -> str:
+    """Return type of the contour.
+
+    Args:
+        contour (object): Bezier or x-spline contour.
+
+    Returns:
+        str: `bezier` or `xspline`.
+
+    """
+    if type(contour).__name__ == "XSplineContour":
+        return CONTOUR_XSPLINE
+    return CONTOUR_BEZIER
+
+
+def fill_point_row(row: np.ndarray, point_data: object) -> None:
+    """Fill fields of one point from its point data.
+
+    Args:
+        row (np.ndarray): Row to fill, shape (len(POINT_FIELDS),).
+        point_data (object): `BezierControlPointData` or
+            `XControlPointData`.
+
+    """
+    row[0] = point_data.x
+    row[1] = point_data.y
+    if hasattr(point_data, "handle_offset_backward"):
+        row[2:4] = point_data.handle_offset_backward
+        row[4:6] = point_data.handle_offset_forward
+        row[6] = 0.0
+    else:
+        row[2:6] = 0.0
+        row[6] = point_data.weight
+    row[7] = point_data.edge_width
+    row[8] = point_data.edge_angle_ratio
+    row[9] = bool(point_data.corner)
+    row[10] = bool(point_data.active)
+
+
+def sample_contours(
+        layer: Layer,
+        frame_offset: int = 0,
+        frame_size: tuple[int, int] = (0, 0),
+        view: Optional[View] = None) -> ShapeData:
+    """Sample contours of the layer over its in/out range.
+
+    Contours and their control points are listed once, then every
+    frame reads point data directly to the preallocated array.
+
+    Args:
+        layer (Layer): Layer to sample.
+        frame_offset (int): Offset of the project frames, added
+            to the sampled times to get frame numbers.
+        frame_size (tuple[int, int]): Width and height of the frames.
+        view (Optional[View]): View to sample.
+
+    Returns:
+        ShapeData: Sampled data.
+
+    """
+    contours = list(layer.get_contours())
+    control_points = [list(contour.control_points) for contour in contours]
+    contour_offsets = np.zeros(len(contours) + 1, dtype=np.int64)
+    contour_offsets[1:] = np.cumsum([len(cps) for cps in control_points])
+    all_points = [point for cps in control_points for point in cps]
+
+    times = np.arange(int(layer.in_point()), int(layer.out_point()) + 1)
+    points = np.empty(
+        (len(times), len(all_points), len(POINT_FIELDS)), dtype=np.float64)
+    view_args = () if view is None else (view,)
+    for index, time in enumerate(times.tolist()):
+        frame_points = points[index]
+        for point_index, point in enumerate(all_points):
+            fill_point_row(
+                frame_points[point_index],
+                point.get_point_data(float(time), *view_args))
+
+    return ShapeData(
+        layer_name=layer.name,
+        frames=times + frame_offset,
+        points=points,
+        contour_offsets=contour_offsets,
+        contour_types=[get_contour_type(contour) for contour in contours],
+        frame_size=(int(frame_size[0]), int(frame_size[1])),
+    )
+
+
+def write_shape_data(
+        shape_data: ShapeData, path: Union[str, Path]) -> Path:
+    """Write the data to compressed `.npz` archive.
+
+    Args:
+        shape_data (ShapeData): Data to write.
+        path (Union[str, Path]): Output file path.
+
+    Returns:
+        Path: Written file.
+
+    """
+    path = Path(path)
+    with open(path, "wb") as stream:
+        np.savez_compressed(
+            stream,
+            metadata=np.array(json.dumps(shape_data.get_metadata())),
+            frames=shape_data.frames,
+            points=shape_data.points,
+            contour_offsets=shape_data.contour_offsets,
+        )
+    return path
+
+
+def read_shape_data(path: Union[str, Path]) -> ShapeData:
+    """Read the data written by `write_shape_data`.
+
+    Args:
+        path (Union[str, Path]): Path to `.npz` file.
+
+    Returns:
+        ShapeData: Read data.
+
+    Raises:
+        ValueError: If the fields of the points are not known.
+
+    """
+    with np.load(Path(path)) as archive:
+        metadata = json.loads(str(archive["metadata"]))
+        frames = archive["frames"]
+        points = archive["points"]
+        contour_offsets = archive["contour_offsets"]
+
+    if tuple(metadata["fields"]) != POINT_FIELDS:
+        msg = f"Unsupported point fields: {metadata['fields']}"
+        raise ValueError(msg)
+
+    return ShapeData(
+        layer_name=metadata["layer"],
+        frames=frames,
+        points=points.astype(np.float64),
+        contour_offsets=contour_offsets.astype(np.int64),
+        contour_types=list(metadata["contour_types"]),
+        frame_size=(
+            int(metadata["frame_size"][0]), int(metadata["frame_size"][1])),
+    )
+
+
+def rescale_shape_data(shape_data: ShapeData, scale: float) -> ShapeData:
+    """Return the data in frames scaled by the factor.
+
+    Positions, handles and edge widths are scaled, other fields
+    are kept.
+
+    Args:
+        shape_data (ShapeData): Data to rescale.
+        scale (float): Scale of the frames, like 2.0 for data created
+            on half resolution clip.
+
+    Returns:
+        ShapeData: Rescaled data.
+
+    """
+    factors = np.ones(len(POINT_FIELDS))
+    factors[:6] = scale
+    factors[FIELD_INDEX["edge_width"]] = scale
+    return dataclasses.replace(
+        shape_data,
+        points=shape_data.points * factors,
+        frame_size=(
+            round(shape_data.frame_size[0] * scale),
+            round(shape_data.frame_size[1] * scale),
+        ),
+    )
+
+
+def get_point_data_kwargs(
+        row: list[float], contour_type: str) -> dict[str, Any]:
+    """Return arguments of the control point data from one point.
+
+    This is the inverse of `fill_point_row`.
+
+    Args:
+        row (list[float]): Fields of the point.
+        contour_type (str): `bezier` or `xspline`.
+
+    Returns:
+        dict[str, Any]: Keyword arguments of `BezierControlPointData`
+            or `XControlPointData`.
+
+    """
+    kwargs: dict[str, Any] = {
+        "x": row[0],
+        "y": row[1],
+        "edge_width": row[7],
+        "edge_angle_ratio": row[8],
+        "corner": bool(row[9]),
+        "active": bool(row[10]),
+    }
+    if contour_type == CONTOUR_XSPLINE:
+        kwargs["weight"] = row[6]
+    else:
+        kwargs["handle_offset_backward"] = (row[2], row[3])
+        kwargs["handle_offset_forward"] = (row[4], row[5])
+    return kwargs
+
+
+def apply_shape_data(
+        layer: Layer,
+        shape_data: ShapeData,
+        point_data_types: dict[str, Callable[..., Any]],
+        frame_offset: int = 0,
+        view: Optional[View] = None) -> int:
+    """Create contours of the data in the layer.
+
+    Every contour is created from its points on the first frame, then
+    the points of every other frame are set on the contour at once.
+
+    Args:
+        layer (Layer): Layer to add the contours to.
+        shape_data (ShapeData): Data to apply.
+        point_data_types (dict[str, Callable[..., Any]]): Control point
+            data class of every contour type.
+        frame_offset (int): Offset of the project frames, subtracted
+            from the frame numbers to get project times.
+        view (Optional[View]): View to set.
+
+    Returns:
+        int: Number of the assigned control point keyframes.
+
+    """
+    times = (shape_data.frames - frame_offset).astype(np.float64).tolist()
+    if not times:
+        return 0
+    view_args = () if view is None else (view,)
+    count = 0
+    for index, contour_type in enumerate(shape_data.contour_types):
+        data_type = point_data_types[contour_type]
+        # (frames, points, fields), one list of rows per frame
+        frame_rows = shape_data.get_contour_points(index).tolist()
+        frame_points = [
+            [
+                data_type(**get_point_data_kwargs(row, contour_type))
+                for row in rows
+            ]
+            for rows in frame_rows
+        ]
+        add_contour = (
+            layer.add_xspline_contour
+            if contour_type == CONTOUR_XSPLINE
+            else layer.add_bezier_contour
+        )
+        contour = add_contour(times[0], frame_points[0], *view_args)
+        for time, points in zip(times[1:], frame_points[1:]):
+            contour.set_control_points(time, points, *view_args)
+        count += len(times) * len(frame_points[0])
+    return count
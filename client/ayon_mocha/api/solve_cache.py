@@ -0,0 +1,164 @@
+"""Cache of camera solve exports.
+
+Exporting camera solve is slow, while republishing often happens with
+the solve unchanged. Exported files are stored by fingerprint of the
+solve input (sampled layer data, parameters of the layer, project
+settings and exporter options) and reused while the fingerprint is the
+same. Mocha Pro API doesn't expose the solved camera itself, so the
+cache must be enabled only when the solve didn't change.
+
+Every cached export has a manifest with the file stem used in the
+export, so the files can be restored with a different stem.
+
+Note:
+    This module must not import `mocha` or anything that does.
+
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import shutil
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Optional
+
+if TYPE_CHECKING:
+    from .track_data import TrackData
+
+MANIFEST_NAME = "manifest.json"
+
+
+def get_solve_fingerprint(
+        track_data: TrackData, options: dict[str, Any]) -> str:
+    """Return fingerprint of the camera solve input.
+
+    Args:
+        track_data (TrackData): Sampled data of the solved layer.
+        options (dict[str, Any]): Other values affecting the export,
+            must be JSON serializable.
+
+    Returns:
+        str: Hex digest of the input.
+
+    """
+    digest = hashlib.sha256()
+    digest.update(json.dumps(
+        {**track_data.get_metadata(), "options": options},
+        sort_keys=True,
+    ).encode())
+    for array in (track_data.frames, track_data.transform, track_data.surface):
+        digest.update(array.tobytes())
+    return digest.hexdigest()
+
+
+def get_parameter_state(parameter_set: Any) -> dict[str, str]:  # noqa: ANN401
+    """Return values of all parameters in the parameter set tree.
+
+    Values and keyframes are converted to strings, so the state can
+    be part of the solve fingerprint.
+
+    Args:
+        parameter_set (Any): Mocha Pro parameter set (like `Layer.psets`).
+
+    Returns:
+        dict[str, str]: Parameter values by their full path.
+
+    """
+    state: dict[str, str] = {}
+    pending = [parameter_set]
+    while pending:
+        current = pending.pop()
+        for parameter in current.parameters:
+            state[str(parameter.full_path)] = (
+                f"{parameter.value!s}|{parameter.keyframes!s}")
+        pending.extend(current.subsets)
+    return state
+
+
+class SolveCache:
+    """Exported files by solve fingerprint and exporter."""
+
+    def __init__(self, root: Path) -> None:
+        """Initialize the cache.
+
+        Args:
+            root (Path): Cache directory.
+
+        """
+        self.root = root
+
+    def _get_entry_dir(self, fingerprint: str, exporter_id: str) -> Path:
+        """Return directory of the cached export.
+
+        Returns:
+            Path: Directory, might not exist.
+
+        """
+        return self.root / fingerprint[:2] / fingerprint / exporter_id[:16]
+
+    def store(
+            self,
+            fingerprint: str,
+            exporter_id: str,
+            stem: str,
+            files: list[Path]) -> None:
+        """Store the exported files.
+
+        Args:
+            fingerprint (str): Solve fingerprint.
+            exporter_id (str): Exporter id.
+            stem (str): File stem used in the export.
+            files (list[Path]): Exported files.
+
+        """
+        entry_dir = self._get_entry_dir(fingerprint, exporter_id)
+        entry_dir.mkdir(parents=True, exist_ok=True)
+        for file_path in files:
+            shutil.copy2(file_path, entry_dir / file_path.name)
+        # manifest is written last, entries without it are incomplete
+        (entry_dir / MANIFEST_NAME).write_text(
+            json.dumps({
+                "stem": stem,
+                "files": [file_path.name for file_path in files],
+            }),
+            encoding="utf-8",
+        )
+
+    def restore(
+            self,
+            fingerprint: str,
+            exporter_id: str,
+            stem: str,
+            destination: Path) -> Optional[list[Path]]:
+        """Copy cached files of the export to the destination.
+
+        Args:
+            fingerprint (str): Solve fingerprint.
+            exporter_id (str): Exporter id.
+            stem (str): File stem of the restored files.
+            destination (Path): Target directory.
+
+        Returns:
+            Optional[list[Path]]: Restored files or None if the export
+                is not cached.
+
+        """
+        entry_dir = self._get_entry_dir(fingerprint, exporter_id)
+        manifest_path = entry_dir / MANIFEST_NAME
+        if not manifest_path.exists():
+            return None
+        manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+        cached_stem: str = manifest["stem"]
+
+        restored = []
+        for name in manifest["files"]:
+            source = entry_dir / name
+            if not source.exists():
+                return None
+            target_name = (
+                stem + name[len(cached_stem):]
+                if name.startswith(cached_stem) else name
+            )
+            restored.append(
+                Path(shutil.copy2(source, destination / target_name)))
+        return restored
@@ -0,0 +1,345 @@
+"""Sampled tracking data of layers.
+
+Tracking of a layer is sampled once for its whole in/out range into
+NumPy arrays (`TrackData`). This canonical form is published next to
+the Mocha Pro exporter outputs, so other formats can be written from it
+without Mocha Pro, or applied back to a layer of another project.
+
+Sampled data can be stored as compressed `.npz` archive or as columnar
+JSON, where every value has its own column (list) over all frames.
+
+Note:
+    This module must not import `mocha` or anything that does, layers
+    are used only through their methods.
+
+"""
+from __future__ import annotations
+
+import dataclasses
+import json
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Optional, Union
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from mocha.project import Layer, View
+
+TRACK_DATA_VERSION = 1
+TRACK_DATA_FORMATS = ("npz", "json")
+TRANSFORM_COLUMNS = tuple(
+    f"t{row}{col}" for row in range(3) for col in range(3))
+SURFACE_COLUMNS = tuple(
+    f"s{corner}{axis}" for corner in range(4) for axis in ("x", "y"))
+# layer parameters receiving the data, in the order of the columns
+TRANSFORM_PARAMETERS = tuple(
+    ("Track", "Matrix", f"m{row}{col}")
+    for row in range(3) for col in range(3))
+SURFACE_PARAMETERS = tuple(
+    ("Surface", f"Corner{corner}", axis)
+    for corner in range(4) for axis in ("X", "Y"))
+
+
+@dataclasses.dataclass
+class TrackData:
+    """Tracking data of one layer.
+
+    Positions are in pixels of the clip, with origin in the top left
+    corner and Y axis pointing down.
+
+    Attributes:
+        layer_name (str): Name of the layer.
+        frames (np.ndarray): Frame numbers, shape (N,).
+        transform (np.ndarray): Transformation matrices, shape (N, 3, 3).
+        surface (np.ndarray): Surface corners (top left, top right,
+            bottom right, bottom left), shape (N, 4, 2).
+        frame_size (tuple[int, int]): Width and height of the frames.
+        frame_rate (float): Frame rate.
+
+    """
+    layer_name: str
+    frames: np.ndarray
+    transform: np.ndarray
+    surface: np.ndarray
+    frame_size: tuple[int, int] = (0, 0)
+    frame_rate: float = 0.0
+
+    def __len__(self) -> int:
+        """Return number of sampled frames.
+
+        Returns:
+            int: Number of frames.
+
+        """
+        return len(self.frames)
+
+    def get_metadata(self) -> dict[str, Any]:
+        """Return metadata of the sampled data.
+
+        Returns:
+            dict[str, Any]: Metadata.
+
+        """
+        return {
+            "version": TRACK_DATA_VERSION,
+            "layer": self.layer_name,
+            "frame_size": list(self.frame_size),
+            "frame_rate": self.frame_rate,
+        }
+
+
+def sample_layer(
+        layer: Layer,
+        frame_offset: int = 0,
+        frame_size: tuple[int, int] = (0, 0),
+        frame_rate: float = 0.0,
+        view: Optional[View] = None) -> TrackData:
+    """Sample tracking data of the layer over its in/out range.
+
+    Every frame is read just once, directly to preallocated arrays.
+
+    Args:
+        layer (Layer): Layer to sample.
+        frame_offset (int): Offset of the project frames, added
+            to the sampled times to get frame numbers.
+        frame_size (tuple[int, int]): Width and height of the frames.
+        frame_rate (float): Frame rate.
+        view (Optional[View]): View to sample.
+
+    Returns:
+        TrackData: Sampled data.
+
+    """
+    times = np.arange(int(layer.in_point()), int(layer.out_point()) + 1)
+    transform = np.empty((len(times), 3, 3), dtype=np.float64)
+    surface = np.empty((len(times), 4, 2), dtype=np.float64)
+    view_args = () if view is None else (view,)
+    for index, time in enumerate(times.tolist()):
+        transform[index] = np.reshape(
+            layer.get_transform_matrix(float(time), *view_args), (3, 3))
+        surface[index] = np.reshape(
+            layer.get_surface_position(float(time), *view_args), (4, 2))
+    return TrackData(
+        layer_name=layer.name,
+        frames=times + frame_offset,
+        transform=transform,
+        surface=surface,
+        frame_size=(int(frame_size[0]), int(frame_size[1])),
+        frame_rate=float(frame_rate),
+    )
+
+
+def to_columns(track_data: TrackData) -> dict[str, list]:
+    """Return the data as columns.
+
+    Returns:
+        dict[str, list]: Column name and its values over all frames.
+
+    """
+    columns: dict[str, list] = {"frame": track_data.frames.tolist()}
+    transform = track_data.transform.reshape(len(track_data), 9)
+    columns.update(zip(TRANSFORM_COLUMNS, transform.T.tolist()))
+    surface = track_data.surface.reshape(len(track_data), 8)
+    columns.update(zip(SURFACE_COLUMNS, surface.T.tolist()))
+    return columns
+
+
+def write_track_data(
+        track_data: TrackData,
+        path: Union[str, Path],
+        output_format: Optional[str] = None) -> Path:
+    """Write the data to the file.
+
+    Args:
+        track_data (TrackData): Data to write.
+        path (Union[str, Path]): Output file path.
+        output_format (Optional[str]): `npz` or `json`. If not set,
+            it is determined from the file extension.
+
+    Returns:
+        Path: Written file.
+
+    Raises:
+        ValueError: If the format is not supported.
+
+    """
+    path = Path(path)
+    output_format = (output_format or path.suffix.lstrip(".")).lower()
+    if output_format not in TRACK_DATA_FORMATS:
+        msg = f"Unsupported track data format: {output_format}"
+        raise ValueError(msg)
+
+    if output_format == "npz":
+        with open(path, "wb") as stream:
+            np.savez_compressed(
+                stream,
+                metadata=np.array(json.dumps(track_data.get_metadata())),
+                frames=track_data.frames,
+                transform=track_data.transform,
+                surface=track_data.surface,
+            )
+        return path
+
+    with open(path, "w", encoding="utf-8") as stream:
+        json.dump(
+            {**track_data.get_metadata(), "columns": to_columns(track_data)},
+            stream,
+            separators=(",", ":"),
+        )
+    return path
+
+
+def read_track_data(path: Union[str, Path]) -> TrackData:
+    """Read the data written by `write_track_data`.
+
+    Args:
+        path (Union[str, Path]): Path to `.npz` or `.json` file.
+
+    Returns:
+        TrackData: Read data.
+
+    """
+    path = Path(path)
+    if path.suffix.lower() == ".npz":
+        with np.load(path) as archive:
+            metadata = json.loads(str(archive["metadata"]))
+            frames = archive["frames"]
+            transform = archive["transform"]
+            surface = archive["surface"]
+    else:
+        with open(path, encoding="utf-8") as stream:
+            metadata = json.load(stream)
+        columns = metadata["columns"]
+        frames = np.asarray(columns["frame"], dtype=np.int64)
+        transform = np.column_stack(
+            [columns[name] for name in TRANSFORM_COLUMNS]
+        ).reshape(-1, 3, 3)
+        surface = np.column_stack(
+            [columns[name] for name in SURFACE_COLUMNS]
+        ).reshape(-1, 4, 2)
+
+    return TrackData(
+        layer_name=metadata["layer"],
+        frames=frames,
+        transform=transform.astype(np.float64),
+        surface=surface.astype(np.float64),
+        frame_size=(
+            int(metadata["frame_size"][0]), int(metadata["frame_size"][1])),
+        frame_rate=float(metadata["frame_rate"]),
+    )
+
+
+def rescale_track_data(track_data: TrackData, scale: float) -> TrackData:
+    """Return the data in frames scaled by the factor.
+
+    Used to get data tracked on lower resolution clip to the original
+    resolution. Transformation matrices are expected to transform
+    column vectors.
+
+    Args:
+        track_data (TrackData): Data to rescale.
+        scale (float): Scale of the frames, like 2.0 for data tracked
+            on half resolution clip.
+
+    Returns:
+        TrackData: Rescaled data.
+
+    """
+    scale_matrix = np.diag([scale, scale, 1.0])
+    inverse_matrix = np.diag([1.0 / scale, 1.0 / scale, 1.0])
+    return dataclasses.replace(
+        track_data,
+        transform=scale_matrix @ track_data.transform @ inverse_matrix,
+        surface=track_data.surface * scale,
+        frame_size=(
+            round(track_data.frame_size[0] * scale),
+            round(track_data.frame_size[1] * scale),
+        ),
+    )
+
+
+def get_parameter_keyframes(
+        track_data: TrackData,
+        frame_offset: int = 0,
+) -> tuple[list[float], dict[tuple[str, ...], list[float]]]:
+    """Return keyframes of the layer parameters.
+
+    Args:
+        track_data (TrackData): Data to apply.
+        frame_offset (int): Offset of the project frames, subtracted
+            from the frame numbers to get project times.
+
+    Returns:
+        tuple[list[float], dict[tuple[str, ...], list[float]]]: Project
+            times and values of every parameter at those times.
+
+    """
+    times = (track_data.frames - frame_offset).astype(np.float64).tolist()
+    transform = track_data.transform.reshape(len(track_data), 9)
+    surface = track_data.surface.reshape(len(track_data), 8)
+    values = dict(zip(TRANSFORM_PARAMETERS, transform.T.tolist()))
+    values.update(zip(SURFACE_PARAMETERS, surface.T.tolist()))
+    return times, values
+
+
+def get_missing_parameters(layer: Layer) -> list[tuple[str, ...]]:
+    """Return parameters receiving the track data missing on the layer.
+
+    Parameter paths aren't listed by the Mocha Pro Python API, so
+    they are looked up on the layer before any data are written.
+    Missing parameter is returned by Mocha Pro as null (falsy) object.
+
+    Args:
+        layer (Layer): Layer to check.
+
+    Returns:
+        list[tuple[str, ...]]: Paths of the missing parameters.
+
+    """
+    return [
+        path
+        for path in (*TRANSFORM_PARAMETERS, *SURFACE_PARAMETERS)
+        if not layer.parameter(list(path))
+    ]
+
+
+def apply_track_data(
+        layer: Layer,
+        track_data: TrackData,
+        frame_offset: int = 0,
+        view: Optional[View] = None) -> int:
+    """Set tracking of the layer from the data.
+
+    Keyframes of every parameter are assigned at once, replacing
+    the existing ones. Number of keyframes of the parameter is checked
+    after the assignment, so keyframes not accepted by Mocha Pro
+    aren't silently dropped.
+
+    Args:
+        layer (Layer): Layer to set.
+        track_data (TrackData): Data to apply.
+        frame_offset (int): Offset of the project frames, subtracted
+            from the frame numbers to get project times.
+        view (Optional[View]): View to set.
+
+    Returns:
+        int: Number of the assigned keyframes.
+
+    Raises:
+        ValueError: If the parameter doesn't have the assigned
+            keyframes.
+
+    """
+    times, values = get_parameter_keyframes(track_data, frame_offset)
+    view_args = () if view is None else (view,)
+    for path, parameter_values in values.items():
+        parameter = layer.parameter(list(path))
+        parameter.set_keyframes(
+            list(zip(times, parameter_values)), *view_args)
+        if len(parameter.keyframes) != len(times):
+            msg = (
+                f"Parameter {'/'.join(path)} has "
+                f"{len(parameter.keyframes)} keyframes "
+                f"instead of {len(times)}.")
+            raise ValueError(msg)
+    return len(times) * len(values)
@@ -0,0 +1,132 @@
+"""Differences between two versions of sampled tracking data.
+
+Versions are compared on the frames they share, displacement of the
+frame is the largest distance any surface corner moved. Frames where
+the displacement exceeds the tolerance, or which exist only in one of
+the versions, are reported as changed frame ranges.
+
+Note:
+    This module must not import `mocha` or anything that does.
+
+"""
+from __future__ import annotations
+
+import dataclasses
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from .track_data import TrackData
+
+DEFAULT_TOLERANCE = 0.01
+
+
+@dataclasses.dataclass
+class TrackDiff:
+    """Difference of the new tracking data from the old one.
+
+    Attributes:
+        frames (np.ndarray): Frames of both versions, shape (N,).
+        displacement (np.ndarray): Largest corner displacement on the
+            frame, NaN where the frame is only in one version,
+            shape (N,).
+        added_frames (np.ndarray): Frames only in the new version.
+        removed_frames (np.ndarray): Frames only in the old version.
+        tolerance (float): Smallest displacement considered a change.
+
+    """
+    frames: np.ndarray
+    displacement: np.ndarray
+    added_frames: np.ndarray
+    removed_frames: np.ndarray
+    tolerance: float = DEFAULT_TOLERANCE
+
+    @property
+    def changed_frames(self) -> np.ndarray:
+        """Frames moved over the tolerance, added or removed."""
+        changed = np.isnan(self.displacement) | (
+            np.nan_to_num(self.displacement) > self.tolerance)
+        return self.frames[changed]
+
+    @property
+    def max_displacement(self) -> float:
+        """Largest displacement on the common frames."""
+        if np.isnan(self.displacement).all():
+            return 0.0
+        return float(np.nanmax(self.displacement))
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return compact report of the difference.
+
+        Returns:
+            dict[str, Any]: Changed frame ranges and displacement
+                summary, serializable to JSON.
+
+        """
+        report: dict[str, Any] = {
+            "changed_ranges": get_frame_ranges(self.changed_frames),
+            "added_ranges": get_frame_ranges(self.added_frames),
+            "removed_ranges": get_frame_ranges(self.removed_frames),
+            "changed_frame_count": len(self.changed_frames),
+            "max_displacement": self.max_displacement,
+            "tolerance": self.tolerance,
+        }
+        if self.max_displacement > 0.0:
+            report["max_displacement_frame"] = int(
+                self.frames[np.nanargmax(self.displacement)])
+        return report
+
+
+def get_frame_ranges(frames: np.ndarray) -> list[list[int]]:
+    """Return ranges of consecutive frames.
+
+    Args:
+        frames (np.ndarray): Sorted unique frame numbers.
+
+    Returns:
+        list[list[int]]: First and last frame of every range.
+
+    """
+    frames = np.asarray(frames, dtype=np.int64)
+    if not len(frames):
+        return []
+    breaks = np.flatnonzero(np.diff(frames) != 1)
+    starts = frames[np.concatenate(([0], breaks + 1))]
+    ends = frames[np.concatenate((breaks, [len(frames) - 1]))]
+    return np.column_stack((starts, ends)).tolist()
+
+
+def diff_track_data(
+        old: TrackData,
+        new: TrackData,
+        tolerance: float = DEFAULT_TOLERANCE) -> TrackDiff:
+    """Compare two versions of the tracking data.
+
+    Args:
+        old (TrackData): Previously published data.
+        new (TrackData): Newly published data.
+        tolerance (float): Smallest displacement in pixels considered
+            a change.
+
+    Returns:
+        TrackDiff: Difference of the new data.
+
+    """
+    frames = np.union1d(old.frames, new.frames)
+    common, old_index, new_index = np.intersect1d(
+        old.frames, new.frames, assume_unique=True, return_indices=True)
+
+    displacement = np.full(len(frames), np.nan)
+    distances = np.linalg.norm(
+        new.surface[new_index] - old.surface[old_index], axis=2)
+    displacement[np.searchsorted(frames, common)] = distances.max(axis=1)
+
+    return TrackDiff(
+        frames=frames,
+        displacement=displacement,
+        added_frames=np.setdiff1d(new.frames, old.frames, assume_unique=True),
+        removed_frames=np.setdiff1d(
+            old.frames, new.frames, assume_unique=True),
+        tolerance=tolerance,
+    )
@@ -0,0 +1,350 @@
+"""Write tracking formats from sampled track data.
+
+Most used tracking formats are plain text over the corner positions
+of the layer surface. Once the layer is sampled into `TrackData`, they
+are written here without calling Mocha Pro exporters, so all selected
+formats are produced from one sample pass.
+
+Writers are registered by short names of `EXPORTER_MAPPING`, so they
+replace exporters with the same representation name. Values are
+formatted for all frames at once with `numpy.char`.
+
+Note:
+    This module must not import `mocha` or anything that does.
+
+"""
+from __future__ import annotations
+
+import dataclasses
+from pathlib import Path
+from typing import TYPE_CHECKING, Callable, Optional, Union
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from .track_data import TrackData
+
+# surface corners in the order of `TrackData.surface`
+CORNER_NAMES = ("TopLeft", "TopRight", "BottomRight", "BottomLeft")
+NUMBER_FORMAT = "%.6f"
+
+# After Effects Corner Pin lists corners in different order
+AFX_CORNERS = (
+    ("Upper Left", 0),
+    ("Upper Right", 1),
+    ("Lower Left", 3),
+    ("Lower Right", 2),
+)
+NUKE_TRACKER_COLUMNS = (
+    "{ 5 1 20 enable e 1 }",
+    "{ 3 1 75 name name 1 }",
+    "{ 2 1 58 track_x track_x 1 }",
+    "{ 2 1 58 track_y track_y 1 }",
+    "{ 2 1 63 offset_x offset_x 1 }",
+    "{ 2 1 63 offset_y offset_y 1 }",
+    "{ 4 1 27 T T 1 }",
+    "{ 4 1 27 R R 1 }",
+    "{ 4 1 27 S S 1 }",
+    "{ 2 0 45 error error 1 }",
+    "{ 1 1 0 error_min error_min 1 }",
+    "{ 1 1 0 error_max error_max 1 }",
+    "{ 1 1 0 pattern_x pattern_x 1 }",
+    "{ 1 1 0 pattern_y pattern_y 1 }",
+    "{ 1 1 0 pattern_r pattern_r 1 }",
+    "{ 1 1 0 pattern_t pattern_t 1 }",
+    "{ 1 1 0 search_x search_x 1 }",
+    "{ 1 1 0 search_y search_y 1 }",
+    "{ 1 1 0 search_r search_r 1 }",
+    "{ 1 1 0 search_t search_t 1 }",
+    "{ 2 1 0 key_track key_track 1 }",
+    "{ 2 1 0 key_search_x key_search_x 1 }",
+    "{ 2 1 0 key_search_y key_search_y 1 }",
+    "{ 2 1 0 key_search_r key_search_r 1 }",
+    "{ 2 1 0 key_search_t key_search_t 1 }",
+    "{ 2 1 0 key_track_x key_track_x 1 }",
+    "{ 2 1 0 key_track_y key_track_y 1 }",
+    "{ 2 1 0 key_track_r key_track_r 1 }",
+    "{ 2 1 0 key_track_t key_track_t 1 }",
+    "{ 2 1 0 key_centre_offset_x key_centre_offset_x 1 }",
+    "{ 2 1 0 key_centre_offset_y key_centre_offset_y 1 }",
+)
+# values of Nuke tracker columns after the track position
+NUKE_TRACK_DEFAULTS = (
+    "{curve K x1 0} {curve K x1 0} 1 1 1 {curve x1 0} 0 0 "
+    "-22 -22 22 22 -32 -32 32 32 {} {} {} {} {} {} {} {} {} {} {}"
+)
+
+
+@dataclasses.dataclass(frozen=True)
+class TrackWriter:
+    """Writer of one tracking format."""
+    short_name: str
+    extension: str
+    format: Callable[[TrackData], str]
+
+
+def format_numbers(values: np.ndarray) -> np.ndarray:
+    """Format numbers without trailing zeros.
+
+    Args:
+        values (np.ndarray): Numbers to format.
+
+    Returns:
+        np.ndarray: Formatted numbers, same shape as values.
+
+    """
+    # avoid negative zero like -0.000000
+    values = np.where(np.isclose(values, 0.0, atol=5e-7), 0.0, values)
+    strings = np.char.mod(NUMBER_FORMAT, values)
+    return np.char.rstrip(np.char.rstrip(strings, "0"), ".")
+
+
+def join_columns(columns: list[np.ndarray], separator: str) -> np.ndarray:
+    """Join string columns to rows.
+
+    Args:
+        columns (list[np.ndarray]): Columns of the same length.
+        separator (str): Separator of the values.
+
+    Returns:
+        np.ndarray: Joined rows.
+
+    """
+    rows = columns[0]
+    for column in columns[1:]:
+        rows = np.char.add(np.char.add(rows, separator), column)
+    return rows
+
+
+def _get_frame_size(track_data: TrackData) -> tuple[int, int]:
+    """Return frame size needed by the format.
+
+    Returns:
+        tuple[int, int]: Width and height.
+
+    Raises:
+        ValueError: If frame size is not known.
+
+    """
+    width, height = track_data.frame_size
+    if not width or not height:
+        msg = f"Frame size of {track_data.layer_name} is not known."
+        raise ValueError(msg)
+    return width, height
+
+
+def is_sampled_per_frame(track_data: TrackData) -> bool:
+    """Return whether the data have a sample on every frame.
+
+    Data reduced to keyframes need to be written with linear
+    interpolation in formats where it is not the default.
+
+    Returns:
+        bool: True if there are no gaps between the frames.
+
+    """
+    return bool(np.all(np.diff(track_data.frames) == 1))
+
+
+def format_afx_corner_pin(track_data: TrackData) -> str:
+    """Return After Effects Corner Pin keyframe data.
+
+    Args:
+        track_data (TrackData): Sampled data.
+
+    Returns:
+        str: Keyframe data.
+
+    """
+    width, height = _get_frame_size(track_data)
+    frames = track_data.frames.astype(str)
+    lines = [
+        "Adobe After Effects 6.0 Keyframe Data",
+        "",
+        f"\tUnits Per Second\t{track_data.frame_rate:g}",
+        f"\tSource Width\t{width}",
+        f"\tSource Height\t{height}",
+        "\tSource Pixel Aspect Ratio\t1",
+        "\tComp Pixel Aspect Ratio\t1",
+        "",
+    ]
+    for index, (corner_name, corner) in enumerate(AFX_CORNERS, start=2):
+        positions = format_numbers(track_data.surface[:, corner])
+        rows = join_columns(
+            ["", frames, positions[:, 0], positions[:, 1], ""], "\t")
+        lines.extend([
+            f"Effects\tCorner Pin #1\t{corner_name} #{index}",
+            "\tFrame\tX pixels\tY pixels\t",
+            *rows.tolist(),
+            "",
+        ])
+    lines.extend(["", "End of Keyframe Data", ""])
+    return "\n".join(lines)
+
+
+def format_nuke_tracker(track_data: TrackData) -> str:
+    """Return Nuke 7+ Tracker node with a track for each corner.
+
+    Nuke has origin in the bottom left corner, so Y axis is flipped.
+    Keyframes of reduced data are linearly interpolated.
+
+    Args:
+        track_data (TrackData): Sampled data.
+
+    Returns:
+        str: Nuke script with Tracker4 node.
+
+    """
+    _, height = _get_frame_size(track_data)
+    interpolation = "" if is_sampled_per_frame(track_data) else "L "
+    frames = np.char.add("x", track_data.frames.astype(str))
+    positions = track_data.surface.copy()
+    positions[..., 1] = height - positions[..., 1]
+    positions = format_numbers(positions)
+
+    tracks = []
+    for corner, corner_name in enumerate(CORNER_NAMES):
+        curves = [
+            " ".join(
+                join_columns([frames, positions[:, corner, axis]], " "
+            ).tolist())
+            for axis in range(2)
+        ]
+        tracks.append(
+            f' {{ {{curve K x1 1}} "{corner_name}" '
+            f"{{curve {interpolation}{curves[0]}}} "
+            f"{{curve {interpolation}{curves[1]}}} "
+            f"{NUKE_TRACK_DEFAULTS} }}")
+
+    lines = [
+        "Tracker4 {",
+        f" tracks {{ {{ 1 31 {len(CORNER_NAMES)} }}",
+        "{ " + "\n".join(NUKE_TRACKER_COLUMNS),
+        "}",
+        "{",
+        *tracks,
+        "}",
+        "}",
+        f" name {track_data.layer_name.replace(' ', '_')}_Tracker",
+        "}",
+        "",
+    ]
+    return "\n".join(lines)
+
+
+def format_fusion_comp(track_data: TrackData) -> str:
+    """Return Fusion composition with animated Corner Positioner.
+
+    Fusion uses positions relative to the frame size with origin
+    in the bottom left corner.
+    Keyframes of reduced data are linearly interpolated.
+
+    Args:
+        track_data (TrackData): Sampled data.
+
+    Returns:
+        str: Fusion composition.
+
+    """
+    width, height = _get_frame_size(track_data)
+    name = track_data.layer_name.replace(" ", "_")
+    keys = np.char.add(
+        np.char.add("\t\t\t\t[", track_data.frames.astype(str)), "] = { ")
+    positions = track_data.surface / (width, height)
+    positions[..., 1] = 1.0 - positions[..., 1]
+    positions = format_numbers(positions)
+    key_end = (
+        " },"
+        if is_sampled_per_frame(track_data)
+        else ", Flags = { Linear = true } },"
+    )
+
+    inputs = [
+        f'\t\t\t\t{corner_name} = Input {{ SourceOp = "{name}{corner_name}",'
+        ' Source = "Value", },'
+        for corner_name in CORNER_NAMES
+    ]
+    lines = [
+        "{",
+        "\tTools = ordered() {",
+        f"\t\t{name}CornerPositioner = CornerPositioner {{",
+        "\t\t\tInputs = {",
+        *inputs,
+        "\t\t\t},",
+        "\t\t},",
+    ]
+    for corner, corner_name in enumerate(CORNER_NAMES):
+        lines.extend([
+            f"\t\t{name}{corner_name} = XYPath {{",
+            "\t\t\tInputs = {",
+            *(
+                f'\t\t\t\t{axis_name} = Input {{ SourceOp = '
+                f'"{name}{corner_name}{axis_name}", Source = "Value", }},'
+                for axis_name in ("X", "Y")
+            ),
+            "\t\t\t},",
+            "\t\t},",
+        ])
+        for axis, axis_name in enumerate(("X", "Y")):
+            rows = np.char.add(
+                np.char.add(keys, positions[:, corner, axis]), key_end)
+            lines.extend([
+                f"\t\t{name}{corner_name}{axis_name} = BezierSpline {{",
+                "\t\t\tKeyFrames = {",
+                *rows.tolist(),
+                "\t\t\t},",
+                "\t\t},",
+            ])
+    lines.extend(["\t},", "}", ""])
+    return "\n".join(lines)
+
+
+WRITERS: dict[str, TrackWriter] = {
+    writer.short_name: writer
+    for writer in (
+        TrackWriter("AfxCornerPin", "txt", format_afx_corner_pin),
+        TrackWriter("Nuke7Tracker", "nk", format_nuke_tracker),
+        TrackWriter("FusionCompData", "comp", format_fusion_comp),
+    )
+}
+
+
+def get_track_writer(short_name: str) -> Optional[TrackWriter]:
+    """Return writer of the format.
+
+    Args:
+        short_name (str): Short name of the exporter.
+
+    Returns:
+        Optional[TrackWriter]: Writer if the format is supported.
+
+    """
+    return WRITERS.get(short_name)
+
+
+def write_track_file(
+        track_data: TrackData,
+        short_name: str,
+        path: Union[str, Path]) -> Path:
+    """Write the data in the format of the exporter.
+
+    Args:
+        track_data (TrackData): Sampled data.
+        short_name (str): Short name of the exporter.
+        path (Union[str, Path]): Output file path without extension.
+
+    Returns:
+        Path: Written file.
+
+    Raises:
+        ValueError: If the format is not supported.
+
+    """
+    writer = get_track_writer(short_name)
+    if writer is None:
+        msg = f"No track writer for {short_name}."
+        raise ValueError(msg)
+    path = Path(f"{path}.{writer.extension}")
+    with open(path, "w", encoding="utf-8", newline="\n") as stream:
+        stream.write(writer.format(track_data))
+    return path
@@ -0,0 +1,139 @@
+"""Coalesced refreshing of Mocha Pro UI.
+
+Note:
+    This module must not import `mocha` or anything that does.
+
+"""
+from __future__ import annotations
+
+import logging
+import time
+from contextlib import contextmanager
+from typing import Generator, Optional
+
+from qtpy.QtCore import QTimer
+from qtpy.QtWidgets import QApplication
+
+log = logging.getLogger("ayon_mocha.ui_refresh")
+
+
+class UIRefreshScheduler:
+    """Coalesce UI refresh requests.
+
+    Pumping Qt events after every change is slow in bulk operations
+    and can re-enter AYON code in the middle of them. Requests
+    are coalesced so events are processed at most once per `interval`
+    milliseconds, the last request is handled by a single-shot timer.
+    Inside `suppressed()` block no events are processed at all and
+    one refresh is done when the block ends.
+
+    Number of requests and of actual refreshes is counted, so the
+    effect of coalescing can be checked (see `get_stats()`).
+
+    Attributes:
+        interval (int): Minimal time between refreshes in milliseconds.
+        requested (int): Number of refresh requests.
+        pumped (int): Number of times Qt events were processed.
+
+    """
+
+    def __init__(self, interval: int = 100) -> None:
+        """Initialize the scheduler.
+
+        Args:
+            interval (int): Minimal time between refreshes
+                in milliseconds.
+
+        """
+        self.interval = interval
+        self.requested = 0
+        self.pumped = 0
+        self._suppress_depth = 0
+        self._pending = False
+        self._last_pump = 0.0
+        self._timer: Optional[QTimer] = None
+
+    def request(self) -> None:
+        """Request UI refresh."""
+        self.requested += 1
+        self._schedule()
+
+    def get_stats(self) -> dict[str, int]:
+        """Return refresh counters.
+
+        Returns:
+            dict[str, int]: Number of requests and actual refreshes.
+
+        """
+        return {"requested": self.requested, "pumped": self.pumped}
+
+    @contextmanager
+    def suppressed(self) -> Generator[None, None, None]:
+        """Suppress UI refreshes inside the block.
+
+        Yields:
+            None
+
+        """
+        self._suppress_depth += 1
+        try:
+            yield
+        finally:
+            self._suppress_depth -= 1
+            if not self._suppress_depth:
+                if self._pending:
+                    self._schedule()
+                log.debug("UI refresh stats: %s", self.get_stats())
+
+    def _schedule(self) -> None:
+        """Refresh now or schedule the refresh."""
+        self._pending = True
+        if self._suppress_depth or QApplication.instance() is None:
+            return
+        elapsed = (time.monotonic() - self._last_pump) * 1000
+        if elapsed >= self.interval:
+            self._pump()
+            return
+        if self._timer is None:
+            self._timer = QTimer()
+            self._timer.setSingleShot(True)
+            self._timer.timeout.connect(self._on_timeout)
+        if not self._timer.isActive():
+            self._timer.start(int(self.interval - elapsed))
+
+    def _on_timeout(self) -> None:
+        """Handle the scheduled refresh."""
+        if self._pending and not self._suppress_depth:
+            self._pump()
+
+    def _pump(self) -> None:
+        """Process pending Qt events."""
+        if self._timer is not None:
+            self._timer.stop()
+        self._pending = False
+        self._last_pump = time.monotonic()
+        self.pumped += 1
+        QApplication.processEvents()
+
+
+UI_REFRESH_SCHEDULER = UIRefreshScheduler()
+
+
+def update_ui() -> None:
+    """Request the UI update.
+
+    See `UIRefreshScheduler` for details.
+    """
+    UI_REFRESH_SCHEDULER.request()
+
+
+@contextmanager
+def suppress_ui_refresh() -> Generator[None, None, None]:
+    """Don't update the UI until the end of the block.
+
+    Yields:
+        None
+
+    """
+    with UI_REFRESH_SCHEDULER.suppressed():
+        yield
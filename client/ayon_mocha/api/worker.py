@@ -0,0 +1,333 @@
+"""Run long host operations without blocking Mocha Pro UI.
+
+Mocha Pro API must be called from the UI thread, so long operations
+are split into steps run one by one from the Qt event loop by
+`HostTask`. Between the steps Qt can process user input and repaint,
+progress is reported with Qt signals. Work that doesn't touch Mocha
+Pro API (like writing exported files) can run in background threads
+with `run_in_background`.
+
+User input is processed while a task runs, so artists can scrub
+and inspect the project. AYON actions that would start another host
+operation (create, load, publish, workfiles) are disabled while
+`TASK_MONITOR` is busy.
+
+Without Qt application (headless mode) all steps run directly.
+"""
+from __future__ import annotations
+
+import logging
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, Callable, Iterator, Optional
+
+from qtpy import QtCore
+
+if TYPE_CHECKING:
+    from mocha.project import ProgressWatcher
+
+log = logging.getLogger("ayon_mocha.worker")
+
+_EXECUTOR: Optional[ThreadPoolExecutor] = None
+
+
+class TaskCancelledError(Exception):
+    """Raised when waiting for a task that was cancelled."""
+
+
+class TaskMonitor(QtCore.QObject):
+    """Keep track of running host tasks.
+
+    `busy_changed` is emitted when the first task starts and when
+    the last one finishes.
+    """
+    busy_changed = QtCore.Signal(bool)
+
+    def __init__(self) -> None:
+        """Initialize the monitor."""
+        super().__init__()
+        self._tasks: set[HostTask] = set()
+
+    @property
+    def is_busy(self) -> bool:
+        """Whether any host task is running."""
+        return bool(self._tasks)
+
+    def add(self, task: HostTask) -> None:
+        """Register started task."""
+        was_busy = self.is_busy
+        self._tasks.add(task)
+        if not was_busy:
+            self.busy_changed.emit(True)  # noqa: FBT003
+
+    def discard(self, task: HostTask) -> None:
+        """Unregister finished task."""
+        if task not in self._tasks:
+            return
+        self._tasks.discard(task)
+        if not self._tasks:
+            self.busy_changed.emit(False)  # noqa: FBT003
+
+
+class HostTask(QtCore.QObject):
+    """Run host operation in steps from the Qt event loop.
+
+    Operation is a generator, every `yield` ends one step and can
+    pass a progress message. Value returned by the generator is the
+    result of the task.
+
+    Example::
+
+        def export(layers):
+            for layer in layers:
+                export_layer(layer)
+                yield f"Exported {layer.name}"
+            return True
+
+        task = HostTask(export(layers), total=len(layers))
+        task.progress.connect(progress_bar.setValue)
+        result = task.wait()
+
+    """
+    started = QtCore.Signal()
+    progress = QtCore.Signal(int, int)
+    message = QtCore.Signal(str)
+    finished = QtCore.Signal(object)
+    failed = QtCore.Signal(str)
+
+    def __init__(
+            self,
+            operation: Iterator[Optional[str]],
+            total: int = 0,
+            label: str = "",
+            parent: Optional[QtCore.QObject] = None) -> None:
+        """Initialize the task.
+
+        Args:
+            operation (Iterator[Optional[str]]): Operation generator.
+            total (int): Expected number of steps.
+            label (str): Label of the task used in logs.
+            parent (Optional[QtCore.QObject]): Parent object.
+
+        """
+        super().__init__(parent)
+        self._operation = operation
+        self._total = total
+        self._label = label
+        self._done = 0
+        self._running = False
+        self._cancelled = False
+        self._result: Any = None
+        self._error: Optional[BaseException] = None
+        self._connections: list[tuple[Any, Callable]] = []
+
+    @property
+    def is_running(self) -> bool:
+        """Whether the task is running."""
+        return self._running
+
+    @property
+    def result(self) -> Any:  # noqa: ANN401
+        """Result of the finished task."""
+        return self._result
+
+    def start(self) -> None:
+        """Start the task from the event loop."""
+        if self._running:
+            return
+        self._mark_running()
+        self.started.emit()
+        QtCore.QTimer.singleShot(0, self._run_step)
+
+    def cancel(self) -> None:
+        """Cancel the task before the next step."""
+        self._cancelled = True
+
+    def wait(self) -> Any:  # noqa: ANN401
+        """Run the task and wait for its result.
+
+        Nested event loop keeps UI responsive between the steps,
+        so this can be used where the caller needs the result
+        synchronously (like publish plugins). User input is processed
+        by the nested loop, actions starting other host operations
+        are guarded by `TASK_MONITOR`.
+        Exception raised by the operation is re-raised here,
+        `TaskCancelledError` is raised if the task was cancelled.
+
+        Returns:
+            Any: Result of the task.
+
+        """
+        if QtCore.QCoreApplication.instance() is None:
+            self._mark_running()
+            while self._running:
+                self._run_step()
+        else:
+            loop = QtCore.QEventLoop()
+            self.finished.connect(loop.quit)
+            self.failed.connect(loop.quit)
+            self.start()
+            if self._running:
+                loop.exec_()
+        if self._error is not None:
+            raise self._error
+        return self._result
+
+    def watch(self, watcher: ProgressWatcher) -> None:
+        """Report progress of Mocha Pro operation as task messages.
+
+        Args:
+            watcher (ProgressWatcher): Progress watcher of Mocha Pro
+                project, clip or render operation.
+
+        """
+        def _on_message(*args: Any) -> None:  # noqa: ANN401
+            self.message.emit(" ".join(map(str, args)))
+
+        watcher.progress_message.connect(_on_message)
+        self._connections.append((watcher.progress_message, _on_message))
+
+    def _disconnect(self) -> None:
+        """Disconnect from watched progress watchers."""
+        for signal, slot in self._connections:
+            signal.disconnect(slot)
+        self._connections.clear()
+
+    def _run_step(self) -> None:
+        """Run one step of the operation and schedule the next one."""
+        if self._cancelled:
+            self._operation.close()
+            msg = f"Task {self._label} was cancelled."
+            self._error = TaskCancelledError(msg)
+            self._finish(None)
+            return
+        try:
+            message = next(self._operation)
+        except StopIteration as result:
+            self._finish(result.value)
+            return
+        except Exception as exc:
+            self._error = exc
+            self._mark_stopped()
+            self._disconnect()
+            log.debug("Task %s failed", self._label, exc_info=True)
+            self.failed.emit(str(exc))
+            return
+
+        self._done += 1
+        self.progress.emit(self._done, self._total)
+        if message:
+            self.message.emit(message)
+        if QtCore.QCoreApplication.instance() is not None:
+            QtCore.QTimer.singleShot(0, self._run_step)
+
+    def _finish(self, result: Any) -> None:  # noqa: ANN401
+        """Finish the task with the result."""
+        self._result = result
+        self._mark_stopped()
+        self._disconnect()
+        self.finished.emit(result)
+
+    def _mark_running(self) -> None:
+        """Set the task running and register it in the monitor."""
+        self._running = True
+        TASK_MONITOR.add(self)
+
+    def _mark_stopped(self) -> None:
+        """Set the task stopped and unregister it from the monitor."""
+        self._running = False
+        TASK_MONITOR.discard(self)
+
+
+TASK_MONITOR = TaskMonitor()
+
+
+class _MainThreadInvoker(QtCore.QObject):
+    """Call functions in the thread this object lives in."""
+    invoke = QtCore.Signal(object)
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.invoke.connect(self._on_invoke, QtCore.Qt.QueuedConnection)
+
+    @QtCore.Slot(object)
+    def _on_invoke(self, func: Callable[[], None]) -> None:  # noqa: PLR6301
+        func()
+
+
+_INVOKER: Optional[_MainThreadInvoker] = None
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    """Return shared executor for background work.
+
+    Returns:
+        ThreadPoolExecutor: Executor.
+
+    """
+    global _EXECUTOR  # noqa: PLW0603
+    if _EXECUTOR is None:
+        _EXECUTOR = ThreadPoolExecutor(
+            max_workers=4, thread_name_prefix="ayon_mocha")
+    return _EXECUTOR
+
+
+def _get_invoker() -> Optional[_MainThreadInvoker]:
+    """Return invoker living in the main thread.
+
+    Returns:
+        Optional[_MainThreadInvoker]: Invoker or None if there is
+            no Qt application.
+
+    """
+    global _INVOKER  # noqa: PLW0603
+    app = QtCore.QCoreApplication.instance()
+    if app is None:
+        return None
+    if _INVOKER is None:
+        _INVOKER = _MainThreadInvoker()
+        _INVOKER.moveToThread(app.thread())
+    return _INVOKER
+
+
+def call_in_main_thread(func: Callable[[], None]) -> None:
+    """Call function from the Qt event loop of the main thread.
+
+    Can be called from any thread. Without Qt application
+    the function is called directly.
+
+    Args:
+        func (Callable[[], None]): Function to call.
+
+    """
+    invoker = _get_invoker()
+    if invoker is None:
+        func()
+        return
+    invoker.invoke.emit(func)
+
+
+def run_in_background(
+        func: Callable[..., Any],
+        *args: Any,  # noqa: ANN401
+        on_done: Optional[Callable[[Future], None]] = None) -> Future:
+    """Run function in a background thread.
+
+    Function must not call Mocha Pro API.
+
+    Args:
+        func (Callable[..., Any]): Function to run.
+        *args (Any): Arguments for the function.
+        on_done (Optional[Callable[[Future], None]]): Callback called
+            with the finished future in the main thread.
+
+    Returns:
+        Future: Future of the function result.
+
+    """
+    # make sure the invoker is created from the main thread
+    _get_invoker()
+    future = _get_executor().submit(func, *args)
+    if on_done is not None:
+        future.add_done_callback(
+            lambda done: call_in_main_thread(lambda: on_done(done)))
+    return future
@@ -0,0 +1,198 @@
+"""Scan Mocha Pro workfiles for AYON metadata.
+
+Workfiles are read with the offline project reader, so the scan
+doesn't need Mocha Pro. Files are processed in parallel in a process
+pool and the result can be written as JSON or CSV index of loaded
+containers and publish instances.
+
+Note:
+    This module must not import `mocha` or anything that does.
+
+"""
+from __future__ import annotations
+
+import csv
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Iterable, Iterator, Optional
+
+from .project_reader import read_workfile_metadata
+
+WORKFILE_EXTENSION = ".mocha"
+INDEX_FORMATS = ("json", "csv")
+CSV_FIELDS = (
+    "workfile",
+    "folder_path",
+    "task",
+    "kind",
+    "name",
+    "plugin",
+    "representation",
+    "version",
+    "product_type",
+    "error",
+)
+
+
+def find_workfiles(root: Path) -> Iterator[Path]:
+    """Find all workfiles under the root directory.
+
+    Args:
+        root (Path): Root directory.
+
+    Yields:
+        Path: Path to the workfile.
+
+    """
+    for dir_path, _, file_names in os.walk(root):
+        for file_name in file_names:
+            if file_name.lower().endswith(WORKFILE_EXTENSION):
+                yield Path(dir_path) / file_name
+
+
+def scan_workfile(path: Path) -> dict:
+    """Scan single workfile.
+
+    Files that cannot be read, like truncated compressed workfiles,
+    are recorded with the error, so one bad file doesn't stop the scan.
+
+    Args:
+        path (Path): Path to the workfile.
+
+    Returns:
+        dict: Index record of the workfile.
+
+    """
+    record: dict = {
+        "workfile": path.as_posix(),
+        "context": {},
+        "containers": [],
+        "publish_instances": [],
+        "error": None,
+    }
+    try:
+        metadata = read_workfile_metadata(path)
+    except (OSError, EOFError, ValueError) as exc:
+        record["error"] = str(exc) or type(exc).__name__
+        return record
+
+    record["context"] = {
+        "folderPath": metadata.folder_path,
+        "task": metadata.task_name,
+    }
+    record["containers"] = [
+        {
+            "name": container.get("name"),
+            "loader": container.get("loader"),
+            "representation": container.get("representation"),
+            "version": container.get("version"),
+        }
+        for container in metadata.containers
+    ]
+    record["publish_instances"] = [
+        {
+            "productName": instance.get("productName"),
+            "productType": instance.get("productType"),
+            "creator_identifier": instance.get("creator_identifier"),
+            "active": instance.get("active", True),
+        }
+        for instance in metadata.publish_instances
+    ]
+    return record
+
+
+def scan_workfiles(
+        paths: Iterable[Path],
+        max_workers: Optional[int] = None) -> list[dict]:
+    """Scan workfiles in parallel.
+
+    Args:
+        paths (Iterable[Path]): Paths to the workfiles.
+        max_workers (Optional[int]): Number of worker processes.
+            Defaults to number of CPUs.
+
+    Returns:
+        list[dict]: Index records in the same order as paths.
+
+    """
+    paths = list(paths)
+    if not paths:
+        return []
+    workers = max_workers or os.cpu_count() or 1
+    chunk_size = max(1, len(paths) // (workers * 4))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(
+            executor.map(scan_workfile, paths, chunksize=chunk_size))
+
+
+def _iter_csv_rows(records: Iterable[dict]) -> Iterator[dict]:
+    """Flatten index records to CSV rows.
+
+    Yields:
+        dict: One row per container or publish instance.
+
+    """
+    for record in records:
+        base = {
+            "workfile": record["workfile"],
+            "folder_path": record["context"].get("folderPath"),
+            "task": record["context"].get("task"),
+            "error": record["error"],
+        }
+        if record["error"] or not (
+                record["containers"] or record["publish_instances"]):
+            yield base
+            continue
+        for container in record["containers"]:
+            yield {
+                **base,
+                "kind": "container",
+                "name": container["name"],
+                "plugin": container["loader"],
+                "representation": container["representation"],
+                "version": container["version"],
+            }
+        for instance in record["publish_instances"]:
+            yield {
+                **base,
+                "kind": "instance",
+                "name": instance["productName"],
+                "plugin": instance["creator_identifier"],
+                "product_type": instance["productType"],
+            }
+
+
+def write_index(
+        records: list[dict],
+        output: Path,
+        output_format: Optional[str] = None) -> None:
+    """Write index records to the file.
+
+    Args:
+        records (list[dict]): Index records.
+        output (Path): Output file path.
+        output_format (Optional[str]): `json` or `csv`. If not set,
+            it is determined from the output file extension.
+
+    Raises:
+        ValueError: If the output format is not supported.
+
+    """
+    output_format = (
+        output_format or output.suffix.lstrip(".") or "json").lower()
+    if output_format not in INDEX_FORMATS:
+        msg = f"Unsupported index format: {output_format}"
+        raise ValueError(msg)
+
+    output.parent.mkdir(parents=True, exist_ok=True)
+    if output_format == "json":
+        with open(output, "w", encoding="utf-8") as stream:
+            json.dump(records, stream, indent=4)
+        return
+
+    with open(output, "w", encoding="utf-8", newline="") as stream:
+        writer = csv.DictWriter(stream, fieldnames=CSV_FIELDS)
+        writer.writeheader()
+        writer.writerows(_iter_csv_rows(records))
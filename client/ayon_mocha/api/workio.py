@@ -6,7 +6,12 @@ from typing import Optional
 
 from mocha.project import get_current_project
 
-from .lib import create_empty_project, quit_mocha, run_mocha
+from .lib import (
+    create_workfile_from_template,
+    is_interactive,
+    quit_mocha,
+    run_mocha,
+)
 
 
 def file_extensions() -> list[str]:
@@ -28,21 +33,49 @@ def save_file(filepath: Optional[Path]) -> None:
     Note that project cannot be saved without being created first.
     To create the project, you need to specify clip first, thus
     we can't create workfile from the un-initialized project within Mocha Pro.
+    In that case the workfile is created from the cached template.
+    Running Mocha Pro UI can't switch to it, so it is restarted with
+    the new workfile, there is no restart without UI.
 
     """
     project = get_current_project()
     if not project:
         if not filepath:
             return
-        project = create_empty_project(filepath)
+        create_workfile(filepath, open_workfile=is_interactive())
+        return
     if filepath:
         project.save_as(filepath.as_posix())
-        # now we need to reopen mocha with the new project
-        open_file(filepath)
+        # reopen mocha only if the running project wasn't switched
+        # to the new file by `save_as`
+        if Path(project.project_file) != filepath:
+            open_file(filepath)
         return
     project.save()
 
 
+def create_workfile(filepath: Path, *, open_workfile: bool = False) -> Path:
+    """Create a new workfile from the cached template.
+
+    This doesn't touch the current project, so it can be used to
+    bootstrap many workfiles without restarting Mocha Pro for each of
+    them (see `ayon_mocha.api.bootstrap`).
+
+    Args:
+        filepath (Path): Path to the new workfile.
+        open_workfile (bool): Open the workfile after it is created.
+            This restarts Mocha Pro.
+
+    Returns:
+        Path: Path to the created workfile.
+
+    """
+    create_workfile_from_template(filepath)
+    if open_workfile:
+        open_file(filepath)
+    return filepath
+
+
 def open_file(filepath: Path) -> None:
     """Open a workfile.
 
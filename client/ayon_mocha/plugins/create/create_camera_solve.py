@@ -0,0 +1,76 @@
+"""Create camera solve instance."""
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from ayon_core.lib import (
+    BoolDef,
+    EnumDef,
+    NumberDef,
+    UILabelDef,
+    UISeparatorDef,
+)
+from ayon_mocha.api.lib import get_camera_solve_exporters
+from ayon_mocha.api.plugin import MochaCreator
+
+if TYPE_CHECKING:
+    from ayon_core.pipeline import CreatedInstance
+
+
+class CreateCameraSolve(MochaCreator):
+    """Create camera solve instance."""
+    identifier = "io.ayon.creators.mochapro.camera"
+    label = "Camera Solve"
+    description = __doc__
+    product_type = "camera"
+    icon = "video-camera"
+
+    def get_attr_defs_for_instance(self, instance: CreatedInstance) -> list:
+        """Get attribute definitions for instance.
+
+        Returns:
+            list: List of attribute definitions.
+
+        """
+        exporter_settings = (
+            self.project_settings
+                ["mocha"]["create"]["CreateCameraSolve"]
+                ["default_exporters"]
+        )
+
+        exporters = get_camera_solve_exporters()
+        exporter_items = {ex.id: ex.label for ex in exporters}
+
+        preselect_exporters = [
+            ex.id
+            for ex in exporters
+            if ex.short_name in exporter_settings
+        ]
+
+        return [
+            EnumDef("layers",
+                    label="Layers",
+                    items=self.get_layer_items(),
+                    multiselection=True),
+            EnumDef("exporter",
+                    label="Exporter format",
+                    items=exporter_items,
+                    multiselection=True,
+                    default=preselect_exporters),
+            UISeparatorDef(),
+            UILabelDef("Exporter Options"),
+            NumberDef(
+                "frame_time", label="Frame time",
+                default=0.0),
+            BoolDef("use_cache",
+                    label="Reuse exports of unchanged layer data",
+                    tooltip=(
+                        "Solved camera is not part of the cache key, "
+                        "disable when only the solve changed."),
+                    default=False),
+            EnumDef("layer_mode", label="Layer mode",
+                    items={
+                        "selected": "Selected layers",
+                        "all": "All layers"
+                    }),
+        ]
@@ -0,0 +1,58 @@
+"""Create matte render instance."""
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from ayon_core.lib import BoolDef, EnumDef, NumberDef
+from ayon_mocha.api.matte_render import MATTE_EXTENSIONS
+from ayon_mocha.api.plugin import MochaCreator
+
+if TYPE_CHECKING:
+    from ayon_core.pipeline import CreatedInstance
+
+
+class CreateMatteRender(MochaCreator):
+    """Create matte render instance."""
+    identifier = "io.ayon.creators.mochapro.render.matte"
+    label = "Matte Render"
+    description = __doc__
+    product_type = "render"
+    icon = "adjust"
+
+    default_variants = ("Matte",)
+
+    def get_attr_defs_for_instance(
+            self, instance: CreatedInstance) -> list:
+        """Get attribute definitions for instance.
+
+        Returns:
+            list: List of attribute definitions.
+
+        """
+        settings = (
+            self.project_settings
+            ["mocha"]["create"]["CreateMatteRender"]
+        )
+        layers = self.get_layer_items()
+
+        return [
+            EnumDef("layers",
+                    label="Layers",
+                    items=layers,
+                    multiselection=True),
+            EnumDef("layer_mode", label="Layer mode",
+                    items={
+                        "selected": "Selected layers",
+                        "all": "All layers"
+                    }),
+            EnumDef("extension",
+                    label="Image format",
+                    items=list(MATTE_EXTENSIONS),
+                    default=settings["default_extension"]),
+            BoolDef("colorize",
+                    label="Colorize layers", default=False),
+            NumberDef("workers",
+                      label="Render processes",
+                      minimum=1, maximum=64, decimals=0,
+                      default=settings["workers"]),
+        ]
@@ -60,16 +60,10 @@ class CreateTrackingPoints(MochaCreator):
             if ex.short_name in exporter_settings
         ]
 
-        layers = {
-                    idx: layer.name
-                    for idx, layer in enumerate(
-                        self.create_context.host.get_current_project().layers)
-                } or {-1: "No layers"}
-
         return [
             EnumDef("layers",
                     label="Layers",
-                    items=layers,
+                    items=self.get_layer_items(),
                     multiselection=True),
             EnumDef("exporter",
                     label="Exporter format",
@@ -85,6 +79,8 @@ class CreateTrackingPoints(MochaCreator):
             BoolDef("invert", label="Invert", default=False),
             BoolDef("remove_lens_distortion",
                     label="Remove lens distortion", default=False),
+            BoolDef("export_mesh",
+                    label="Export mesh vertices", default=False),
             EnumDef("layer_mode", label="Layer mode",
                     items={
                         "selected": "Selected layers",
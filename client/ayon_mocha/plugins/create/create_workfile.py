@@ -1,5 +1,4 @@
 """Creator plugin for creating workfiles."""
-import ayon_api
 from ayon_core.pipeline import AutoCreator, CreatedInstance
 from ayon_mocha.api.plugin import MochaCreator
 
@@ -40,12 +39,6 @@ class CreateWorkfile(MochaCreator, AutoCreator):
             current_folder_path = current_instance["folderPath"]
 
         if current_instance is None:
-            folder_entity = ayon_api.get_folder_by_path(
-                project_name, folder_path
-            )
-            task_entity = ayon_api.get_task_by_name(
-                project_name, folder_entity["id"], task_name
-            )
             product_name = self.get_product_name(
                 project_name=project_name,
                 project_entity=project_entity,
@@ -78,12 +71,6 @@ class CreateWorkfile(MochaCreator, AutoCreator):
             or current_instance["task"] != task_name
         ):
             # Update instance context if is not the same
-            folder_entity = ayon_api.get_folder_by_path(
-                project_name, folder_path
-            )
-            task_entity = ayon_api.get_task_by_name(
-                project_name, folder_entity["id"], task_name
-            )
             product_name = self.get_product_name(
                 project_name=project_name,
                 project_entity=project_entity,
@@ -2,22 +2,26 @@
 from __future__ import annotations
 
 import time
-from pathlib import Path
-from typing import ClassVar, Optional
+from typing import ClassVar, Generator, Optional, Union
 
 from ayon_core.lib.transcoding import IMAGE_EXTENSIONS
-from ayon_core.pipeline import get_representation_path, registered_host
+from ayon_core.pipeline import registered_host
 from ayon_core.pipeline.load import LoadError
-from ayon_mocha.api.lib import get_image_info, update_ui
+from ayon_mocha.api.clip_names import (
+    get_clip_name_allocator,
+    invalidate_clip_name_allocator,
+)
 from ayon_mocha.api.pipeline import (
     Container,
     MochaProHost,
 )
-from ayon_mocha.api.plugin import MochaLoader
-from mocha.project import Clip
+from ayon_mocha.api.plugin import MochaClipLoader
+from ayon_mocha.api.ui_refresh import suppress_ui_refresh, update_ui
+from ayon_mocha.api.worker import HostTask
+from mocha.project import Clip, Project
 
 
-class LoadClip(MochaLoader):
+class LoadClip(MochaClipLoader):
     """Load a clip from a file."""
 
     label = "Load Clip"
@@ -29,54 +33,173 @@ class LoadClip(MochaLoader):
     representations: ClassVar[set[str]] = {"*"}
     extensions: ClassVar[set[str]] = {
         ext.lstrip(".") for ext in IMAGE_EXTENSIONS}
+    is_multiple_contexts_compatible = True
 
     def load(self,
-             context: dict,
+             context: Union[dict, list[dict]],
              name: Optional[str] = None,
              namespace: Optional[str] = None,
              options: Optional[dict] = None) -> None:
-        """Load a clip from a file."""
+        """Load a clip from a file.
+
+        Multiple contexts are loaded with `load_multiple`.
+
+        """
+        if isinstance(context, list):
+            self.load_multiple(context, options)
+            return
         host: MochaProHost = registered_host()
         project = host.get_current_project()
-        with project.undo_group():
-            file_path = self.filepath_from_context(context)
-
-            # Check if the clip with the same name already exists
-            # Mocha will load clips with the same name, but it will
-            # show in the UI just one of them, and it makes things
-            # confusing for the user.
-            clips = project.get_clips()
-            if name in clips:
-                self.log.warning("Clip %s already exists", name)
-                idx = 1
-                while f"{name}_{idx}" in clips:
-                    idx += 1
-                name = f"{name}_{idx}"
-
-            clip = Clip(file_path, name)
-            project.add_clip(clip, name)
-            project.new_output_clip(clip, name)
-
-            container = Container(
-                name=name,
-                namespace=namespace or "",
-                loader=self.__class__.__name__,
-                representation=str(context["representation"]["id"]),
-                objectName=clip.name,
-                timestamp=time.time_ns()
-            )
+        with suppress_ui_refresh(), project.undo_group():
+            container = self._load_clip(
+                project, context, name, namespace, options)
             host.add_container(container)
             update_ui()
-            self.log.debug("Loaded clip: %s", clip)
+
+    def load_multiple(
+            self,
+            contexts: list[dict],
+            options: Optional[dict] = None) -> list[Container]:
+        """Load multiple clips at once.
+
+        Clips are loaded by a host task, one clip per step, in one
+        undo group. Their containers are written to the project
+        metadata at once and the UI is refreshed only at the end.
+        Containers of the loaded clips are written even if some
+        clip fails to load or the task is cancelled.
+
+        Args:
+            contexts (list[dict]): Representation contexts to load.
+            options (Optional[dict]): Loader options.
+
+        Returns:
+            list[Container]: Containers of the loaded clips.
+
+        """
+        host: MochaProHost = registered_host()
+        task = HostTask(
+            self._iter_load(host, contexts, options),
+            total=len(contexts),
+            label="Load clips",
+        )
+        return task.wait()
+
+    def _iter_load(
+            self,
+            host: MochaProHost,
+            contexts: list[dict],
+            options: Optional[dict]) -> Generator[str, None, list[Container]]:
+        """Load clips one by one.
+
+        Returns:
+            list[Container]: Containers of the loaded clips.
+
+        Yields:
+            str: Progress message.
+
+        Raises:
+            LoadError: If some clips failed to load.
+
+        """
+        project = host.get_current_project()
+        containers: list[Container] = []
+        failed: list[str] = []
+        start = time.perf_counter()
+        with suppress_ui_refresh(), project.undo_group():
+            try:
+                for context in contexts:
+                    name = context["product"]["name"]
+                    clip_start = time.perf_counter()
+                    try:
+                        container = self._load_clip(
+                            project, context, name, None, options)
+                    except Exception:
+                        self.log.exception("Failed to load clip %s", name)
+                        failed.append(name)
+                        yield f"Failed to load clip {name}"
+                        continue
+                    containers.append(container)
+                    self.log.debug(
+                        "Loaded clip %s in %.3f s",
+                        container.name, time.perf_counter() - clip_start)
+                    yield f"Loaded clip {container.name}"
+            finally:
+                if containers:
+                    host.add_containers(containers)
+                update_ui()
+                self.log.info(
+                    "Loaded %d of %d clips in %.3f s",
+                    len(containers), len(contexts),
+                    time.perf_counter() - start)
+        if failed:
+            msg = f"Failed to load clips: {', '.join(failed)}"
+            raise LoadError(msg)
+        return containers  # noqa: B901
+
+    def _load_clip(
+            self,
+            project: Project,
+            context: dict,
+            name: Optional[str],
+            namespace: Optional[str],
+            options: Optional[dict] = None) -> Container:
+        """Add clip to the project.
+
+        Returns:
+            Container: Container of the loaded clip.
+
+        """
+        source = self.get_clip_source(context, options)
+
+        # Check if the clip with the same name already exists
+        # Mocha will load clips with the same name, but it will
+        # show in the UI just one of them, and it makes things
+        # confusing for the user.
+        unique_name = (
+            get_clip_name_allocator(project).allocate(name) if name else name)
+        if unique_name != name:
+            self.log.warning("Clip %s already exists", name)
+            name = unique_name
+
+        # frame size and length are passed, so Mocha Pro doesn't need
+        # to read the footage, and the exact frames are linked from
+        # the sequence instead of globbing the directory
+        width, height = self.get_frame_size(source.path)
+        sequence = source.sequence
+        length = (
+            sequence.end_frame - sequence.start_frame + 1
+            if sequence and sequence.is_sequence else 1)
+        clip = Clip(source.path, width=width, height=height, length=length)
+        self.link_frames(clip, source.path, sequence)
+        project.add_clip(clip, name)
+        project.new_output_clip(clip, name)
+        self.log.debug("Loaded clip: %s", clip)
+        local_cache = bool((options or {}).get("local_cache"))
+        if local_cache:
+            self.cache_clip_frames(clip.name, context, source)
+
+        return Container(
+            name=name,
+            namespace=namespace or "",
+            loader=self.__class__.__name__,
+            representation=str(context["representation"]["id"]),
+            objectName=clip.name,
+            timestamp=time.time_ns(),
+            resolution=source.resolution,
+            proxy_scale=source.scale,
+            local_cache=local_cache,
+        )
 
     def switch(self, container: dict, context: dict) -> None:
         """Switch the image sequence on the current camera."""
+        invalidate_clip_name_allocator()
         self.update(container, context)
 
     def remove(self, container: dict) -> None:
         """Remove a container."""
         host: MochaProHost = registered_host()
         project = host.get_current_project()
+        invalidate_clip_name_allocator()
 
         clips = project.get_clips()
         clip = clips.get(container["objectName"])
@@ -93,36 +216,35 @@ class LoadClip(MochaLoader):
             container (dict): Container to update.
             context (dict): Context to update the container to.
 
-        Raises:
-            LoadError: If the image info cannot be retrieved.
-
         """
         host: MochaProHost = registered_host()
+        invalidate_clip_name_allocator()
 
         version_entity = context["version"]
         repre_entity = context["representation"]
 
-        file_path = get_representation_path(repre_entity)
+        # keep the resolution the clip was loaded with
+        source = self.get_clip_source(context, {
+            "resolution": container.get("resolution"),
+            "downscale": container.get("proxy_scale"),
+        })
+        frame_size = self.get_frame_size(source.path)
         project = host.get_current_project()
         clips = project.get_clips()
 
-        # get image info using OIIO
-        try:
-            image_info = get_image_info(Path(file_path))
-        except ValueError as e:
-            msg = f"Failed to get image info for {file_path}: {e}"
-            raise LoadError(msg) from e
-
-        try:
-            clips[container["objectName"]].relink(file_path)
-            clips[container["objectName"]].frame_size = (
-                image_info.get("width", 1920),
-                image_info.get("height", 1080),
-            )
-        except KeyError:
-            self.log.warning("Clip %s not found", container["objectName"])
-        update_ui()
-
-        container["representation"] = repre_entity["id"]
-        container["version"] = str(version_entity["version"])
-        host.add_container(Container(**container))
+        with suppress_ui_refresh():
+            try:
+                self.relink_clip(clips[container["objectName"]], source)
+                clips[container["objectName"]].frame_size = frame_size
+            except KeyError:
+                self.log.warning("Clip %s not found", container["objectName"])
+            update_ui()
+            if container.get("local_cache"):
+                self.cache_clip_frames(
+                    container["objectName"], context, source)
+
+            container["resolution"] = source.resolution
+            container["proxy_scale"] = source.scale
+            container["representation"] = repre_entity["id"]
+            container["version"] = str(version_entity["version"])
+            host.add_container(Container(**container))
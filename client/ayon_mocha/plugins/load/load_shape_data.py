@@ -0,0 +1,154 @@
+"""Load published contours to a layer."""
+from __future__ import annotations
+
+import math
+import time
+from typing import TYPE_CHECKING, ClassVar, Optional
+
+from ayon_core.pipeline import registered_host
+from ayon_core.pipeline.load import LoadError
+from ayon_mocha.api.pipeline import (
+    Container,
+    MochaProHost,
+)
+from ayon_mocha.api.plugin import MochaLayerLoader
+from ayon_mocha.api.proxy import get_proxy_scale
+from ayon_mocha.api.shape_data import (
+    CONTOUR_BEZIER,
+    CONTOUR_XSPLINE,
+    ShapeData,
+    apply_shape_data,
+    read_shape_data,
+    rescale_shape_data,
+)
+from ayon_mocha.api.ui_refresh import suppress_ui_refresh, update_ui
+from mocha.project import BezierControlPointData, View, XControlPointData
+
+if TYPE_CHECKING:
+    from mocha.project import Layer, Project
+
+POINT_DATA_TYPES = {
+    CONTOUR_BEZIER: BezierControlPointData,
+    CONTOUR_XSPLINE: XControlPointData,
+}
+
+
+class LoadShapeData(MochaLayerLoader):
+    """Load published contours to a new layer.
+
+    Contours are recreated from the `shapedata` representation with
+    control points of every frame set on the contour at once.
+    """
+
+    label = "Load Shapes"
+    order = -5
+    icon = "object-ungroup"
+    color = "orange"
+
+    product_types: ClassVar[set[str]] = {"matteshapes"}
+    representations: ClassVar[set[str]] = {"shapedata"}
+    extensions: ClassVar[set[str]] = {"npz"}
+
+    def load(self,
+             context: dict,
+             name: Optional[str] = None,
+             namespace: Optional[str] = None,
+             options: Optional[dict] = None) -> None:
+        """Load contours to a new layer."""
+        host: MochaProHost = registered_host()
+        project = host.get_current_project()
+        shape_data = self._read_shape_data(context, host, project)
+        layer_name = self.get_unique_layer_name(
+            project, name or shape_data.layer_name)
+        with suppress_ui_refresh(), project.undo_group():
+            layer = self._create_layer(project, layer_name, shape_data)
+            host.add_container(Container(
+                name=name,
+                namespace=namespace or layer.name,
+                loader=self.__class__.__name__,
+                representation=str(context["representation"]["id"]),
+                objectName=layer.name,
+                timestamp=time.time_ns(),
+            ))
+            update_ui()
+
+    def update(self, container: dict, context: dict) -> None:
+        """Recreate the layer from the new version.
+
+        Args:
+            container (dict): Container to update.
+            context (dict): Context to update the container to.
+
+        """
+        host: MochaProHost = registered_host()
+        project = host.get_current_project()
+        layer = self.get_layer(project, container["objectName"])
+        if layer is None:
+            self.log.warning("Layer %s not found", container["objectName"])
+            return
+
+        shape_data = self._read_shape_data(context, host, project)
+        with suppress_ui_refresh(), project.undo_group():
+            layer.remove()
+            layer = self._create_layer(
+                project, container["objectName"], shape_data)
+            container["objectName"] = layer.name
+            container["representation"] = context["representation"]["id"]
+            container["version"] = str(context["version"]["version"])
+            host.add_container(Container(**container))
+            update_ui()
+
+    def _read_shape_data(
+            self,
+            context: dict,
+            host: MochaProHost,
+            project: Project) -> ShapeData:
+        """Read the published data in the frame size of the clip.
+
+        Data are published in the original resolution, trackable clip
+        loaded in lower resolution needs them scaled down.
+
+        Returns:
+            ShapeData: Data to apply.
+
+        """
+        shape_data = read_shape_data(self.filepath_from_context(context))
+        clip = project.default_trackable_clip
+        scale = get_proxy_scale(
+            host.get_containers(), clip.name if clip else "")
+        if not math.isclose(scale, 1.0):
+            shape_data = rescale_shape_data(shape_data, scale)
+        return shape_data
+
+    def _create_layer(
+            self,
+            project: Project,
+            layer_name: str,
+            shape_data: ShapeData) -> Layer:
+        """Create layer with the contours.
+
+        Returns:
+            Layer: Created layer.
+
+        Raises:
+            LoadError: If no trackable clip found in the project.
+
+        """
+        clip = project.default_trackable_clip
+        if clip is None:
+            msg = "No trackable clip found in the project."
+            raise LoadError(msg)
+
+        start = time.perf_counter()
+        layer: Layer = project.add_layer(clip, layer_name, View(0))
+        count = apply_shape_data(
+            layer,
+            shape_data,
+            POINT_DATA_TYPES,
+            frame_offset=int(project.first_frame_offset),
+            view=View(0),
+        )
+        self.log.debug(
+            "Created %d contours with %d keyframes in %s in %.3f s",
+            len(shape_data), count, layer.name, time.perf_counter() - start)
+        return layer
@@ -0,0 +1,186 @@
+"""Load published tracking data to a layer."""
+from __future__ import annotations
+
+import math
+import time
+from typing import TYPE_CHECKING, ClassVar, Optional
+
+from ayon_core.lib import NumberDef
+from ayon_core.pipeline import registered_host
+from ayon_core.pipeline.load import LoadError
+from ayon_mocha.api.keyframes import simplify_track_data
+from ayon_mocha.api.pipeline import (
+    Container,
+    MochaProHost,
+)
+from ayon_mocha.api.plugin import MochaLayerLoader
+from ayon_mocha.api.proxy import get_proxy_scale
+from ayon_mocha.api.track_data import (
+    TrackData,
+    apply_track_data,
+    get_missing_parameters,
+    read_track_data,
+    rescale_track_data,
+)
+from ayon_mocha.api.ui_refresh import suppress_ui_refresh, update_ui
+from mocha.project import View
+
+if TYPE_CHECKING:
+    from mocha.project import Layer, Project
+
+
+class LoadTrackPoints(MochaLayerLoader):
+    """Load published tracking data to a new layer.
+
+    Layer tracking is rebuilt from the `trackdata` representation,
+    so published track can be reused without tracking it again.
+    """
+
+    label = "Load Track Points"
+    order = -5
+    icon = "crosshairs"
+    color = "orange"
+
+    product_types: ClassVar[set[str]] = {"trackpoints"}
+    representations: ClassVar[set[str]] = {"trackdata"}
+    extensions: ClassVar[set[str]] = {"npz", "json"}
+
+    options: ClassVar[list] = [
+        NumberDef(
+            "keyframe_tolerance",
+            label="Keyframe tolerance (px)",
+            default=0.0,
+            minimum=0.0,
+            maximum=10.0,
+            decimals=3,
+        ),
+    ]
+
+    def load(self,
+             context: dict,
+             name: Optional[str] = None,
+             namespace: Optional[str] = None,
+             options: Optional[dict] = None) -> None:
+        """Load tracking data to a new layer.
+
+        Layer is removed again if the data can't be applied to it.
+
+        Raises:
+            LoadError: If no trackable clip found in the project.
+
+        """
+        host: MochaProHost = registered_host()
+        project = host.get_current_project()
+        clip = project.default_trackable_clip
+        if clip is None:
+            msg = "No trackable clip found in the project."
+            raise LoadError(msg)
+
+        tolerance = float((options or {}).get("keyframe_tolerance") or 0.0)
+        track_data = self._read_track_data(context, host, project, tolerance)
+        layer_name = self.get_unique_layer_name(
+            project, name or track_data.layer_name)
+        with suppress_ui_refresh(), project.undo_group():
+            layer: Layer = project.add_layer(clip, layer_name, View(0))
+            try:
+                self._apply(project, layer, track_data)
+            except LoadError:
+                layer.remove()
+                raise
+            host.add_container(Container(
+                name=name,
+                namespace=namespace or layer.name,
+                loader=self.__class__.__name__,
+                representation=str(context["representation"]["id"]),
+                objectName=layer.name,
+                timestamp=time.time_ns(),
+                keyframe_tolerance=tolerance,
+            ))
+            update_ui()
+
+    def update(self, container: dict, context: dict) -> None:
+        """Replace tracking of the layer with the new version.
+
+        Args:
+            container (dict): Container to update.
+            context (dict): Context to update the container to.
+
+        """
+        host: MochaProHost = registered_host()
+        project = host.get_current_project()
+        layer = self.get_layer(project, container["objectName"])
+        if layer is None:
+            self.log.warning("Layer %s not found", container["objectName"])
+            return
+
+        track_data = self._read_track_data(
+            context, host, project,
+            float(container.get("keyframe_tolerance") or 0.0))
+        with suppress_ui_refresh(), project.undo_group():
+            self._apply(project, layer, track_data)
+            container["representation"] = context["representation"]["id"]
+            container["version"] = str(context["version"]["version"])
+            host.add_container(Container(**container))
+            update_ui()
+
+    def _read_track_data(
+            self,
+            context: dict,
+            host: MochaProHost,
+            project: Project,
+            tolerance: float) -> TrackData:
+        """Read the published data in the frame size of the clip.
+
+        Data are published in the original resolution, trackable clip
+        loaded in lower resolution needs them scaled down.
+
+        Returns:
+            TrackData: Data to apply.
+
+        """
+        track_data = read_track_data(self.filepath_from_context(context))
+        clip = project.default_trackable_clip
+        scale = get_proxy_scale(
+            host.get_containers(), clip.name if clip else "")
+        if not math.isclose(scale, 1.0):
+            track_data = rescale_track_data(track_data, scale)
+        if tolerance > 0.0:
+            track_data, report = simplify_track_data(track_data, tolerance)
+            self.log.debug(
+                "Reduced %d frames to %d keyframes",
+                report.sample_count, report.keyframe_count)
+        return track_data
+
+    def _apply(
+            self,
+            project: Project,
+            layer: Layer,
+            track_data: TrackData) -> None:
+        """Set tracking of the layer.
+
+        Raises:
+            LoadError: If the layer doesn't have the parameters
+                of the track data or they don't accept them.
+
+        """
+        missing = get_missing_parameters(layer)
+        if missing:
+            msg = (
+                f"Layer {layer.name} is missing parameters: "
+                + ", ".join("/".join(path) for path in missing))
+            raise LoadError(msg)
+
+        start = time.perf_counter()
+        try:
+            count = apply_track_data(
+                layer,
+                track_data,
+                frame_offset=int(project.first_frame_offset),
+                view=View(0),
+            )
+        except ValueError as exc:
+            msg = f"Failed to apply tracking to {layer.name}: {exc}"
+            raise LoadError(msg) from exc
+        self.log.debug(
+            "Assigned %d keyframes to %s in %.3f s",
+            count, layer.name, time.perf_counter() - start)
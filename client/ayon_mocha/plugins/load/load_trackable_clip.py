@@ -1,25 +1,25 @@
 """Load a clip from a file as trackable clip."""
 from __future__ import annotations
 
+import dataclasses
 import time
-from pathlib import Path
 from typing import TYPE_CHECKING, ClassVar, Optional
 
 from ayon_core.lib.transcoding import IMAGE_EXTENSIONS
-from ayon_core.pipeline import get_representation_path, registered_host
+from ayon_core.pipeline import registered_host
 from ayon_core.pipeline.load import LoadError
-from ayon_mocha.api.lib import get_image_info, update_ui
 from ayon_mocha.api.pipeline import (
     Container,
     MochaProHost,
 )
-from ayon_mocha.api.plugin import MochaLoader
+from ayon_mocha.api.plugin import MochaClipLoader
+from ayon_mocha.api.ui_refresh import suppress_ui_refresh, update_ui
 
 if TYPE_CHECKING:
     from mocha.project import Clip
 
 
-class LoadTrackableClip(MochaLoader):
+class LoadTrackableClip(MochaClipLoader):
     """Load a clip from a file."""
 
     label = "Load Trackable Clip"
@@ -45,7 +45,7 @@ class LoadTrackableClip(MochaLoader):
         """
         host: MochaProHost = registered_host()
         project = host.get_current_project()
-        with project.undo_group():
+        with suppress_ui_refresh(), project.undo_group():
 
             current_clip: Clip = project.default_trackable_clip
             if current_clip is None:
@@ -54,38 +54,42 @@ class LoadTrackableClip(MochaLoader):
             # no way how to change clip name
             # project.parameter([current_clip, "name"]).set(name)
 
-            file_path = self.filepath_from_context(context)
-
-            try:
-                image_info = get_image_info(Path(file_path))
-            except ValueError as exc:
-                msg = (
-                    f"Failed to get image info from {file_path}: {exc}"
-                )
-                raise LoadError(msg) from exc
+            source = self.get_clip_source(context, options)
 
             # set clip properties
-            current_clip.frame_size = (
-                image_info.get("width", 1920),
-                image_info.get("height", 1080)
-            )
-
-            current_clip.relink(file_path)
-
-            for cnt in host.get_containers():
-                if cnt.get("name") == current_clip.name:
-                    cnt["representation"] = str(
-                        context["representation"]["id"])
-                    return
-
-            container = Container(
-                name=current_clip.name,
-                namespace=namespace or "",
-                loader=self.__class__.__name__,
-                representation=str(context["representation"]["id"]),
-                objectName=current_clip.name,
-                timestamp=time.time_ns()
-            )
+            current_clip.frame_size = self.get_frame_size(source.path)
+
+            self.relink_clip(current_clip, source)
+            local_cache = bool((options or {}).get("local_cache"))
+            if local_cache:
+                self.cache_clip_frames(current_clip.name, context, source)
+            else:
+                self.prefetch_clip_frames(current_clip.name, context, source)
+
+            loaded = {
+                "representation": str(context["representation"]["id"]),
+                "timestamp": time.time_ns(),
+                "resolution": source.resolution,
+                "proxy_scale": source.scale,
+                "local_cache": local_cache,
+            }
+            existing = next(
+                (
+                    cnt for cnt in host.get_containers()
+                    if cnt.get("name") == current_clip.name
+                ), None)
+            if existing is not None:
+                # trackable clip is already managed, keep its container
+                container = dataclasses.replace(
+                    Container(**existing), **loaded)
+            else:
+                container = Container(
+                    name=current_clip.name,
+                    namespace=namespace or "",
+                    loader=self.__class__.__name__,
+                    objectName=current_clip.name,
+                    **loaded,
+                )
             host.add_container(container)
 
     def switch(self, container: dict, context: dict) -> None:
@@ -106,37 +110,38 @@ class LoadTrackableClip(MochaLoader):
         host.remove_container(Container(**container))
 
     def update(self, container: dict, context: dict) -> None:
-        """Update a container.
-
-        Raises:
-            LoadError: If the clip information cannot be determined.
-
-        """
+        """Update a container."""
         host: MochaProHost = registered_host()
 
         version_entity = context["version"]
         repre_entity = context["representation"]
 
-        file_path = get_representation_path(repre_entity)
+        # keep the resolution the clip was loaded with
+        source = self.get_clip_source(context, {
+            "resolution": container.get("resolution"),
+            "downscale": container.get("proxy_scale"),
+        })
+        frame_size = self.get_frame_size(source.path)
         project = host.get_current_project()
         clips = project.get_clips()
 
-        try:
-            image_info = get_image_info(Path(file_path))
-        except ValueError as exc:
-            msg = f"Failed to get image info from {file_path}: {exc}"
-            raise LoadError(msg) from exc
-        try:
-            clips[container["objectName"]].relink(file_path)
-            # set clip properties
-            clips[container["objectName"]].frame_size = (
-                image_info.get("width", 1920),
-                image_info.get("height", 1080),
-            )
-        except KeyError:
-            self.log.warning("Clip %s not found", container["objectName"])
-        update_ui()
-
-        container["representation"] = repre_entity["id"]
-        container["version"] = str(version_entity["version"])
-        host.add_container(Container(**container))
+        with suppress_ui_refresh():
+            try:
+                self.relink_clip(clips[container["objectName"]], source)
+                # set clip properties
+                clips[container["objectName"]].frame_size = frame_size
+            except KeyError:
+                self.log.warning("Clip %s not found", container["objectName"])
+            update_ui()
+            if container.get("local_cache"):
+                self.cache_clip_frames(
+                    container["objectName"], context, source)
+            else:
+                self.prefetch_clip_frames(
+                    container["objectName"], context, source)
+
+            container["resolution"] = source.resolution
+            container["proxy_scale"] = source.scale
+            container["representation"] = repre_entity["id"]
+            container["version"] = str(version_entity["version"])
+            host.add_container(Container(**container))
@@ -0,0 +1,40 @@
+"""Collect layers of camera solve instances."""
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, ClassVar
+
+import pyblish.api
+from ayon_mocha.api.lib import get_camera_solve_exporters
+from ayon_mocha.api.plugin import split_instance_by_layers
+
+if TYPE_CHECKING:
+    from logging import Logger
+
+
+class CollectCameraSolve(pyblish.api.InstancePlugin):
+    """Collect camera solve data."""
+    label = "Collect Camera Solve"
+    order = pyblish.api.CollectorOrder - 0.45
+    hosts: ClassVar[list[str]] = ["mochapro"]
+    families: ClassVar[list[str]] = ["camera"]
+    log: Logger
+
+    def process(self, instance: pyblish.api.Instance) -> None:
+        """Process the instance."""
+        # copy creator settings to the instance itself
+        creator_attrs = instance.data["creator_attributes"]
+        registered_exporters = get_camera_solve_exporters()
+        selected_exporters = [
+            exporter
+            for exporter in registered_exporters
+            if exporter.id in creator_attrs["exporter"]
+        ]
+
+        instance.data["use_exporters"] = selected_exporters
+        instance.data["exporter_options"] = {
+            "frame_time": creator_attrs["frame_time"],
+        }
+        instance.data["useSolveCache"] = creator_attrs["use_cache"]
+
+        for layer_instance in split_instance_by_layers(instance):
+            self.log.debug("Collected %s", layer_instance.data["label"])
@@ -0,0 +1,50 @@
+"""Collect layers and frame range of matte render."""
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, ClassVar
+
+import pyblish.api
+from ayon_core.pipeline import KnownPublishError
+from ayon_mocha.api.plugin import get_instance_layers
+
+if TYPE_CHECKING:
+    from logging import Logger
+
+    from mocha.project import Project
+
+
+class CollectMatteRender(pyblish.api.InstancePlugin):
+    """Collect layers and frame range of matte render."""
+    label = "Collect Matte Render"
+    order = pyblish.api.CollectorOrder - 0.45
+    hosts: ClassVar[list[str]] = ["mochapro"]
+    families: ClassVar[list[str]] = ["render"]
+    log: Logger
+
+    def process(self, instance: pyblish.api.Instance) -> None:
+        """Process the instance.
+
+        Raises:
+            KnownPublishError: If the layer mode is invalid or there
+                are no layers to render.
+
+        """
+        project: Project = instance.context.data["project"]
+        layers = get_instance_layers(instance)
+        if not layers:
+            msg = "No layers to render."
+            raise KnownPublishError(msg)
+
+        in_point, out_point = project.in_out_range
+        frame_offset = int(project.first_frame_offset)
+        instance.data["renderLayers"] = [layer.name for layer in layers]
+        instance.data["renderRange"] = (int(in_point), int(out_point))
+        instance.data["frameStart"] = int(in_point) + frame_offset
+        instance.data["frameEnd"] = int(out_point) + frame_offset
+        instance.data["fps"] = float(project.frame_rate)
+        self.log.debug(
+            "Rendering %s in frames %s-%s",
+            instance.data["renderLayers"],
+            instance.data["frameStart"],
+            instance.data["frameEnd"],
+        )
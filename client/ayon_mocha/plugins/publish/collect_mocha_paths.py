@@ -1,11 +1,11 @@
 """Collect Mocha executable paths."""
 from __future__ import annotations
 
-import platform
 from pathlib import Path
 from typing import TYPE_CHECKING, ClassVar
 
 import pyblish.api
+from ayon_mocha.api.headless import get_mocha_python_paths
 from ayon_mocha.api.lib import get_mocha_exec_name
 
 if TYPE_CHECKING:
@@ -28,26 +28,8 @@ class CollectMochaPaths(pyblish.api.ContextPlugin):
 
         mocha_executable_path = Path(get_mocha_exec_name("mochapro"))
         context.data["mocha_executable_path"] = mocha_executable_path
-        mocha_install_dir = mocha_executable_path.parent.parent
-
-        if platform.system().lower() == "windows":
-            mocha_python_path = (
-                mocha_install_dir / "python" / "python.exe")
-            mocha_exporter_path = (
-                mocha_install_dir / "python" / "mochaexport.py")
-        elif platform.system().lower() == "darwin":
-            mocha_python_path = (
-                mocha_install_dir / "python3")
-            mocha_exporter_path = (
-                mocha_install_dir / "mochaexport.py")
-        elif platform.system().lower() == "linux":
-            mocha_python_path = (
-                mocha_install_dir / "python" / "bin" / "python3")
-            mocha_exporter_path = (
-                mocha_install_dir / "python" / "mochaexport.py")
-        else:
-            msg = f"Unsupported platform: {platform.system()}"
-            raise NotImplementedError(msg)
+        mocha_python_path, mocha_exporter_path = get_mocha_python_paths(
+            mocha_executable_path)
 
         context.data["mocha_python_path"] = mocha_python_path
         context.data["mocha_exporter_path"] = mocha_exporter_path
@@ -4,11 +4,13 @@ from __future__ import annotations
 from typing import TYPE_CHECKING, ClassVar
 
 import pyblish.api
-from mocha.project import get_current_project
+from ayon_core.pipeline import registered_host
 
 if TYPE_CHECKING:
     from logging import Logger
 
+    from ayon_mocha.api.pipeline import MochaProHost
+
 
 class CollectMochaProject(pyblish.api.ContextPlugin):
     """Inject the current working file into context.
@@ -23,7 +25,8 @@ class CollectMochaProject(pyblish.api.ContextPlugin):
 
     def process(self, context: pyblish.api.Context) -> None:
         """Inject the current working file."""
-        context.data["project"] = get_current_project()
+        host: MochaProHost = registered_host()
+        context.data["project"] = host.get_current_project()
         current_file = context.data["project"].project_file
         context.data["currentFile"] = current_file
         if not current_file:
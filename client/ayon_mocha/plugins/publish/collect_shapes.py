@@ -6,13 +6,15 @@ from typing import TYPE_CHECKING, ClassVar
 
 import pyblish.api
 from ayon_core.pipeline import KnownPublishError
-from ayon_core.pipeline.create import get_product_name
 from ayon_mocha.api.lib import get_shape_exporters
+from ayon_mocha.api.product_name import (
+    get_layer_variant,
+    get_product_names,
+)
 
 if TYPE_CHECKING:
     from logging import Logger
 
-    from ayon_core.pipeline.create import CreateContext
     from mocha.project import Layer, Project
 
 
@@ -24,25 +26,6 @@ class CollectShapes(pyblish.api.InstancePlugin):
     families: ClassVar[list[str]] = ["matteshapes"]
     log: Logger
 
-    @staticmethod
-    def new_product_name(
-        create_context: CreateContext,
-        layer_name: str,
-        product_type: str,
-        variant: str) -> str:
-        """Return the new product name."""
-        sanitized_layer_name = layer_name.replace(" ", "_")
-        variant = f"{sanitized_layer_name}{variant.capitalize()}"
-
-        return get_product_name(
-            project_name=create_context.project_name,
-            task_name=create_context.get_current_task_name(),
-            task_type=create_context.get_current_task_type(),
-            host_name=create_context.host_name,
-            product_type=product_type,
-            variant=variant,
-        )
-
     def process(self, instance: pyblish.api.Instance) -> None:
         """Process the instance.
 
@@ -73,7 +56,15 @@ class CollectShapes(pyblish.api.InstancePlugin):
             msg = f"Invalid layer mode: {creator_attrs['layer_mode']}"
             raise KnownPublishError(msg)
 
-        for layer in layers:
+        product_names = get_product_names(
+            instance.context.data["create_context"],
+            instance.data["productType"],
+            [
+                get_layer_variant(layer.name, instance.data["variant"])
+                for layer in layers
+            ],
+        )
+        for layer, product_name in zip(layers, product_names):
             new_instance = instance.context.create_instance(
                 f"{instance.name} - {layer.name}"
             )
@@ -88,12 +79,7 @@ class CollectShapes(pyblish.api.InstancePlugin):
             # new_instance.data = instance.data
             new_instance.data["label"] = f"{instance.name} ({layer.name})"
             new_instance.data["name"] = f"{instance.name}_{layer.name}"
-            new_instance.data["productName"] = self.new_product_name(
-                instance.context.data["create_context"],
-                layer.name,
-                instance.data["productType"],
-                instance.data["variant"],
-            )
+            new_instance.data["productName"] = product_name
             self.set_layer_data_on_instance(new_instance, layer)
         if layers:
             instance.context.remove(instance)
@@ -0,0 +1,291 @@
+"""Export camera solve from Mocha."""
+from __future__ import annotations
+
+import itertools
+import math
+from pathlib import Path
+from typing import TYPE_CHECKING, ClassVar, Generator, Iterable
+
+import clique
+from ayon_core.pipeline import KnownPublishError, publish, registered_host
+from ayon_mocha.api.lib import get_solve_cache
+from ayon_mocha.api.proxy import get_trackable_clip_scale
+from ayon_mocha.api.solve_cache import (
+    get_parameter_state,
+    get_solve_fingerprint,
+)
+from ayon_mocha.api.track_data import sample_layer
+from ayon_mocha.api.worker import HostTask, TaskCancelledError
+from mocha.project import Layer, Project, View
+
+if TYPE_CHECKING:
+    from logging import Logger
+
+    import pyblish.api
+    from ayon_mocha.api.lib import ExporterInfo
+    from ayon_mocha.api.solve_cache import SolveCache
+
+
+class ExportCameraSolve(publish.Extractor):
+    """Export camera solve.
+
+    All selected formats are exported in one task. If enabled on the
+    instance, exports are cached by fingerprint of the solved layer
+    data and parameters, so republishing unchanged layer only copies
+    the cached files. The solved camera itself is not exposed by Mocha
+    Pro API, so versions using cached files are marked in version data
+    by `cameraSolveFromCache`.
+    """
+
+    label = "Export Camera Solve"
+    families: ClassVar[list[str]] = ["camera"]
+    log: Logger
+
+    def process(self, instance: pyblish.api.Instance) -> None:
+        """Process the instance."""
+        staging_dir = Path(self.staging_dir(instance))
+        if not instance.data.get("useSolveCache", False):
+            exported = self._export(instance, instance.data["use_exporters"])
+            self._add_representations(
+                instance, itertools.starmap(self._get_output, exported))
+            return
+
+        project: Project = instance.context.data["project"]
+        fingerprint = self._get_fingerprint(
+            project, instance.data["layer"], instance.data["exporter_options"])
+        self.log.debug("Camera solve fingerprint: %s", fingerprint)
+
+        cache = get_solve_cache()
+        product_name = instance.data["productName"]
+        outputs: list[dict] = []
+        to_export: list[ExporterInfo] = []
+        for exporter_info in instance.data["use_exporters"]:
+            files = cache.restore(
+                fingerprint,
+                exporter_info.id,
+                f"{product_name}_{exporter_info.id[:8]}",
+                staging_dir,
+            )
+            if files is None:
+                to_export.append(exporter_info)
+                continue
+            self.log.info("Reusing cached %s export.", exporter_info.label)
+            outputs.append(self._get_output(exporter_info, files))
+
+        version_data = instance.data.setdefault("versionData", {})
+        version_data["cameraSolveFromCache"] = bool(outputs)
+        if to_export:
+            exported = self._export(instance, to_export)
+            self._store_exports(cache, fingerprint, product_name, exported)
+            outputs.extend(itertools.starmap(self._get_output, exported))
+
+        self._add_representations(instance, outputs)
+        instance.data["cameraSolveFingerprint"] = fingerprint
+
+    def _add_representations(
+            self,
+            instance: pyblish.api.Instance,
+            outputs: Iterable[dict]) -> None:
+        """Add representations of the outputs to the instance."""
+        staging_dir = Path(self.staging_dir(instance))
+        instance.data.setdefault("representations", []).extend(
+            self._get_representation(output, staging_dir)
+            for output in outputs
+        )
+
+    @staticmethod
+    def _get_fingerprint(
+            project: Project, layer: Layer, options: dict) -> str:
+        """Return fingerprint of the solved layer.
+
+        Sampled layer data and values of the layer parameters
+        (including camera solve settings) are part of the fingerprint.
+
+        Returns:
+            str: Solve fingerprint.
+
+        """
+        clip = project.default_trackable_clip
+        track_data = sample_layer(
+            layer,
+            frame_offset=int(project.first_frame_offset),
+            frame_size=tuple(clip.frame_size) if clip else (0, 0),
+            frame_rate=float(project.frame_rate),
+        )
+        return get_solve_fingerprint(track_data, {
+            "project_length": int(project.length),
+            "frame_time": options.get("frame_time", 0.0),
+            "layer_parameters": get_parameter_state(layer.psets),
+        })
+
+    def _export(
+            self,
+            instance: pyblish.api.Instance,
+            exporters: list[ExporterInfo],
+    ) -> list[tuple[ExporterInfo, list[Path]]]:
+        """Export the camera solve in the formats.
+
+        Args:
+            instance (pyblish.api.Instance): instance.
+            exporters (list[ExporterInfo]): exporters to use.
+
+        Returns:
+            list[tuple[ExporterInfo, list[Path]]]: exporters and their
+                written files.
+
+        Raises:
+            KnownPublishError: if the clip is loaded in lower resolution
+                or the export was cancelled.
+
+        """
+        project: Project = instance.context.data["project"]
+        # Mocha Pro exporters write the solve in the resolution
+        # of the loaded clip
+        scale = get_trackable_clip_scale(
+            project, registered_host().get_containers())
+        if not math.isclose(scale, 1.0):
+            msg = (
+                "Camera solve is exported in the resolution of the loaded "
+                "clip. Switch the clip to full resolution to export it.")
+            raise KnownPublishError(msg)
+
+        product_name = instance.data["productName"]
+        task = HostTask(
+            self._iter_export(
+                project,
+                exporters,
+                instance.data["layer"],
+                instance.data["exporter_options"],
+                Path(self.staging_dir(instance)) / product_name,
+            ),
+            total=len(exporters),
+            label=product_name,
+        )
+        task.message.connect(self.log.debug)
+        task.watch(project.progress_watcher)
+        try:
+            return task.wait()
+        except TaskCancelledError as exc:
+            raise KnownPublishError(str(exc)) from exc
+
+    @staticmethod
+    def _iter_export(
+            project: Project,
+            exporters: list[ExporterInfo],
+            layer: Layer,
+            options: dict,
+            output_prefix: Path,
+        ) -> Generator[str, None, list[tuple[ExporterInfo, list[Path]]]]:
+        """Run the exporters one by one.
+
+        Args:
+            project (Project): Mocha project.
+            exporters (list[ExporterInfo]): exporters to use.
+            layer (Layer): solved layer.
+            options (dict): exporter options.
+            output_prefix (Path): output path without the exporter
+                hash and extension.
+
+        Returns:
+            list[tuple[ExporterInfo, list[Path]]]: exporters and their
+                written files.
+
+        Yields:
+            str: progress message.
+
+        Raises:
+            KnownPublishError: if the export fails.
+
+        """
+        exported = []
+        for exporter_info in exporters:
+            file_path = Path(f"{output_prefix}_{exporter_info.id[:8]}")
+            result = exporter_info.exporter.do_export(
+                project,
+                layer,
+                file_path.as_posix(),
+                options.get("frame_time", 0.0),
+                View(0),
+            )
+            if not result:
+                msg = f"Export failed for {exporter_info.label}."
+                raise KnownPublishError(msg)
+
+            files = []
+            for path, content in result.items():
+                Path(path).write_bytes(content)
+                files.append(Path(path))
+            exported.append((exporter_info, files))
+            yield f"Exported {exporter_info.label}"
+
+        return exported  # noqa: B901
+
+    def _store_exports(
+            self,
+            cache: SolveCache,
+            fingerprint: str,
+            product_name: str,
+            exported: list[tuple[ExporterInfo, list[Path]]]) -> None:
+        """Store exported files in the solve cache.
+
+        Failing cache is not a reason to fail the publish.
+
+        """
+        for exporter_info, files in exported:
+            try:
+                cache.store(
+                    fingerprint,
+                    exporter_info.id,
+                    f"{product_name}_{exporter_info.id[:8]}",
+                    files,
+                )
+            except OSError:  # noqa: PERF203
+                self.log.warning(
+                    "Failed to cache %s export.",
+                    exporter_info.label, exc_info=True)
+
+    @staticmethod
+    def _get_output(
+            exporter_info: ExporterInfo, files: list[Path]) -> dict:
+        """Return output of the exporter.
+
+        Returns:
+            dict: Exporter label, extension and file names.
+
+        """
+        return {
+            "name": exporter_info.short_name,
+            "ext": files[0].suffix[1:] if files else "",
+            "files": [file_path.name for file_path in files],
+            "outputName": exporter_info.id[:8],
+        }
+
+    @staticmethod
+    def _get_representation(output: dict, staging_dir: Path) -> dict:
+        """Return representation of the exporter output.
+
+        Returns:
+            dict: Representation.
+
+        Raises:
+            KnownPublishError: if the output is neither a single file
+                nor a single sequence.
+
+        """
+        files = output["files"]
+        if len(files) == 1:
+            repre_files = files[0]
+        else:
+            cols, rems = clique.assemble(files)
+            if len(cols) != 1 or rems:
+                msg = (f"{output['name']} produced multiple files that "
+                       "are not a sequence. This is not supported.")
+                raise KnownPublishError(msg)
+            repre_files = list(cols[0])
+        return {
+            "name": output["name"],
+            "ext": output["ext"],
+            "files": repre_files,
+            "stagingDir": staging_dir.as_posix(),
+            "outputName": output["outputName"],
+        }
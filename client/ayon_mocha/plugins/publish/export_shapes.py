@@ -1,20 +1,29 @@
 """Extract tracking points from Mocha."""
 from __future__ import annotations
 
+import math
 import re
 from pathlib import Path
-from typing import TYPE_CHECKING, ClassVar, List, Optional
+from typing import TYPE_CHECKING, ClassVar, Generator, List, Optional
 
 import clique
-from ayon_core.pipeline import KnownPublishError, publish
+from ayon_core.pipeline import KnownPublishError, publish, registered_host
 from ayon_mocha.api.lib import (
     ExporterProcessInfo,
     get_mocha_version,
+    write_exported_files,
 )
 from ayon_mocha.api.mocha_exporter_mappings import EXPORTER_MAPPING
+from ayon_mocha.api.proxy import get_trackable_clip_scale
+from ayon_mocha.api.worker import (
+    HostTask,
+    TaskCancelledError,
+    run_in_background,
+)
 from mocha.project import Layer, Project, View
 
 if TYPE_CHECKING:
+    from concurrent.futures import Future
     from logging import Logger
 
     import pyblish.api
@@ -205,7 +214,67 @@ class ExportShape(publish.Extractor):
             list[dict]: list of exported files.
 
         Raises:
-            KnownPublishError: if the exporter name is not found
+            KnownPublishError: if the clip is loaded in lower resolution
+                or the export was cancelled.
+
+        """
+        # Mocha Pro exporters write the shapes in the resolution
+        # of the loaded clip
+        scale = get_trackable_clip_scale(
+            project, registered_host().get_containers())
+        if not math.isclose(scale, 1.0):
+            msg = (
+                "Shapes are exported in the resolution of the loaded "
+                "clip. Switch the clip to full resolution to export them.")
+            raise KnownPublishError(msg)
+
+        task = HostTask(
+            self._iter_export(
+                product_name, project, exporters, layer, process_info),
+            total=len(exporters),
+            label=product_name,
+        )
+        task.message.connect(self.log.debug)
+        task.watch(project.progress_watcher)
+        try:
+            output, writes = task.wait()
+        except TaskCancelledError as exc:
+            raise KnownPublishError(str(exc)) from exc
+        for write in writes:
+            write.result()
+
+        return output
+
+    def _iter_export(
+            self,
+            product_name: str,
+            project: Project,
+            exporters: list[ExporterInfo],
+            layer: Layer,
+            process_info: ExporterProcessInfo,
+        ) -> Generator[str, None, tuple[list[dict], list[Future]]]:
+        """Run the exporters one by one.
+
+        Every exporter is one step of the export task, so the UI
+        can be updated in between.
+
+        Args:
+            product_name (str): used for naming the resulting
+                files.
+            project (Project): Mocha project.
+            exporters (list[ExporterInfo]): exporters to use.
+            layer (Layer): layer to export.
+            process_info (ExporterProcessInfo): process information.
+
+        Returns:
+            tuple[list[dict], list[Future]]: outputs and their pending
+                file writes.
+
+        Yields:
+            str: progress message.
+
+        Raises:
+            KnownPublishError: if the export fails.
 
         """
         views = [view_info.name for view_info in project.views]
@@ -216,6 +285,7 @@ class ExportShape(publish.Extractor):
         }
 
         output: list[dict] = []
+        writes: list[Future] = []
         for exporter_info in exporters:
             exporter_name = exporter_info.label
             if not exporter_name:
@@ -264,8 +334,9 @@ class ExportShape(publish.Extractor):
 
             output_files = []
             ext = None
-            for k, v in result.items():
-                Path(k).write_bytes(v)
+            # writing can run while the next exporter is working
+            writes.append(run_in_background(write_exported_files, result))
+            for k in result:
                 output_files.append(Path(k).name)
 
                 if ext is None:
@@ -278,8 +349,9 @@ class ExportShape(publish.Extractor):
                 "stagingDir": process_info.staging_dir.as_posix(),
                 "outputName": exporter_short_hash,
             })
+            yield f"Exported {exporter_name}"
 
-        return output
+        return output, writes  # noqa: B901
 
     def add_to_resources(
             self, path: Path, instance: pyblish.api.Instance) -> None:
@@ -1,26 +1,38 @@
 """Extract tracking points from Mocha."""
 from __future__ import annotations
 
+import math
 import re
 from pathlib import Path
 from subprocess import list2cmdline
-from typing import TYPE_CHECKING, ClassVar, Optional
+from typing import TYPE_CHECKING, ClassVar, Generator, Optional
 
 import clique
 from ayon_core.lib import path_to_subprocess_arg, run_subprocess
-from ayon_core.pipeline import KnownPublishError, publish
+from ayon_core.pipeline import KnownPublishError, publish, registered_host
+from ayon_mocha.api.keyframes import simplify_track_data
 from ayon_mocha.api.lib import (
     ExporterProcessInfo,
     get_mocha_version,
+    write_exported_files,
 )
 from ayon_mocha.api.mocha_exporter_mappings import EXPORTER_MAPPING
+from ayon_mocha.api.proxy import get_trackable_clip_scale
+from ayon_mocha.api.track_writers import get_track_writer, write_track_file
+from ayon_mocha.api.worker import (
+    HostTask,
+    TaskCancelledError,
+    run_in_background,
+)
 from mocha.project import Layer, Project, View
 
 if TYPE_CHECKING:
+    from concurrent.futures import Future
     from logging import Logger
 
     import pyblish.api
     from ayon_mocha.api.lib import ExporterInfo
+    from ayon_mocha.api.track_data import TrackData
 
 EXTENSION_PATTERN = re.compile(r"(?P<name>.+)\(\*\.(?P<ext>\w+)\)")
 MOCHA_2025 = 2025
@@ -31,20 +43,45 @@ class ExportTrackingPoints(publish.Extractor):
 
     label = "Export Tracking Points"
     families: ClassVar[list[str]] = ["trackpoints"]
+    settings_category = "mocha"
     log: Logger
 
+    # write supported formats from sampled track data instead
+    # of running Mocha Pro exporters
+    write_from_track_data = False
+    # tolerance of keyframe reduction per exporter short name
+    keyframe_simplification: ClassVar[list[dict]] = []
+
     def process(self, instance: pyblish.api.Instance) -> None:
-        """Process the instance."""
-        dir_path = Path(self.staging_dir(instance))
+        """Process the instance.
+
+        Raises:
+            KnownPublishError: if the clip is loaded in lower resolution.
+
+        """
         project: Project = instance.context.data["project"]
         layer: Layer = instance.data["layer"]
 
+        # Mocha Pro exporters write the tracking in the resolution
+        # of the loaded clip
+        proxy_scale = get_trackable_clip_scale(
+            project, registered_host().get_containers())
+        if not math.isclose(proxy_scale, 1.0):
+            msg = (
+                "Tracking points are exported in the resolution of the "
+                "loaded clip. Switch the clip to full resolution to "
+                "export them.")
+            raise KnownPublishError(msg)
+
+        dir_path = Path(self.staging_dir(instance))
         process_info = ExporterProcessInfo(
             mocha_python_path=instance.context.data["mocha_python_path"],
             mocha_exporter_path=instance.context.data["mocha_exporter_path"],
             current_project_path=instance.context.data["currentFile"],
             staging_dir=dir_path,
-            options=instance.data["exporter_options"]
+            options=instance.data["exporter_options"],
+            track_data=instance.data.get("trackData"),
+            proxy_scale=proxy_scale,
         )
 
         """
@@ -63,6 +100,16 @@ class ExportTrackingPoints(publish.Extractor):
             process_info,
         )
 
+        keyframe_reports = {
+            self._exporter_name_to_representation_name(
+                output["name"]): output["keyframeReport"].to_dict()
+            for output in outputs
+            if output.get("keyframeReport")
+        }
+        if keyframe_reports:
+            instance.data.setdefault(
+                "versionData", {})["keyframeReports"] = keyframe_reports
+
         representations = self.process_outputs_to_representations(
             outputs, instance)
 
@@ -203,6 +250,11 @@ class ExportTrackingPoints(publish.Extractor):
         times are pretty fast, it's easier and probably
         faster than using the external export.
 
+        Formats with a writer in `track_writers` are written from
+        the sampled track data of the process info instead of running
+        their exporter if `write_from_track_data` is enabled or
+        keyframe simplification is set for them.
+
         Args:
             product_name (str): used for naming the resulting
                 files.
@@ -214,6 +266,55 @@ class ExportTrackingPoints(publish.Extractor):
         Returns:
             list[dict]: list of representations.
 
+        Raises:
+            KnownPublishError: if the export was cancelled.
+
+        """
+        task = HostTask(
+            self._iter_export(
+                product_name, project, exporters, layer, process_info),
+            total=len(exporters),
+            label=product_name,
+        )
+        task.message.connect(self.log.debug)
+        task.watch(project.progress_watcher)
+        try:
+            output, writes = task.wait()
+        except TaskCancelledError as exc:
+            raise KnownPublishError(str(exc)) from exc
+        for write in writes:
+            write.result()
+
+        return output
+
+    def _iter_export(
+            self,
+            product_name: str,
+            project: Project,
+            exporters: list[ExporterInfo],
+            layer: Layer,
+            process_info: ExporterProcessInfo,
+        ) -> Generator[str, None, tuple[list[dict], list[Future]]]:
+        """Run the exporters one by one.
+
+        Every exporter is one step of the export task, so the UI
+        can be updated in between.
+
+        Args:
+            product_name (str): used for naming the resulting
+                files.
+            project (Project): Mocha project.
+            exporters (list[ExporterInfo]): exporters to use.
+            layer (Layer): layer to export.
+            process_info (ExporterProcessInfo): process information.
+
+        Returns:
+            tuple[list[dict], list[Future]]: outputs and their pending
+                file writes.
+
+        Yields:
+            str: progress message.
+
         Raises:
             KnownPublishError: if the export fails.
 
@@ -226,7 +327,9 @@ class ExportTrackingPoints(publish.Extractor):
                 if view_info.name in views or view_info.abbr in views
             }
         )
+        options = process_info.options
         output: list[dict] = []
+        writes: list[Future] = []
         for exporter_info in exporters:
             exporter_name = exporter_info.label
             if not exporter_name:
@@ -242,10 +345,20 @@ class ExportTrackingPoints(publish.Extractor):
                 raise KnownPublishError(msg)
             """
 
-            options = process_info.options
-
             exporter_short_hash = exporter_info.id[:8]
 
+            written = self._write_from_track_data(
+                exporter_info,
+                process_info.track_data,
+                options,
+                process_info.staging_dir
+                / f"{product_name}_{exporter_short_hash}",
+            )
+            if written:
+                output.append(written)
+                yield f"Written {exporter_name}"
+                continue
+
             version = get_mocha_version() or "2024"
 
             # exporters were rewritten in 2025. For older version
@@ -288,8 +401,9 @@ class ExportTrackingPoints(publish.Extractor):
             output_files = []
 
             ext = None
-            for k, v in result.items():
-                Path(k).write_bytes(v)
+            # writing can run while the next exporter is working
+            writes.append(run_in_background(write_exported_files, result))
+            for k in result:
                 output_files.append(Path(k).name)
                 if ext is None:
                     ext = Path(k).suffix[1:]
@@ -301,8 +415,107 @@ class ExportTrackingPoints(publish.Extractor):
                 "stagingDir": process_info.staging_dir.as_posix(),
                 "outputName": exporter_short_hash,
             })
+            yield f"Exported {exporter_name}"
 
-        return output
+        return output, writes  # noqa: B901
+
+    def _write_from_track_data(
+            self,
+            exporter_info: ExporterInfo,
+            track_data: Optional[TrackData],
+            options: dict[str, bool],
+            path: Path) -> Optional[dict]:
+        """Write the format of the exporter from sampled track data.
+
+        Formats are written if `write_from_track_data` is enabled or
+        the format has tolerance set in `keyframe_simplification`,
+        data are then reduced to keyframes.
+
+        Options changing the exported data (inverted tracking, removed
+        lens distortion, frame time other than 0) are handled only
+        by Mocha Pro exporters. If the format can't be written,
+        a warning is logged when its keyframe simplification has
+        no effect.
+
+        Args:
+            exporter_info (ExporterInfo): exporter to replace.
+            track_data (Optional[TrackData]): sampled track data.
+            options (dict[str, bool]): exporter options.
+            path (Path): output file path without extension.
+
+        Returns:
+            Optional[dict]: output of the written file or None if
+                the exporter needs to be used.
+
+        """
+        tolerance = self._get_keyframe_tolerance(exporter_info.short_name)
+        if not self.write_from_track_data and tolerance is None:
+            return None
+
+        reason = None
+        if track_data is None:
+            reason = "track data were not sampled"
+        elif get_track_writer(exporter_info.short_name) is None:
+            reason = "the format has no track data writer"
+        elif (
+            options.get("invert")
+            or options.get("remove_lens_distortion")
+            or options.get("frame_time")
+        ):
+            reason = "exporter options need Mocha Pro exporter"
+        if reason:
+            if tolerance is not None:
+                self.log.warning(
+                    "Keyframe simplification of %s has no effect, %s.",
+                    exporter_info.label, reason)
+            return None
+
+        report = None
+        if tolerance is not None:
+            track_data, report = simplify_track_data(track_data, tolerance)
+            self.log.info(
+                "%s reduced from %d samples to %d keyframes (%.1fx), "
+                "max error %.4f px",
+                exporter_info.label,
+                report.sample_count,
+                report.keyframe_count,
+                report.compression_ratio,
+                report.max_error,
+            )
+
+        written = write_track_file(
+            track_data, exporter_info.short_name, path)
+        self.log.debug(
+            "Written %s from track data to: %s",
+            exporter_info.label, written)
+        return {
+            "name": exporter_info.label,
+            "ext": written.suffix[1:],
+            "files": [written.name],
+            "stagingDir": written.parent.as_posix(),
+            "outputName": exporter_info.id[:8],
+            "keyframeReport": report,
+        }
+
+    def _get_keyframe_tolerance(self, short_name: str) -> Optional[float]:
+        """Return tolerance of keyframe reduction for the format.
+
+        Args:
+            short_name (str): short name of the exporter.
+
+        Returns:
+            Optional[float]: tolerance in pixels or None if the format
+                is not reduced.
+
+        """
+        return next(
+            (
+                float(item["tolerance"])
+                for item in self.keyframe_simplification
+                if item["exporter"] == short_name
+            ),
+            None,
+        )
 
     def add_to_resources(
             self, path: Path, instance: pyblish.api.Instance) -> None:
@@ -0,0 +1,111 @@
+"""Render mattes of the layers to image sequence."""
+from __future__ import annotations
+
+import shutil
+from pathlib import Path
+from typing import TYPE_CHECKING, ClassVar
+
+from ayon_core.pipeline import KnownPublishError, publish
+from ayon_mocha.api.matte_render import MatteRenderJob, run_matte_render
+
+if TYPE_CHECKING:
+    from logging import Logger
+
+    import pyblish.api
+    from mocha.project import Project
+
+
+class ExtractMatteRender(publish.Extractor):
+    """Render mattes of the layers to image sequence.
+
+    Frame range is split to chunks rendered by headless Mocha Pro
+    processes from a copy of the project saved to the staging
+    directory, the workfile of the artist is not overwritten.
+    Images of all chunks are published as one sequence representation.
+    """
+
+    label = "Extract Matte Render"
+    families: ClassVar[list[str]] = ["render"]
+    settings_category = "mocha"
+    log: Logger
+
+    def process(self, instance: pyblish.api.Instance) -> None:
+        """Process the instance.
+
+        Raises:
+            KnownPublishError: If some of the chunks failed to render.
+
+        """
+        project: Project = instance.context.data["project"]
+        creator_attrs = instance.data["creator_attributes"]
+        staging_dir = Path(self.staging_dir(instance))
+
+        # workers render the project from disk
+        render_workfile = staging_dir / Path(
+            instance.context.data["currentFile"]).name
+        self._save_copy(project, render_workfile)
+
+        job = MatteRenderJob(
+            workfile=render_workfile,
+            layer_names=instance.data["renderLayers"],
+            output_dir=staging_dir,
+            prefix=f"{instance.data['productName']}.",
+            extension=creator_attrs["extension"],
+            colorize=creator_attrs["colorize"],
+        )
+        results = run_matte_render(
+            job,
+            Path(instance.context.data["mocha_python_path"]),
+            instance.data["renderRange"],
+            frame_offset=int(project.first_frame_offset),
+            workers=int(creator_attrs["workers"]),
+        )
+        failed = [result for result in results if not result.success]
+        for result in failed:
+            self.log.error(
+                "Frames %d-%d failed:\n%s",
+                result.start, result.end, result.output)
+        if failed:
+            msg = f"Failed to render {len(failed)} of {len(results)} chunks."
+            raise KnownPublishError(msg)
+
+        frame_start = instance.data["frameStart"]
+        frame_end = instance.data["frameEnd"]
+        files = [
+            job.get_file_name(frame)
+            for frame in range(frame_start, frame_end + 1)
+        ]
+        instance.data.setdefault("representations", []).append({
+            "name": job.extension,
+            "ext": job.extension,
+            "files": files if len(files) > 1 else files[0],
+            "stagingDir": staging_dir.as_posix(),
+            "frameStart": frame_start,
+            "frameEnd": frame_end,
+        })
+
+    def _save_copy(self, project: Project, path: Path) -> None:
+        """Save copy of the project without changing the workfile.
+
+        If `save_as` switches the project to the copy, the project is
+        switched back to the workfile, and the workfile is restored
+        to its state on disk, so unsaved changes stay unsaved.
+
+        Args:
+            project (Project): Mocha Pro project.
+            path (Path): Path to the copy.
+
+        """
+        workfile = Path(project.project_file)
+        project.save_as(path.as_posix())
+        self.log.debug("Saved render copy of the project to %s", path)
+        if Path(project.project_file) == workfile:
+            return
+
+        backup = path.with_name(f".{workfile.name}.bak")
+        shutil.copy2(workfile, backup)
+        try:
+            project.save_as(workfile.as_posix())
+        finally:
+            shutil.copy2(backup, workfile)
+            backup.unlink()
@@ -0,0 +1,71 @@
+"""Extract tracked mesh vertices of the layer."""
+from __future__ import annotations
+
+from pathlib import Path
+from typing import TYPE_CHECKING, ClassVar
+
+import pyblish.api
+from ayon_core.pipeline import publish, registered_host
+from ayon_mocha.api.mesh_data import DEFAULT_CHUNK_SIZE, write_mesh_data
+from ayon_mocha.api.proxy import get_proxy_scale
+
+if TYPE_CHECKING:
+    from logging import Logger
+
+    from ayon_mocha.api.pipeline import MochaProHost
+    from mocha.project import Layer, Project
+
+
+class ExtractMeshData(publish.Extractor):
+    """Extract tracked mesh vertices of the layer.
+
+    All vertices are sampled over the layer in/out range in chunks
+    of frames and published as `meshdata` representation. Runs only
+    for instances with mesh export enabled.
+    """
+
+    label = "Extract Mesh Data"
+    order = pyblish.api.ExtractorOrder - 0.01
+    families: ClassVar[list[str]] = ["trackpoints"]
+    settings_category = "mocha"
+    log: Logger
+
+    chunk_size = DEFAULT_CHUNK_SIZE
+
+    def process(self, instance: pyblish.api.Instance) -> None:
+        """Process the instance."""
+        if not instance.data.get("exportMesh"):
+            return
+
+        project: Project = instance.context.data["project"]
+        layer: Layer = instance.data["layer"]
+        if not layer.get_mesh():
+            self.log.warning("Layer %s has no mesh, skipping.", layer.name)
+            return
+
+        # mesh tracked on lower resolution clip is published
+        # in the original resolution
+        clip = project.default_trackable_clip
+        host: MochaProHost = registered_host()
+        scale = get_proxy_scale(
+            host.get_containers(), clip.name if clip else "")
+
+        staging_dir = Path(self.staging_dir(instance))
+        file_name = f"{instance.data['productName']}_mesh.npz"
+        vertex_count = write_mesh_data(
+            layer,
+            staging_dir / file_name,
+            frame_offset=int(project.first_frame_offset),
+            scale=1.0 / scale,
+            chunk_size=self.chunk_size,
+        )
+        self.log.debug(
+            "Extracted %d mesh vertices of %s", vertex_count, layer.name)
+
+        instance.data.setdefault("representations", []).append({
+            "name": "meshdata",
+            "ext": "npz",
+            "files": file_name,
+            "stagingDir": staging_dir.as_posix(),
+            "outputName": "meshdata",
+        })
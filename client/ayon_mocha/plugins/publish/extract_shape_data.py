@@ -0,0 +1,74 @@
+"""Extract sampled contours of the layer."""
+from __future__ import annotations
+
+import math
+from pathlib import Path
+from typing import TYPE_CHECKING, ClassVar
+
+import pyblish.api
+from ayon_core.pipeline import publish, registered_host
+from ayon_mocha.api.proxy import get_proxy_scale
+from ayon_mocha.api.shape_data import (
+    rescale_shape_data,
+    sample_contours,
+    write_shape_data,
+)
+
+if TYPE_CHECKING:
+    from logging import Logger
+
+    from ayon_mocha.api.pipeline import MochaProHost
+    from mocha.project import Layer, Project
+
+
+class ExtractShapeData(publish.Extractor):
+    """Extract sampled contours of the layer.
+
+    Contours are walked once per frame over the layer in/out range.
+    Sampled data are published as `shapedata` representation (shape
+    cache) and kept on the instance for the following extractors.
+    """
+
+    label = "Extract Shape Data"
+    order = pyblish.api.ExtractorOrder - 0.01
+    families: ClassVar[list[str]] = ["matteshapes"]
+    settings_category = "mocha"
+    log: Logger
+
+    def process(self, instance: pyblish.api.Instance) -> None:
+        """Process the instance."""
+        project: Project = instance.context.data["project"]
+        layer: Layer = instance.data["layer"]
+
+        clip = project.default_trackable_clip
+        frame_size = tuple(clip.frame_size) if clip else (0, 0)
+        shape_data = sample_contours(
+            layer,
+            frame_offset=int(project.first_frame_offset),
+            frame_size=frame_size,
+        )
+
+        # shapes drawn on lower resolution clip are published
+        # in the original resolution
+        host: MochaProHost = registered_host()
+        scale = get_proxy_scale(
+            host.get_containers(), clip.name if clip else "")
+        if not math.isclose(scale, 1.0):
+            shape_data = rescale_shape_data(shape_data, 1.0 / scale)
+
+        instance.data["shapeData"] = shape_data
+        self.log.debug(
+            "Sampled %d contours over %d frames of %s",
+            len(shape_data), len(shape_data.frames), layer.name)
+
+        staging_dir = Path(self.staging_dir(instance))
+        file_name = f"{instance.data['productName']}.npz"
+        write_shape_data(shape_data, staging_dir / file_name)
+
+        instance.data.setdefault("representations", []).append({
+            "name": "shapedata",
+            "ext": "npz",
+            "files": file_name,
+            "stagingDir": staging_dir.as_posix(),
+            "outputName": "shapedata",
+        })
@@ -0,0 +1,77 @@
+"""Extract sampled tracking data of the layer."""
+from __future__ import annotations
+
+import math
+from pathlib import Path
+from typing import TYPE_CHECKING, ClassVar
+
+import pyblish.api
+from ayon_core.pipeline import publish, registered_host
+from ayon_mocha.api.proxy import get_proxy_scale
+from ayon_mocha.api.track_data import (
+    rescale_track_data,
+    sample_layer,
+    write_track_data,
+)
+
+if TYPE_CHECKING:
+    from logging import Logger
+
+    from ayon_mocha.api.pipeline import MochaProHost
+    from mocha.project import Layer, Project
+
+
+class ExtractTrackData(publish.Extractor):
+    """Extract sampled tracking data of the layer.
+
+    Layer is sampled once over its in/out range. Sampled data are
+    published as `trackdata` representation and kept on the instance
+    for the following extractors.
+    """
+
+    label = "Extract Track Data"
+    order = pyblish.api.ExtractorOrder - 0.01
+    families: ClassVar[list[str]] = ["trackpoints"]
+    settings_category = "mocha"
+    log: Logger
+
+    output_format = "npz"
+
+    def process(self, instance: pyblish.api.Instance) -> None:
+        """Process the instance."""
+        project: Project = instance.context.data["project"]
+        layer: Layer = instance.data["layer"]
+
+        clip = project.default_trackable_clip
+        frame_size = tuple(clip.frame_size) if clip else (0, 0)
+        track_data = sample_layer(
+            layer,
+            frame_offset=int(project.first_frame_offset),
+            frame_size=frame_size,
+            frame_rate=float(project.frame_rate),
+        )
+
+        # data tracked on lower resolution clip are published
+        # in the original resolution
+        host: MochaProHost = registered_host()
+        scale = get_proxy_scale(
+            host.get_containers(), clip.name if clip else "")
+        if not math.isclose(scale, 1.0):
+            track_data = rescale_track_data(track_data, 1.0 / scale)
+
+        instance.data["trackData"] = track_data
+        self.log.debug(
+            "Sampled %d frames of %s", len(track_data), layer.name)
+
+        staging_dir = Path(self.staging_dir(instance))
+        file_name = f"{instance.data['productName']}.{self.output_format}"
+        write_track_data(
+            track_data, staging_dir / file_name, self.output_format)
+
+        instance.data.setdefault("representations", []).append({
+            "name": "trackdata",
+            "ext": self.output_format,
+            "files": file_name,
+            "stagingDir": staging_dir.as_posix(),
+            "outputName": "trackdata",
+        })
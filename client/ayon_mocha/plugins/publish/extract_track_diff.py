@@ -0,0 +1,119 @@
+"""Compare published tracking data with the previous version."""
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, ClassVar
+
+import ayon_api
+import pyblish.api
+from ayon_core.pipeline import get_representation_path
+from ayon_mocha.api.track_data import read_track_data
+from ayon_mocha.api.track_diff import DEFAULT_TOLERANCE, diff_track_data
+
+if TYPE_CHECKING:
+    from logging import Logger
+
+
+class ExtractTrackDiff(pyblish.api.ContextPlugin):
+    """Compare tracking data with the previous version.
+
+    Report of the changed frame ranges is stored in the version data,
+    so it is visible without loading the versions. Previous versions
+    of all instances are queried at once.
+    """
+
+    label = "Extract Track Diff"
+    order = pyblish.api.ExtractorOrder
+    families: ClassVar[list[str]] = ["trackpoints"]
+    settings_category = "mocha"
+    log: Logger
+
+    tolerance = DEFAULT_TOLERANCE
+
+    def process(self, context: pyblish.api.Context) -> None:
+        """Process the context."""
+        instances = [
+            instance for instance in context
+            if instance.data.get("publish", True)
+            and instance.data.get("trackData") is not None
+            and instance.data.get("folderEntity")
+        ]
+        if not instances:
+            return
+
+        previous = self._get_previous_representations(
+            context.data["projectName"], instances)
+        for instance in instances:
+            key = (
+                instance.data["folderEntity"]["id"],
+                instance.data["productName"],
+            )
+            if key not in previous:
+                self.log.debug(
+                    "No previous track data of %s", instance.data["name"])
+                continue
+            version, representation = previous[key]
+            try:
+                old_data = read_track_data(
+                    get_representation_path(representation))
+            except (OSError, KeyError, ValueError):
+                self.log.warning(
+                    "Failed to read track data of version %s",
+                    version["version"], exc_info=True)
+                continue
+
+            report = diff_track_data(
+                old_data, instance.data["trackData"], self.tolerance
+            ).to_dict()
+            report["previous_version"] = version["version"]
+            instance.data.setdefault("versionData", {})["trackDiff"] = report
+            self.log.info(
+                "%s changed frames %s since version %s",
+                instance.data["name"],
+                report["changed_ranges"],
+                version["version"],
+            )
+
+    @staticmethod
+    def _get_previous_representations(
+            project_name: str,
+            instances: list[pyblish.api.Instance],
+    ) -> dict[tuple[str, str], tuple[dict, dict]]:
+        """Return last versions and their track data representations.
+
+        Returns:
+            dict[tuple[str, str], tuple[dict, dict]]: Version and
+                representation entity by folder id and product name.
+
+        """
+        products = list(ayon_api.get_products(
+            project_name,
+            folder_ids={
+                instance.data["folderEntity"]["id"] for instance in instances
+            },
+            product_names={
+                instance.data["productName"] for instance in instances
+            },
+            fields={"id", "name", "folderId"},
+        ))
+        if not products:
+            return {}
+        versions = ayon_api.get_last_versions(
+            project_name,
+            {product["id"] for product in products},
+            fields={"id", "version", "productId"},
+        )
+        representations = {
+            representation["versionId"]: representation
+            for representation in ayon_api.get_representations(
+                project_name,
+                representation_names={"trackdata"},
+                version_ids={version["id"] for version in versions.values()},
+            )
+        }
+        previous = {}
+        for product in products:
+            version = versions.get(product["id"])
+            if version and version["id"] in representations:
+                previous[product["folderId"], product["name"]] = (
+                    version, representations[version["id"]])
+        return previous
@@ -452,6 +452,36 @@ class CreateShapeDataModel(BaseSettingsModel):
         title="Mocha Pro 2025")
 
 
+def matte_extension_enum() -> list[dict[str, str]]:
+    """Return enum for matte render image formats."""
+    return [
+        {"label": "PNG", "value": "png"},
+        {"label": "TIFF", "value": "tif"},
+        {"label": "OpenEXR", "value": "exr"},
+        {"label": "DPX", "value": "dpx"},
+    ]
+
+
+class CreateMatteRenderModel(BaseSettingsModel):
+    """Settings for creating matte renders."""
+    enabled: bool = SettingsField(
+        default=True, title="Enabled")
+    default_extension: str = SettingsField(
+        default="png", title="Default image format",
+        enum_resolver=matte_extension_enum)
+    workers: int = SettingsField(
+        default=4, title="Render processes", ge=1, le=64)
+
+
+class CreateCameraSolveModel(BaseSettingsModel):
+    """Settings for creating camera solves."""
+    enabled: bool = SettingsField(
+        default=True, title="Enabled")
+    default_exporters: list[str] = SettingsField(
+        default_factory=list,
+        title="Default exporters (short names)")
+
+
 class MochaProCreatorPlugins(BaseSettingsModel):
     """Mocha Pro creator plugins settings."""
     CreateTrackingPoints: CreateTrackingPointsModel = SettingsField(
@@ -460,3 +490,9 @@ class MochaProCreatorPlugins(BaseSettingsModel):
     CreateShapeData: CreateShapeDataModel = SettingsField(
         default_factory=CreateShapeDataModel,
         title="Create Shapes")
+    CreateMatteRender: CreateMatteRenderModel = SettingsField(
+        default_factory=CreateMatteRenderModel,
+        title="Create Matte Render")
+    CreateCameraSolve: CreateCameraSolveModel = SettingsField(
+        default_factory=CreateCameraSolveModel,
+        title="Create Camera Solve")
@@ -2,6 +2,7 @@
 from ayon_server.settings import BaseSettingsModel, SettingsField
 
 from .creator_plugins import MochaProCreatorPlugins
+from .publish_plugins import MochaProPublishPlugins
 
 
 class MochaProSettings(BaseSettingsModel):
@@ -9,6 +10,9 @@ class MochaProSettings(BaseSettingsModel):
     create: MochaProCreatorPlugins = SettingsField(
         default_factory=MochaProCreatorPlugins,
         title="Creator Plugins")
+    publish: MochaProPublishPlugins = SettingsField(
+        default_factory=MochaProPublishPlugins,
+        title="Publish Plugins")
 
 
 DEFAULT_VALUES = {
@@ -24,6 +28,38 @@ DEFAULT_VALUES = {
             "default_exporters": [
                 "SilhouetteShapes",
             ]
-        }
+        },
+        "CreateMatteRender": {
+            "enabled": True,
+            "default_extension": "png",
+            "workers": 4,
+        },
+        "CreateCameraSolve": {
+            "enabled": True,
+            "default_exporters": [
+                "NukeCamera",
+            ],
+        },
+    },
+    "publish": {
+        "ExtractTrackData": {
+            "enabled": True,
+            "output_format": "npz",
+        },
+        "ExtractShapeData": {
+            "enabled": True,
+        },
+        "ExtractMeshData": {
+            "enabled": True,
+            "chunk_size": 64,
+        },
+        "ExtractTrackDiff": {
+            "enabled": True,
+            "tolerance": 0.01,
+        },
+        "ExportTrackingPoints": {
+            "write_from_track_data": False,
+            "keyframe_simplification": [],
+        },
     }
 }
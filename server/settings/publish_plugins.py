@@ -0,0 +1,103 @@
+"""Publish plugin settings for Mocha Pro."""
+from __future__ import annotations
+
+from ayon_server.settings import BaseSettingsModel, SettingsField
+
+
+def track_data_format_enum() -> list[dict[str, str]]:
+    """Return enum for sampled track data formats."""
+    return [
+        {"label": "NumPy archive (*.npz)", "value": "npz"},
+        {"label": "Columnar JSON (*.json)", "value": "json"},
+    ]
+
+
+def keyframe_writer_enum() -> list[dict[str, str]]:
+    """Return enum for formats written from sampled track data."""
+    return [
+        {"label": "After Effects Corner Pin", "value": "AfxCornerPin"},
+        {"label": "Fusion Tracker Data", "value": "FusionCompData"},
+        {"label": "Nuke Tracker Data - 7.0+", "value": "Nuke7Tracker"},
+    ]
+
+
+class ExtractTrackDataModel(BaseSettingsModel):
+    """Settings for extracting sampled track data."""
+    enabled: bool = SettingsField(
+        default=True, title="Enabled")
+    output_format: str = SettingsField(
+        default="npz", title="Output format",
+        enum_resolver=track_data_format_enum)
+
+
+class ExtractShapeDataModel(BaseSettingsModel):
+    """Settings for extracting sampled contours."""
+    enabled: bool = SettingsField(
+        default=True, title="Enabled")
+
+
+class ExtractMeshDataModel(BaseSettingsModel):
+    """Settings for extracting tracked mesh vertices."""
+    enabled: bool = SettingsField(
+        default=True, title="Enabled")
+    chunk_size: int = SettingsField(
+        default=64, title="Frames per chunk", ge=1)
+
+
+class ExtractTrackDiffModel(BaseSettingsModel):
+    """Settings for comparing track data with the previous version."""
+    enabled: bool = SettingsField(
+        default=True, title="Enabled")
+    tolerance: float = SettingsField(
+        default=0.01, title="Tolerance (pixels)", ge=0.0)
+
+
+class KeyframeSimplificationModel(BaseSettingsModel):
+    """Keyframe reduction of one format."""
+    exporter: str = SettingsField(
+        default="", title="Exporter",
+        enum_resolver=keyframe_writer_enum)
+    tolerance: float = SettingsField(
+        default=0.1, title="Tolerance (pixels)", ge=0.0)
+
+
+class ExportTrackingPointsModel(BaseSettingsModel):
+    """Settings for exporting tracking points."""
+    write_from_track_data: bool = SettingsField(
+        default=False,
+        title="Write formats from track data",
+        description=(
+            "Write After Effects Corner Pin, Nuke 7 Tracker and Fusion "
+            "COMP formats from sampled track data instead of running "
+            "Mocha Pro exporters. Experimental, output isn't verified "
+            "against Mocha Pro exports yet."),
+    )
+    keyframe_simplification: list[KeyframeSimplificationModel] = (
+        SettingsField(
+            default_factory=list,
+            title="Keyframe simplification (formats written from track data)",
+            description=(
+                "Formats listed here are written from track data reduced "
+                "to keyframes, even if writing from track data is "
+                "disabled."),
+        )
+    )
+
+
+class MochaProPublishPlugins(BaseSettingsModel):
+    """Mocha Pro publish plugins settings."""
+    ExtractTrackData: ExtractTrackDataModel = SettingsField(
+        default_factory=ExtractTrackDataModel,
+        title="Extract Track Data")
+    ExtractShapeData: ExtractShapeDataModel = SettingsField(
+        default_factory=ExtractShapeDataModel,
+        title="Extract Shape Data")
+    ExtractMeshData: ExtractMeshDataModel = SettingsField(
+        default_factory=ExtractMeshDataModel,
+        title="Extract Mesh Data")
+    ExtractTrackDiff: ExtractTrackDiffModel = SettingsField(
+        default_factory=ExtractTrackDiffModel,
+        title="Extract Track Diff")
+    ExportTrackingPoints: ExportTrackingPointsModel = SettingsField(
+        default_factory=ExportTrackingPointsModel,
+        title="Export Tracking Points")
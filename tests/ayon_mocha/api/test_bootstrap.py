@@ -0,0 +1,49 @@
+"""Tests for the workfile bootstrap."""
+from __future__ import annotations
+
+import subprocess
+import sys
+from pathlib import Path
+from typing import TYPE_CHECKING
+from unittest.mock import MagicMock
+
+from ayon_mocha.api import bootstrap
+
+if TYPE_CHECKING:
+    import pytest
+
+
+def test_run_bootstrap(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that all workfiles are created by one Mocha Pro python."""
+    calls: list[dict] = []
+
+    def _run(args: list[str], **kwargs: object) -> subprocess.CompletedProcess:
+        calls.append({"args": args, "env": kwargs["env"]})
+        return subprocess.CompletedProcess(args, returncode=0, stdout=b"ok")
+
+    monkeypatch.setattr(bootstrap.subprocess, "run", _run)
+    workfiles = [
+        Path("/work/sh010_v001.mocha"), Path("/work/sh020_v001.mocha")]
+
+    process = bootstrap.run_bootstrap(
+        workfiles, Path("/mocha/python3"), env={})
+
+    assert process.returncode == 0
+    assert len(calls) == 1
+    assert calls[0]["args"] == [
+        "/mocha/python3", "-m", bootstrap.BOOTSTRAP_MODULE,
+        "/work/sh010_v001.mocha", "/work/sh020_v001.mocha",
+    ]
+    assert "PYTHONPATH" in calls[0]["env"]
+
+
+def test_main(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that workfiles are created without opening them."""
+    workio = MagicMock()
+    monkeypatch.setitem(sys.modules, "ayon_mocha.api.workio", workio)
+
+    assert bootstrap.main(["/work/a.mocha", "/work/b.mocha"]) == 0
+    assert [
+        call.args for call in workio.create_workfile.call_args_list
+    ] == [(Path("/work/a.mocha"),), (Path("/work/b.mocha"),)]
+    assert bootstrap.main([]) == 2
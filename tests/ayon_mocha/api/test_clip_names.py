@@ -0,0 +1,84 @@
+"""Tests for unique clip names."""
+from __future__ import annotations
+
+from unittest.mock import MagicMock
+
+import pytest
+from ayon_mocha.api.clip_names import (
+    ClipNameAllocator,
+    get_clip_name_allocator,
+    get_unique_clip_name,
+    invalidate_clip_name_allocator,
+)
+
+
+@pytest.mark.parametrize(("clip_names", "expected"), [
+    ([], "plate"),
+    (["bg", "plate_1"], "plate"),
+    (["plate"], "plate_1"),
+    (["plate", "plate_1", "plate_3"], "plate_4"),
+    (["plate", "plate_v2_5", "plateA_7"], "plate_1"),
+])
+def test_get_unique_clip_name(clip_names: list[str], expected: str) -> None:
+    """Test that the next free suffix is used."""
+    assert get_unique_clip_name("plate", clip_names) == expected
+
+
+def test_get_unique_clip_name_current_clips() -> None:
+    """Test that clips removed or added outside AYON are respected."""
+    clips = {"plate": object()}
+    name = get_unique_clip_name("plate", clips)
+    assert name == "plate_1"
+
+    clips[name] = object()
+    clips["plate_5"] = object()
+    assert get_unique_clip_name("plate", clips) == "plate_6"
+
+    del clips["plate"]
+    assert get_unique_clip_name("plate", clips) == "plate"
+
+
+def test_allocator_scans_once() -> None:
+    """Test that the project is scanned again only on collision."""
+    clips = {"plate": object(), "plate_2": object()}
+    scans: list[int] = []
+
+    def _get_clip_names() -> dict:
+        scans.append(len(clips))
+        return clips
+
+    allocator = ClipNameAllocator(_get_clip_names)
+    assert allocator.allocate("bg") == "bg"
+    assert allocator.allocate("fg") == "fg"
+    assert len(scans) == 1
+
+    clips[allocator.allocate("plate")] = object()
+    assert "plate_3" in clips
+    assert len(scans) == 2
+
+    # removed clip is noticed on collision
+    del clips["plate"]
+    clips[allocator.allocate("plate")] = object()
+    assert allocator.allocate("plate") == "plate_4"
+
+
+def test_allocator_cached_per_project() -> None:
+    """Test that the allocator is kept for the live project."""
+    clips = {"plate": object()}
+    project = MagicMock()
+    project.get_clips.return_value = clips
+    other_project = MagicMock()
+    other_project.get_clips.return_value = {}
+
+    allocator = get_clip_name_allocator(project)
+    assert get_clip_name_allocator(project) is allocator
+    clips[allocator.allocate("plate")] = object()
+    assert allocator.allocate("plate") == "plate_2"
+    assert project.get_clips.call_count == 2
+
+    assert get_clip_name_allocator(other_project) is not allocator
+    assert get_clip_name_allocator(other_project).allocate("plate") == "plate"
+
+    invalidate_clip_name_allocator()
+    assert get_clip_name_allocator(other_project).allocate("plate") == "plate"
+    invalidate_clip_name_allocator()
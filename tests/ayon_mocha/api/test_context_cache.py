@@ -0,0 +1,59 @@
+"""Tests for the context entities cache."""
+from __future__ import annotations
+
+from ayon_mocha.api.context_cache import ContextCache
+
+
+class FakeClock:
+    """Clock controlled by the test."""
+
+    def __init__(self) -> None:
+        """Initialize the clock."""
+        self.time = 0.0
+
+    def __call__(self) -> float:
+        """Return current time.
+
+        Returns:
+            float: Current time.
+
+        """
+        return self.time
+
+
+def test_cache_value_per_key() -> None:
+    """Test that value is fetched once per context key."""
+    calls = []
+    cache = ContextCache(ttl=10.0, clock=FakeClock())
+
+    def fetch() -> int:
+        calls.append(1)
+        return len(calls)
+
+    assert cache.get(("project", "/sh010", "track"), fetch) == 1
+    assert cache.get(("project", "/sh010", "track"), fetch) == 1
+    assert cache.get(("project", "/sh020", "track"), fetch) == 2
+    assert len(calls) == 2
+
+
+def test_cache_expires() -> None:
+    """Test that value is fetched again after time to live."""
+    clock = FakeClock()
+    cache = ContextCache(ttl=10.0, clock=clock)
+    values = iter(["first", "second"])
+
+    assert cache.get("key", lambda: next(values)) == "first"
+    clock.time = 9.0
+    assert cache.get("key", lambda: next(values)) == "first"
+    clock.time = 10.0
+    assert cache.get("key", lambda: next(values)) == "second"
+
+
+def test_cache_invalidate() -> None:
+    """Test that invalidated value is fetched again."""
+    cache = ContextCache(ttl=10.0, clock=FakeClock())
+    values = iter(["first", "second"])
+
+    assert cache.get("key", lambda: next(values)) == "first"
+    cache.invalidate()
+    assert cache.get("key", lambda: next(values)) == "second"
@@ -0,0 +1,153 @@
+"""Tests for the local frame cache."""
+from __future__ import annotations
+
+import os
+import shutil
+from typing import TYPE_CHECKING
+
+import pytest
+from ayon_mocha.api.frame_cache import FrameCache
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+FRAME_SIZE = 100
+
+
+@pytest.fixture
+def frames(tmp_path: Path) -> list[Path]:
+    """Create source frames.
+
+    Returns:
+        list[Path]: Paths to the frames.
+
+    """
+    source_dir = tmp_path / "source"
+    source_dir.mkdir()
+    paths = []
+    for frame in range(1001, 1006):
+        path = source_dir / f"plate.{frame}.exr"
+        path.write_bytes(bytes([frame % 256]) * FRAME_SIZE)
+        paths.append(path)
+    return paths
+
+
+def test_cache_files(tmp_path: Path, frames: list[Path]) -> None:
+    """Test that frames are copied next to each other in the cache."""
+    cache = FrameCache(tmp_path / "cache")
+    assert not cache.is_cached(frames)
+
+    cached = cache.cache_files(frames)
+
+    assert cache.is_cached(frames)
+    assert [path.name for path in cached] == [path.name for path in frames]
+    assert len({path.parent for path in cached}) == 1
+    for source, target in zip(frames, cached):
+        assert target.read_bytes() == source.read_bytes()
+    assert cache.get_size() == FRAME_SIZE * len(frames)
+
+
+def test_cache_keeps_directories_apart(tmp_path: Path) -> None:
+    """Test that same file names from other directories don't collide."""
+    cache = FrameCache(tmp_path / "cache")
+    first = tmp_path / "v001" / "plate.1001.exr"
+    second = tmp_path / "v002" / "plate.1001.exr"
+    for path in (first, second):
+        path.parent.mkdir()
+        path.write_text(path.parent.name)
+
+    cached = cache.cache_files([first, second])
+
+    assert cached[0] != cached[1]
+    assert cached[0].read_text() == "v001"
+    assert cached[1].read_text() == "v002"
+
+
+def test_evict_least_recently_used(
+        tmp_path: Path, frames: list[Path]) -> None:
+    """Test that the oldest files are evicted over the cache size."""
+    cache = FrameCache(tmp_path / "cache", max_size=FRAME_SIZE * 3)
+    cached = [cache.get_cached_path(path) for path in frames]
+    cached[0].parent.mkdir(parents=True)
+    for age, path in enumerate(reversed(cached)):
+        path.write_bytes(b"0" * FRAME_SIZE)
+        os.utime(path, (1000 - age, 0))
+
+    removed = cache.evict(protected={cached[0]})
+
+    assert set(removed) == {cached[1], cached[2]}
+    assert cache.get_size() == FRAME_SIZE * 3
+    assert cached[0].is_file()
+
+
+def test_cache_refreshes_changed_source(
+        tmp_path: Path, frames: list[Path]) -> None:
+    """Test that frames changed in place are copied again."""
+    cache = FrameCache(tmp_path / "cache")
+    cached = cache.cache_files(frames)
+    assert cache.is_cached(frames)
+
+    # same size, only modification time differs
+    frames[0].write_bytes(b"x" * FRAME_SIZE)
+    stat = frames[0].stat()
+    os.utime(frames[0], ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    # different size
+    frames[1].write_bytes(b"y" * (FRAME_SIZE + 1))
+    assert not cache.is_cached(frames)
+
+    assert cache.cache_files(frames) == cached
+    assert cache.is_cached(frames)
+    assert cached[0].read_bytes() == frames[0].read_bytes()
+    assert cached[1].read_bytes() == frames[1].read_bytes()
+
+
+def test_cache_removes_incomplete_copy(
+        tmp_path: Path,
+        frames: list[Path],
+        monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that failed copy leaves no temporary file behind."""
+    def _copyfile(source: Path, target: Path) -> None:
+        target.write_bytes(source.read_bytes()[:10])
+        msg = "No space left on device"
+        raise OSError(msg)
+
+    monkeypatch.setattr(shutil, "copyfile", _copyfile)
+    cache = FrameCache(tmp_path / "cache")
+
+    with pytest.raises(OSError, match="No space"):
+        cache.cache_files(frames[:1])
+
+    assert not any(cache.get_cached_path(frames[0]).parent.iterdir())
+
+
+def test_cache_evicts_while_copying(
+        tmp_path: Path, frames: list[Path]) -> None:
+    """Test that old files are evicted before the batch fills the cache."""
+    cache = FrameCache(
+        tmp_path / "cache",
+        max_size=FRAME_SIZE * 3,
+        max_workers=1,
+        evict_interval=1,
+    )
+    old_dir = tmp_path / "cache" / "old"
+    old_dir.mkdir(parents=True)
+    old_files = []
+    for age in range(3):
+        path = old_dir / f"old.{age}.exr"
+        path.write_bytes(b"0" * FRAME_SIZE)
+        os.utime(path, (1000 - age, 0))
+        old_files.append(path)
+
+    sizes: list[int] = []
+    cache_file = cache._cache_file  # noqa: SLF001
+
+    def _cache_file(source: Path) -> Path:
+        sizes.append(cache.get_size())
+        return cache_file(source)
+
+    cache._cache_file = _cache_file  # noqa: SLF001
+    cache.cache_files(frames)
+
+    assert sizes[:3] == [FRAME_SIZE * 2] * 3
+    assert not any(path.exists() for path in old_files)
+    assert cache.is_cached(frames)
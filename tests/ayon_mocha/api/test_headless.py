@@ -0,0 +1,130 @@
+"""Tests for the headless publishing."""
+from __future__ import annotations
+
+import json
+import subprocess
+import sys
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+from ayon_mocha.api import headless
+
+AYON_DATA = {
+    "context": {"publish_attributes": {}},
+    "containers": [],
+    "publish_instances": [
+        {"folderPath": "/shots/sh010", "task": "tracking"},
+    ],
+}
+
+
+@pytest.fixture
+def workfiles(tmp_path: Path) -> list[Path]:
+    """Create workfiles, the second one fails to publish.
+
+    Returns:
+        list[Path]: Paths to the workfiles.
+
+    """
+    paths = []
+    for name in ("sh010_v001.mocha", "broken_v001.mocha"):
+        path = tmp_path / name
+        path.write_bytes((
+            "<project><notes>"
+            f"AYON_CONTEXT::{json.dumps(AYON_DATA)}::AYON_CONTEXT_END"
+            "</notes></project>"
+        ).encode())
+        paths.append(path)
+    return paths
+
+
+@pytest.fixture
+def calls(monkeypatch: pytest.MonkeyPatch) -> list[dict]:
+    """Replace running of the publish processes.
+
+    Returns:
+        list[dict]: Arguments and environment of the processes.
+
+    """
+    recorded: list[dict] = []
+
+    def _run(args: list[str], **kwargs: object) -> subprocess.CompletedProcess:
+        recorded.append({"args": args, "env": kwargs["env"]})
+        failed = "broken" in args[-1]
+        return subprocess.CompletedProcess(
+            args,
+            returncode=1 if failed else 0,
+            stdout=b"Failed ExtractTrackData" if failed else b"ok",
+        )
+
+    monkeypatch.setattr(headless.subprocess, "run", _run)
+    return recorded
+
+
+def test_run_batch_publish(
+        workfiles: list[Path], calls: list[dict]) -> None:
+    """Test that results are collected in the order of workfiles."""
+    results = headless.run_batch_publish(
+        workfiles, Path("/mocha/python3"), max_workers=2, env={})
+
+    assert [result.workfile for result in results] == workfiles
+    assert [result.success for result in results] == [True, False]
+    assert results[1].output == "Failed ExtractTrackData"
+
+    assert sorted(call["args"][-1] for call in calls) == sorted(
+        path.as_posix() for path in workfiles)
+    for call in calls:
+        assert call["args"][:3] == [
+            "/mocha/python3", "-m", headless.HEADLESS_MODULE]
+        assert call["env"]["AYON_FOLDER_PATH"] == "/shots/sh010"
+        assert call["env"]["AYON_TASK_NAME"] == "tracking"
+
+
+@pytest.fixture
+def pyblish_util(monkeypatch: pytest.MonkeyPatch) -> MagicMock:
+    """Mock modules imported by `publish_workfile`.
+
+    Returns:
+        MagicMock: Mocked `pyblish.util` module.
+
+    """
+    pyblish = MagicMock()
+    modules = {
+        "pyblish": pyblish,
+        "pyblish.api": pyblish.api,
+        "pyblish.util": pyblish.util,
+        "ayon_core.pipeline": MagicMock(),
+        "ayon_core.pipeline.create": MagicMock(),
+        "mocha": MagicMock(),
+        "mocha.project": MagicMock(),
+        "ayon_mocha.api.pipeline": MagicMock(),
+    }
+    for name, module in modules.items():
+        monkeypatch.setitem(sys.modules, name, module)
+    return pyblish.util
+
+
+def test_publish_workfile(
+        pyblish_util: MagicMock, caplog: pytest.LogCaptureFixture) -> None:
+    """Test that plugin errors fail the publish."""
+    error = RuntimeError("No layer")
+    error.traceback = ("extract_track_data.py", 42, "process", "")
+    plugin = type("ExtractTrackData", (), {})
+    pyblish_util.publish_iter.return_value = iter([
+        {"plugin": plugin, "error": None},
+        {"plugin": plugin, "error": error},
+    ])
+
+    assert not headless.publish_workfile(Path("sh010_v001.mocha"))
+    assert "Failed ExtractTrackData: No layer" in caplog.text
+
+    pyblish_util.publish_iter.return_value = iter([
+        {"plugin": plugin, "error": None},
+    ])
+    assert headless.publish_workfile(Path("sh010_v001.mocha"))
+
+
+def test_main_usage() -> None:
+    """Test that missing workfile argument is refused."""
+    assert headless.main([]) == 2
@@ -0,0 +1,75 @@
+"""Tests for the keyframe reduction."""
+from __future__ import annotations
+
+import numpy as np
+import pytest
+from ayon_mocha.api.keyframes import (
+    get_interpolation_error,
+    simplify_keyframes,
+    simplify_track_data,
+)
+from ayon_mocha.api.track_data import TrackData
+from ayon_mocha.api.track_writers import format_nuke_tracker
+
+
+@pytest.fixture
+def track_data() -> TrackData:
+    """Return surface moving right and then down.
+
+    Returns:
+        TrackData: Track data of 21 frames.
+
+    """
+    frames = np.arange(1001, 1022)
+    steps = np.arange(21, dtype=np.float64)
+    offsets = np.column_stack(
+        [np.minimum(steps, 10.0), np.maximum(steps - 10.0, 0.0)])
+    corners = np.array([[0.0, 0.0], [10.0, 0.0], [10.0, 10.0], [0.0, 10.0]])
+    return TrackData(
+        layer_name="screen",
+        frames=frames,
+        transform=np.tile(np.eye(3), (21, 1, 1)),
+        surface=corners + offsets[:, np.newaxis],
+        frame_size=(100, 100),
+        frame_rate=24.0,
+    )
+
+
+def test_linear_curve_keeps_ends() -> None:
+    """Test that linear curve is reduced to its first and last frame."""
+    frames = np.arange(100)
+    values = np.column_stack([frames * 2.0, frames * -0.5])
+
+    assert simplify_keyframes(frames, values, 1e-9).tolist() == [0, 99]
+
+
+def test_tolerance_is_kept() -> None:
+    """Test that the reduced curve stays within the tolerance."""
+    frames = np.arange(200)
+    values = np.sin(frames / 10.0) * 50.0
+    for tolerance in (0.01, 0.5, 5.0):
+        keyframes = simplify_keyframes(frames, values, tolerance)
+        error = get_interpolation_error(frames, values, keyframes)
+        assert error <= tolerance
+        assert len(keyframes) < len(frames)
+
+
+def test_simplify_track_data(track_data: TrackData) -> None:
+    """Test that the corner of the motion is kept with a report."""
+    simplified, report = simplify_track_data(track_data, 0.001)
+
+    assert simplified.frames.tolist() == [1001, 1011, 1021]
+    assert simplified.surface.shape == (3, 4, 2)
+    assert report.sample_count == 21
+    assert report.keyframe_count == 3
+    assert report.compression_ratio == pytest.approx(7.0)
+    assert report.max_error == pytest.approx(0.0)
+    assert report.to_dict()["compression_ratio"] == pytest.approx(7.0)
+
+
+def test_reduced_data_are_linear(track_data: TrackData) -> None:
+    """Test that writers interpolate reduced data linearly."""
+    simplified, _ = simplify_track_data(track_data, 0.001)
+
+    assert "{curve L x1001" in format_nuke_tracker(simplified)
+    assert "{curve L" not in format_nuke_tracker(track_data)
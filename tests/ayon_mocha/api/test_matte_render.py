@@ -0,0 +1,49 @@
+"""Tests for the parallel matte render."""
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+from ayon_mocha.api.matte_render import (
+    MatteRenderJob,
+    get_chunk_args,
+    parse_args,
+    split_frame_range,
+)
+
+
+@pytest.mark.parametrize(
+    ("start", "end", "count", "expected"),
+    [
+        (0, 9, 3, [(0, 3), (4, 6), (7, 9)]),
+        (0, 1, 4, [(0, 0), (1, 1)]),
+        (5, 5, 2, [(5, 5)]),
+        (5, 4, 2, []),
+    ],
+)
+def test_split_frame_range(
+        start: int, end: int, count: int,
+        expected: list[tuple[int, int]]) -> None:
+    """Test that chunks cover the whole range without overlaps."""
+    assert split_frame_range(start, end, count) == expected
+
+
+def test_chunk_args_round_trip() -> None:
+    """Test that chunk arguments are parsed by the worker."""
+    job = MatteRenderJob(
+        workfile=Path("/work/shot.mocha"),
+        layer_names=["Layer 1", "--odd name"],
+        output_dir=Path("/work/render"),
+        prefix="renderMatte.",
+        extension="exr",
+        colorize=True,
+    )
+    args = parse_args(get_chunk_args(job, 10, 19, frame_offset=1001))
+
+    assert args.workfile == job.workfile
+    assert args.layers == job.layer_names
+    assert args.output_dir == job.output_dir
+    assert args.extension == "exr"
+    assert args.colorize
+    assert (args.start, args.end, args.index_start) == (10, 19, 1011)
+    assert job.get_file_name(args.index_start) == "renderMatte.1011.exr"
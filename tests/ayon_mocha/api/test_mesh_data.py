@@ -0,0 +1,109 @@
+"""Tests for the sampled mesh vertex tracks."""
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import numpy as np
+import pytest
+from ayon_mocha.api.mesh_data import (
+    iter_mesh_chunks,
+    read_mesh_data,
+    write_mesh_data,
+)
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+class FakeVertex:
+    """Vertex moving right by one pixel per frame."""
+
+    def __init__(self, index: int) -> None:
+        """Initialize the vertex."""
+        self.index = index
+
+    def get_track_position(self, time: float) -> tuple[float, float]:
+        """Return tracked position at the time.
+
+        Returns:
+            tuple[float, float]: Position.
+
+        """
+        return self.index * 10.0 + time, float(self.index)
+
+
+class FakeMesh:
+    """Mesh with four vertices."""
+
+    @staticmethod
+    def get_vertices() -> list[FakeVertex]:
+        """Return vertices of the mesh.
+
+        Returns:
+            list[FakeVertex]: Vertices.
+
+        """
+        return [FakeVertex(index) for index in range(4)]
+
+
+class FakeLayer:
+    """Layer with mesh tracked over ten frames."""
+    name = "face"
+
+    @staticmethod
+    def in_point() -> int:
+        """Return first frame of the layer.
+
+        Returns:
+            int: First frame.
+
+        """
+        return 0
+
+    @staticmethod
+    def out_point() -> int:
+        """Return last frame of the layer.
+
+        Returns:
+            int: Last frame.
+
+        """
+        return 9
+
+    @staticmethod
+    def get_mesh() -> FakeMesh:
+        """Return mesh of the layer.
+
+        Returns:
+            FakeMesh: Mesh.
+
+        """
+        return FakeMesh()
+
+
+def test_iter_mesh_chunks() -> None:
+    """Test that frames are split to chunks of the given size."""
+    vertices = FakeMesh.get_vertices()
+    sizes = [
+        len(chunk)
+        for chunk in iter_mesh_chunks(vertices, np.arange(10), chunk_size=4)
+    ]
+
+    assert sizes == [4, 4, 2]
+
+
+@pytest.mark.parametrize("chunk_size", [1, 3, 64])
+def test_write_read(tmp_path: Path, chunk_size: int) -> None:
+    """Test that chunked data are read back as one array."""
+    path = tmp_path / "mesh.npz"
+    count = write_mesh_data(
+        FakeLayer(), path, frame_offset=1001, scale=2.0,
+        chunk_size=chunk_size)
+    result = read_mesh_data(path)
+
+    assert count == 4
+    assert len(result) == 4
+    assert result.layer_name == "face"
+    assert result.frames.tolist() == list(range(1001, 1011))
+    assert result.positions.shape == (10, 4, 2)
+    assert result.positions[9, 3].tolist() == [78.0, 6.0]
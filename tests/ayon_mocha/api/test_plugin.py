@@ -0,0 +1,80 @@
+"""Tests for the plugin API."""
+from __future__ import annotations
+
+import importlib
+import sys
+from typing import TYPE_CHECKING
+from unittest.mock import MagicMock
+
+import pytest
+
+if TYPE_CHECKING:
+    from types import ModuleType
+
+
+class KnownPublishError(Exception):
+    """Stand-in for AYON publish error."""
+
+
+@pytest.fixture
+def plugin(monkeypatch: pytest.MonkeyPatch) -> ModuleType:
+    """Import the module with mocked AYON and Mocha Pro modules.
+
+    Returns:
+        ModuleType: `ayon_mocha.api.plugin` module.
+
+    """
+    pipeline = MagicMock()
+    pipeline.Creator = object
+    pipeline.load.LoaderPlugin = object
+    pipeline.KnownPublishError = KnownPublishError
+    for name, module in (
+        ("ayon_core.lib", MagicMock()),
+        ("ayon_core.pipeline", pipeline),
+        ("ayon_core.pipeline.load", MagicMock()),
+        ("ayon_core.pipeline.create", MagicMock()),
+        ("ayon_mocha.api.lib", MagicMock()),
+        ("ayon_mocha.api.pipeline", MagicMock()),
+        ("ayon_mocha.api.proxy", MagicMock()),
+    ):
+        monkeypatch.setitem(sys.modules, name, module)
+    monkeypatch.delitem(sys.modules, "ayon_mocha.api.plugin", raising=False)
+    return importlib.import_module("ayon_mocha.api.plugin")
+
+
+def test_remove_layer(plugin: ModuleType) -> None:
+    """Test that the layer removes itself and its container is removed."""
+    layer = MagicMock()
+    layer.name = "screen"
+    other_layer = MagicMock()
+    other_layer.name = "background"
+    host = plugin.registered_host.return_value
+    project = host.get_current_project.return_value
+    project.layers = [other_layer, layer]
+
+    plugin.MochaLayerLoader().remove({"objectName": "screen"})
+
+    layer.remove.assert_called_once_with()
+    other_layer.remove.assert_not_called()
+    host.remove_container.assert_called_once()
+
+
+def test_get_instance_layers(plugin: ModuleType) -> None:
+    """Test that layers are resolved by the layer mode."""
+    layers = [MagicMock(), MagicMock(), MagicMock()]
+    instance = MagicMock()
+    instance.context.data = {"project": MagicMock(layers=layers)}
+    instance.data = {"creator_attributes": {
+        "layer_mode": "selected", "layers": [2, 0]}}
+    assert plugin.get_instance_layers(instance) == [layers[2], layers[0]]
+
+    # placeholder of empty layer list is not a layer
+    instance.data["creator_attributes"]["layers"] = [-1]
+    assert plugin.get_instance_layers(instance) == []
+
+    instance.data["creator_attributes"]["layer_mode"] = "all"
+    assert plugin.get_instance_layers(instance) == layers
+
+    instance.data["creator_attributes"]["layer_mode"] = "visible"
+    with pytest.raises(KnownPublishError, match="visible"):
+        plugin.get_instance_layers(instance)
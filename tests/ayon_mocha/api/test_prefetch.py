@@ -0,0 +1,66 @@
+"""Tests for the frame prefetcher."""
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+from ayon_mocha.api.prefetch import FramePrefetcher, get_frames_in_range
+
+
+@pytest.fixture
+def frames(tmp_path: Path) -> list[Path]:
+    """Create frames of the clip.
+
+    Returns:
+        list[Path]: Paths to the frames in reversed order.
+
+    """
+    paths = []
+    for frame in reversed(range(995, 1011)):
+        path = tmp_path / f"plate_v001.{frame:04d}.exr"
+        path.write_bytes(b"0" * 16)
+        paths.append(path)
+    return paths
+
+
+def test_get_frames_in_range(frames: list[Path]) -> None:
+    """Test that frames are filtered and sorted in tracking order."""
+    result = get_frames_in_range(frames, 1001, 1005)
+    assert [path.name for path in result] == [
+        f"plate_v001.{frame}.exr" for frame in range(1001, 1006)]
+
+
+@pytest.mark.parametrize("name", ["plate.exr", "plate_v001.exr"])
+def test_get_frames_in_range_single_file(name: str) -> None:
+    """Test that single file is kept even with a number in its name."""
+    path = Path(name)
+    assert get_frames_in_range([path], 1001, 1005) == [path]
+
+
+def test_get_frames_in_range_version_number(tmp_path: Path) -> None:
+    """Test that only the frame token of the sequence is matched."""
+    files = [
+        tmp_path / f"plate_v002.{frame}.exr" for frame in (1006, 1001, 1002)]
+    assert get_frames_in_range(files, 1, 1002) == [
+        tmp_path / "plate_v002.1001.exr", tmp_path / "plate_v002.1002.exr"]
+
+
+def test_prefetch(frames: list[Path]) -> None:
+    """Test that all frames are read."""
+    prefetcher = FramePrefetcher(max_workers=2)
+    job = prefetcher.prefetch("plate", frames)
+    job.wait()
+    assert job.done
+    assert job.read_count == len(frames)
+
+
+def test_prefetch_cancelled_by_new_prefetch(frames: list[Path]) -> None:
+    """Test that prefetch of the same key cancels the previous one."""
+    prefetcher = FramePrefetcher(max_workers=1)
+    first_job = prefetcher.prefetch("plate", frames)
+    second_job = prefetcher.prefetch("plate", frames[:2])
+    second_job.wait()
+    first_job.wait()
+    assert first_job.cancelled
+    assert not second_job.cancelled
+    assert second_job.read_count == 2
@@ -0,0 +1,60 @@
+"""Tests for product names of instances split per layer."""
+from __future__ import annotations
+
+import importlib
+import sys
+from typing import TYPE_CHECKING
+from unittest.mock import MagicMock
+
+import pytest
+
+if TYPE_CHECKING:
+    from types import ModuleType
+
+
+@pytest.fixture
+def product_name(monkeypatch: pytest.MonkeyPatch) -> ModuleType:
+    """Import the module with mocked `ayon_core.pipeline.create`.
+
+    Returns:
+        ModuleType: `ayon_mocha.api.product_name` module.
+
+    """
+    create = MagicMock()
+    create.get_product_name.side_effect = (
+        lambda **kwargs: f"{kwargs['product_type']}{kwargs['variant']}")
+    monkeypatch.setitem(sys.modules, "ayon_core.pipeline", MagicMock())
+    monkeypatch.setitem(sys.modules, "ayon_core.pipeline.create", create)
+    monkeypatch.delitem(
+        sys.modules, "ayon_mocha.api.product_name", raising=False)
+    return importlib.import_module("ayon_mocha.api.product_name")
+
+
+def test_get_product_names(product_name: ModuleType) -> None:
+    """Test that cached settings and project entity are passed."""
+    create_context = MagicMock()
+    create_context.project_name = "demo"
+    create_context.host_name = "mochapro"
+    create_context.get_current_task_name.return_value = "tracking"
+    create_context.get_current_task_type.return_value = "Tracking"
+
+    names = product_name.get_product_names(
+        create_context, "trackpoints", ["bgMain", "fgMain"])
+
+    assert names == ["trackpointsbgMain", "trackpointsfgMain"]
+    get_product_name = product_name.get_product_name
+    assert get_product_name.call_count == 2
+    kwargs = get_product_name.call_args.kwargs
+    assert kwargs["project_settings"] is (
+        create_context.get_current_project_settings.return_value)
+    assert kwargs["project_entity"] is (
+        create_context.get_current_project_entity.return_value)
+    assert kwargs["task_name"] == "tracking"
+    assert kwargs["task_type"] == "Tracking"
+    create_context.get_current_project_settings.assert_called_once_with()
+
+
+def test_get_layer_variant(product_name: ModuleType) -> None:
+    """Test that layer name is sanitized and prefixed."""
+    assert product_name.get_layer_variant(
+        "Layer 1", "main") == "Layer_1Main"
@@ -0,0 +1,103 @@
+"""Tests for the offline project reader."""
+from __future__ import annotations
+
+import gzip
+import json
+from typing import TYPE_CHECKING
+
+import pytest
+from ayon_mocha.api.project_reader import (
+    read_ayon_data,
+    read_metadata_block,
+    read_workfile_metadata,
+)
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+AYON_DATA = {
+    "context": {"publish_attributes": {}},
+    "containers": [
+        {"name": "plate", "representation": "abc", "version": "3"},
+        {},
+    ],
+    "publish_instances": [
+        {"instance_id": "123"},
+        {
+            "instance_id": "456",
+            "folderPath": "/shots/sh010",
+            "task": "tracking",
+        },
+    ],
+}
+
+
+def _project_content(data: str) -> bytes:
+    """Return fake project content with notes containing AYON data.
+
+    Returns:
+        bytes: Project file content.
+
+    """
+    return (
+        "<project>\n"
+        f"{'x' * 5000}\n"
+        f"<notes>Some notes\nAYON_CONTEXT::{data}::AYON_CONTEXT_END\n</notes>"
+        f"{'y' * 5000}\n"
+        "</project>\n"
+    ).encode()
+
+
+@pytest.fixture
+def project_file(tmp_path: Path) -> Path:
+    """Create fake project file with AYON data.
+
+    Returns:
+        Path: Path to the project file.
+
+    """
+    path = tmp_path / "test.mocha"
+    path.write_bytes(_project_content(json.dumps(AYON_DATA, indent=4)))
+    return path
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 64, 1024 * 1024])
+def test_read_metadata_block_chunks(
+        project_file: Path, chunk_size: int) -> None:
+    """Test that guards split between chunks are found."""
+    block = read_metadata_block(project_file, chunk_size=chunk_size)
+    assert block is not None
+    assert json.loads(block) == AYON_DATA
+
+
+def test_read_ayon_data_escaped(tmp_path: Path) -> None:
+    """Test reading notes stored with escaped XML entities."""
+    path = tmp_path / "escaped.mocha"
+    escaped = json.dumps(AYON_DATA).replace('"', "&quot;")
+    path.write_bytes(_project_content(escaped))
+    assert read_ayon_data(path) == AYON_DATA
+
+
+def test_read_ayon_data_gzip(tmp_path: Path) -> None:
+    """Test reading compressed project file."""
+    path = tmp_path / "compressed.mocha"
+    path.write_bytes(gzip.compress(_project_content(json.dumps(AYON_DATA))))
+    assert read_ayon_data(path) == AYON_DATA
+
+
+def test_read_ayon_data_missing(tmp_path: Path) -> None:
+    """Test reading project without AYON data."""
+    path = tmp_path / "empty.mocha"
+    path.write_bytes(b"<project><notes>Nothing here</notes></project>")
+    assert read_ayon_data(path) == {}
+
+
+def test_read_workfile_metadata(project_file: Path) -> None:
+    """Test reading workfile metadata."""
+    metadata = read_workfile_metadata(project_file)
+    assert metadata.path == project_file
+    assert metadata.context == AYON_DATA["context"]
+    assert metadata.containers == [AYON_DATA["containers"][0]]
+    assert metadata.publish_instances == AYON_DATA["publish_instances"]
+    assert metadata.folder_path == "/shots/sh010"
+    assert metadata.task_name == "tracking"
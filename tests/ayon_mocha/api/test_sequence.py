@@ -0,0 +1,56 @@
+"""Tests for the sequence descriptor."""
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+from ayon_mocha.api.sequence import build_sequence_descriptor
+
+DIRECTORY = Path("/publish/plate/v003")
+
+
+def test_sequence() -> None:
+    """Test that the sequence is described by its frame range."""
+    names = [f"plate_v003.{frame:04d}.exr" for frame in range(1010, 990, -1)]
+    sequence = build_sequence_descriptor(DIRECTORY, names)
+
+    assert sequence.is_sequence
+    assert sequence.is_contiguous
+    assert sequence.first_file == "plate_v003.0991.exr"
+    assert sequence.get_relink_arguments() == {
+        "path": (DIRECTORY / "plate_v003.0991.exr").as_posix(),
+        "prefix": "plate_v003.",
+        "suffix": ".exr",
+        "start_frame": 991,
+        "end_frame": 1010,
+    }
+
+
+def test_sequence_with_gaps() -> None:
+    """Test that missing frames are detected."""
+    sequence = build_sequence_descriptor(
+        DIRECTORY, ["plate.1001.exr", "plate.1002.exr", "plate.1005.exr"])
+
+    assert sequence.is_sequence
+    assert not sequence.is_contiguous
+    assert (sequence.start_frame, sequence.end_frame) == (1001, 1005)
+
+
+@pytest.mark.parametrize("names", [
+    ["plate.exr"],
+    ["plate_v003.exr"],
+    ["plate.1001.exr", "matte.1001.exr"],
+])
+def test_single_file(names: list[str]) -> None:
+    """Test that files not forming one sequence are a single file."""
+    sequence = build_sequence_descriptor(DIRECTORY, names)
+
+    assert not sequence.is_sequence
+    assert sequence.get_relink_arguments() == {
+        "path": (DIRECTORY / min(names)).as_posix()}
+
+
+def test_no_files() -> None:
+    """Test that empty file list is refused."""
+    with pytest.raises(ValueError, match="without files"):
+        build_sequence_descriptor(DIRECTORY, [])
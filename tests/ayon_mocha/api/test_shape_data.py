@@ -0,0 +1,245 @@
+"""Tests for the sampled contours."""
+from __future__ import annotations
+
+import dataclasses
+from typing import TYPE_CHECKING
+
+import numpy as np
+import pytest
+from ayon_mocha.api.shape_data import (
+    CONTOUR_BEZIER,
+    CONTOUR_XSPLINE,
+    ShapeData,
+    apply_shape_data,
+    read_shape_data,
+    rescale_shape_data,
+    sample_contours,
+    write_shape_data,
+)
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+@dataclasses.dataclass
+class FakeBezierPointData:
+    """Point data of bezier control point."""
+    x: float
+    y: float
+    handle_offset_backward: tuple[float, float] = (-1.0, 0.0)
+    handle_offset_forward: tuple[float, float] = (1.0, 0.0)
+    edge_width: float = 2.0
+    edge_angle_ratio: float = 0.5
+    corner: bool = False
+    active: bool = True
+
+
+@dataclasses.dataclass
+class FakeXPointData:
+    """Point data of x-spline control point."""
+    x: float
+    y: float
+    weight: float = 0.25
+    edge_width: float = 0.0
+    edge_angle_ratio: float = 0.5
+    corner: bool = True
+    active: bool = True
+
+
+class FakePoint:
+    """Control point moving down by one pixel per frame."""
+
+    def __init__(self, x: float, data_class: type) -> None:
+        """Initialize the point."""
+        self.x = x
+        self.data_class = data_class
+
+    def get_point_data(self, time: float) -> object:
+        """Return point data at the time.
+
+        Returns:
+            object: Point data.
+
+        """
+        return self.data_class(self.x, time)
+
+
+class BezierContour:
+    """Bezier contour with two points."""
+    control_points = (
+        FakePoint(0.0, FakeBezierPointData),
+        FakePoint(10.0, FakeBezierPointData),
+    )
+
+
+class XSplineContour:
+    """X-spline contour with three points."""
+    control_points = (
+        FakePoint(20.0, FakeXPointData),
+        FakePoint(30.0, FakeXPointData),
+        FakePoint(40.0, FakeXPointData),
+    )
+
+
+class FakeLayer:
+    """Layer with one bezier and one x-spline contour."""
+    name = "roto"
+
+    @staticmethod
+    def in_point() -> int:
+        """Return first frame of the layer.
+
+        Returns:
+            int: First frame.
+
+        """
+        return 0
+
+    @staticmethod
+    def out_point() -> int:
+        """Return last frame of the layer.
+
+        Returns:
+            int: Last frame.
+
+        """
+        return 3
+
+    @staticmethod
+    def get_contours() -> list[object]:
+        """Return contours of the layer.
+
+        Returns:
+            list[object]: Contours.
+
+        """
+        return [BezierContour(), XSplineContour()]
+
+
+@pytest.fixture
+def shape_data() -> ShapeData:
+    """Sample the fake layer.
+
+    Returns:
+        ShapeData: Sampled data.
+
+    """
+    return sample_contours(FakeLayer(), frame_offset=1001, frame_size=(64, 32))
+
+
+def test_sample_contours(shape_data: ShapeData) -> None:
+    """Test that all points of all contours are sampled."""
+    assert shape_data.frames.tolist() == [1001, 1002, 1003, 1004]
+    assert shape_data.points.shape == (4, 5, 11)
+    assert shape_data.contour_offsets.tolist() == [0, 2, 5]
+    assert shape_data.contour_types == [CONTOUR_BEZIER, CONTOUR_XSPLINE]
+
+    bezier = shape_data.get_contour_points(0)
+    xspline = shape_data.get_contour_points(1)
+    assert bezier.shape == (4, 2, 11)
+    assert xspline[:, :, 0].tolist() == [[20.0, 30.0, 40.0]] * 4
+    assert shape_data.get_field("y")[:, 0].tolist() == [0.0, 1.0, 2.0, 3.0]
+    assert bezier[0, 0, 2:7].tolist() == [-1.0, 0.0, 1.0, 0.0, 0.0]
+    assert xspline[0, 0, 2:7].tolist() == [0.0, 0.0, 0.0, 0.0, 0.25]
+    assert shape_data.get_field("corner").tolist() == [[0, 0, 1, 1, 1]] * 4
+
+
+def test_write_read(tmp_path: Path, shape_data: ShapeData) -> None:
+    """Test that written data are read back unchanged."""
+    result = read_shape_data(
+        write_shape_data(shape_data, tmp_path / "roto.npz"))
+
+    assert result.layer_name == "roto"
+    assert result.frame_size == (64, 32)
+    assert result.contour_types == shape_data.contour_types
+    np.testing.assert_array_equal(result.frames, shape_data.frames)
+    np.testing.assert_array_equal(result.points, shape_data.points)
+    np.testing.assert_array_equal(
+        result.contour_offsets, shape_data.contour_offsets)
+
+
+def test_rescale(shape_data: ShapeData) -> None:
+    """Test that positions and widths are scaled, flags are kept."""
+    result = rescale_shape_data(shape_data, 2.0)
+
+    assert result.frame_size == (128, 64)
+    np.testing.assert_array_equal(
+        result.get_field("x"), shape_data.get_field("x") * 2)
+    np.testing.assert_array_equal(
+        result.get_field("edge_width"), shape_data.get_field("edge_width") * 2)
+    np.testing.assert_array_equal(
+        result.get_field("weight"), shape_data.get_field("weight"))
+    np.testing.assert_array_equal(
+        result.get_field("active"), shape_data.get_field("active"))
+
+
+class FakeCreatedContour:
+    """Contour created in the layer, recording its control points."""
+
+    def __init__(
+            self, contour_type: str, time: float, points: list) -> None:
+        """Initialize the contour."""
+        self.contour_type = contour_type
+        self.time = time
+        self.points_by_time: dict[float, list] = {time: points}
+
+    def set_control_points(self, time: float, points: list) -> None:
+        """Set control points at the time."""
+        self.points_by_time[time] = points
+
+
+class FakeTargetLayer:
+    """Layer recording the created contours."""
+
+    def __init__(self) -> None:
+        """Initialize the layer."""
+        self.contours: list[FakeCreatedContour] = []
+
+    def add_bezier_contour(
+            self, time: float, points: list) -> FakeCreatedContour:
+        """Add bezier contour.
+
+        Returns:
+            FakeCreatedContour: Created contour.
+
+        """
+        self.contours.append(
+            FakeCreatedContour(CONTOUR_BEZIER, time, points))
+        return self.contours[-1]
+
+    def add_xspline_contour(
+            self, time: float, points: list) -> FakeCreatedContour:
+        """Add x-spline contour.
+
+        Returns:
+            FakeCreatedContour: Created contour.
+
+        """
+        self.contours.append(
+            FakeCreatedContour(CONTOUR_XSPLINE, time, points))
+        return self.contours[-1]
+
+
+def test_apply_shape_data(shape_data: ShapeData) -> None:
+    """Test that applied contours have the sampled point data."""
+    layer = FakeTargetLayer()
+    count = apply_shape_data(
+        layer,
+        shape_data,
+        {CONTOUR_BEZIER: FakeBezierPointData, CONTOUR_XSPLINE: FakeXPointData},
+        frame_offset=1001,
+    )
+
+    assert count == 4 * 5
+    assert [contour.contour_type for contour in layer.contours] == [
+        CONTOUR_BEZIER, CONTOUR_XSPLINE]
+    for contour, source in zip(
+            layer.contours, FakeLayer.get_contours()):
+        assert contour.time == pytest.approx(0.0)
+        assert contour.points_by_time == {
+            time: [
+                source_point.get_point_data(time)
+                for source_point in source.control_points
+            ]
+            for time in (0.0, 1.0, 2.0, 3.0)
+        }
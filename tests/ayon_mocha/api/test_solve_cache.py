@@ -0,0 +1,114 @@
+"""Tests for the camera solve export cache."""
+from __future__ import annotations
+
+import dataclasses
+from types import SimpleNamespace
+from typing import TYPE_CHECKING
+
+import numpy as np
+import pytest
+from ayon_mocha.api.solve_cache import (
+    SolveCache,
+    get_parameter_state,
+    get_solve_fingerprint,
+)
+from ayon_mocha.api.track_data import TrackData
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+@pytest.fixture
+def track_data() -> TrackData:
+    """Return track data of a surface moving right.
+
+    Returns:
+        TrackData: Track data of 5 frames.
+
+    """
+    corners = np.array([[0.0, 0.0], [10.0, 0.0], [10.0, 10.0], [0.0, 10.0]])
+    offsets = np.arange(5, dtype=np.float64)[:, np.newaxis, np.newaxis]
+    return TrackData(
+        layer_name="camera",
+        frames=np.arange(1001, 1006),
+        transform=np.tile(np.eye(3), (5, 1, 1)),
+        surface=corners + offsets * np.array([1.0, 0.0]),
+        frame_size=(100, 100),
+        frame_rate=24.0,
+    )
+
+
+def test_fingerprint_is_stable(track_data: TrackData) -> None:
+    """Test that the same input gives the same fingerprint."""
+    options = {"frame_time": 0.0, "project_length": 5}
+    copied = dataclasses.replace(track_data, surface=track_data.surface.copy())
+    assert get_solve_fingerprint(track_data, options) == \
+        get_solve_fingerprint(copied, dict(reversed(options.items())))
+
+
+def test_fingerprint_changes(track_data: TrackData) -> None:
+    """Test that changed data or options change the fingerprint."""
+    options = {"frame_time": 0.0}
+    fingerprint = get_solve_fingerprint(track_data, options)
+
+    moved = track_data.surface.copy()
+    moved[2, 0, 0] += 0.001
+    assert get_solve_fingerprint(
+        dataclasses.replace(track_data, surface=moved), options) != fingerprint
+    assert get_solve_fingerprint(
+        track_data, {"frame_time": 1.0}) != fingerprint
+    assert get_solve_fingerprint(
+        dataclasses.replace(track_data, frame_rate=25.0),
+        options) != fingerprint
+
+
+def test_parameter_state() -> None:
+    """Test that parameters of nested sets are collected."""
+    focal = SimpleNamespace(
+        full_path="solve/focal", value=35.0, keyframes={1001: 35.0})
+    motion = SimpleNamespace(
+        full_path="solve/motion", value="Translation", keyframes={})
+    psets = SimpleNamespace(
+        parameters=[],
+        subsets=[SimpleNamespace(parameters=[focal, motion], subsets=[])],
+    )
+    state = get_parameter_state(psets)
+    assert state == {
+        "solve/focal": "35.0|{1001: 35.0}",
+        "solve/motion": "Translation|{}",
+    }
+
+    focal.value = 50.0
+    assert get_parameter_state(psets) != state
+
+
+def test_store_and_restore(tmp_path: Path) -> None:
+    """Test that restored files are renamed to the new stem."""
+    export_dir = tmp_path / "export"
+    export_dir.mkdir()
+    files = [export_dir / "cameraMain_abc.nk", export_dir / "readme.txt"]
+    for file_path in files:
+        file_path.write_text(file_path.name)
+
+    cache = SolveCache(tmp_path / "cache")
+    cache.store("f" * 64, "abcdef", "cameraMain_abc", files)
+
+    destination = tmp_path / "publish"
+    destination.mkdir()
+    restored = cache.restore("f" * 64, "abcdef", "cameraHero_abc", destination)
+    assert restored is not None
+    assert [path.name for path in restored] == [
+        "cameraHero_abc.nk", "readme.txt"]
+    assert restored[0].read_text() == "cameraMain_abc.nk"
+
+
+def test_restore_missing(tmp_path: Path) -> None:
+    """Test that incomplete or missing entries are not restored."""
+    cache = SolveCache(tmp_path / "cache")
+    assert cache.restore("0" * 64, "abcdef", "stem", tmp_path) is None
+
+    source = tmp_path / "stem.nk"
+    source.write_text("data")
+    cache.store("0" * 64, "abcdef", "stem", [source])
+    next(cache.root.rglob("stem.nk")).unlink()
+    assert cache.restore("0" * 64, "abcdef", "stem", tmp_path) is None
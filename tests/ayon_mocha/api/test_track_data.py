@@ -0,0 +1,191 @@
+"""Tests for the sampled track data."""
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import numpy as np
+import pytest
+from ayon_mocha.api.track_data import (
+    SURFACE_PARAMETERS,
+    TRANSFORM_PARAMETERS,
+    TrackData,
+    apply_track_data,
+    get_missing_parameters,
+    read_track_data,
+    rescale_track_data,
+    sample_layer,
+    write_track_data,
+)
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+class FakeLayer:
+    """Layer moving by one pixel per frame."""
+    name = "screen"
+
+    @staticmethod
+    def in_point() -> int:
+        """Return first frame of the layer.
+
+        Returns:
+            int: First frame.
+
+        """
+        return 10
+
+    @staticmethod
+    def out_point() -> int:
+        """Return last frame of the layer.
+
+        Returns:
+            int: Last frame.
+
+        """
+        return 14
+
+    @staticmethod
+    def get_transform_matrix(time: float) -> list[float]:
+        """Return transformation matrix at the time.
+
+        Returns:
+            list[float]: Row-major 3x3 matrix.
+
+        """
+        return [1.0, 0.0, time, 0.0, 1.0, 0.0, 0.0, 0.0, 1.0]
+
+    @staticmethod
+    def get_surface_position(time: float) -> list[tuple[float, float]]:
+        """Return surface corners at the time.
+
+        Returns:
+            list[tuple[float, float]]: Corners.
+
+        """
+        return [(time, 0.0), (time + 10, 0.0), (time + 10, 10.0), (time, 10)]
+
+
+@pytest.fixture
+def track_data() -> TrackData:
+    """Sample the fake layer.
+
+    Returns:
+        TrackData: Sampled data.
+
+    """
+    return sample_layer(
+        FakeLayer(), frame_offset=1000, frame_size=(100, 50), frame_rate=24)
+
+
+def test_sample_layer(track_data: TrackData) -> None:
+    """Test that the whole in/out range is sampled."""
+    assert track_data.frames.tolist() == list(range(1010, 1015))
+    assert track_data.transform.shape == (5, 3, 3)
+    assert track_data.surface.shape == (5, 4, 2)
+    assert track_data.transform[:, 0, 2].tolist() == list(range(10, 15))
+    assert track_data.surface[-1, 1].tolist() == [24.0, 0.0]
+
+
+@pytest.mark.parametrize("output_format", ["npz", "json"])
+def test_write_read(
+        tmp_path: Path, track_data: TrackData, output_format: str) -> None:
+    """Test that written data are read back unchanged."""
+    path = write_track_data(
+        track_data, tmp_path / f"track.{output_format}")
+    result = read_track_data(path)
+
+    assert result.layer_name == "screen"
+    assert result.frame_size == (100, 50)
+    assert result.frame_rate == 24.0  # noqa: RUF069
+    np.testing.assert_array_equal(result.frames, track_data.frames)
+    np.testing.assert_array_equal(result.transform, track_data.transform)
+    np.testing.assert_array_equal(result.surface, track_data.surface)
+
+
+def test_write_unsupported_format(
+        tmp_path: Path, track_data: TrackData) -> None:
+    """Test that unknown format is refused."""
+    with pytest.raises(ValueError, match="Unsupported"):
+        write_track_data(track_data, tmp_path / "track.txt")
+
+
+def test_rescale(track_data: TrackData) -> None:
+    """Test that data are rescaled to the original resolution."""
+    result = rescale_track_data(track_data, 2.0)
+
+    assert result.frame_size == (200, 100)
+    np.testing.assert_array_equal(result.surface, track_data.surface * 2)
+    np.testing.assert_array_equal(
+        result.transform[:, 0, 2], track_data.transform[:, 0, 2] * 2)
+
+
+class FakeParameter:
+    """Parameter recording the assigned keyframes."""
+
+    def __init__(self, *, exists: bool = True) -> None:
+        """Initialize the parameter."""
+        self.exists = exists
+        self.keyframes: list[tuple[float, float]] = []
+
+    def __bool__(self) -> bool:
+        """Whether the parameter exists.
+
+        Returns:
+            bool: False for null parameter.
+
+        """
+        return self.exists
+
+    def set_keyframes(self, keyframes: list[tuple[float, float]]) -> None:
+        """Replace keyframes of the parameter."""
+        if self.exists:
+            self.keyframes = keyframes
+
+
+class FakeTargetLayer:
+    """Layer with parameters created on access."""
+
+    def __init__(self, missing: tuple[tuple[str, ...], ...] = ()) -> None:
+        """Initialize the layer."""
+        self.missing = missing
+        self.parameters: dict[tuple[str, ...], FakeParameter] = {}
+
+    def parameter(self, path: list[str]) -> FakeParameter:
+        """Return parameter of the layer.
+
+        Returns:
+            FakeParameter: Parameter, null if it is missing.
+
+        """
+        return self.parameters.setdefault(
+            tuple(path),
+            FakeParameter(exists=tuple(path) not in self.missing))
+
+
+def test_apply_track_data(track_data: TrackData) -> None:
+    """Test that sampled data are applied back to the layer times."""
+    layer = FakeTargetLayer()
+    count = apply_track_data(layer, track_data, frame_offset=1000)
+
+    assert count == len(track_data) * 17
+    assert set(layer.parameters) == {
+        *TRANSFORM_PARAMETERS, *SURFACE_PARAMETERS}
+    translate_x = layer.parameters[TRANSFORM_PARAMETERS[2]].keyframes
+    assert translate_x == [(time, time) for time in range(10, 15)]
+    corner_x = layer.parameters[SURFACE_PARAMETERS[2]].keyframes
+    assert corner_x == [(time, time + 10) for time in range(10, 15)]
+
+
+def test_get_missing_parameters() -> None:
+    """Test that parameters not found on the layer are reported."""
+    missing = (TRANSFORM_PARAMETERS[0], SURFACE_PARAMETERS[-1])
+    assert get_missing_parameters(FakeTargetLayer()) == []
+    assert get_missing_parameters(FakeTargetLayer(missing)) == list(missing)
+
+
+def test_apply_track_data_checks_keyframes(track_data: TrackData) -> None:
+    """Test that keyframes not assigned to the parameter are reported."""
+    layer = FakeTargetLayer((TRANSFORM_PARAMETERS[0],))
+    with pytest.raises(ValueError, match="Track/Matrix/m00"):
+        apply_track_data(layer, track_data)
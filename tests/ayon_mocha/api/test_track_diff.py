@@ -0,0 +1,79 @@
+"""Tests for the diff of tracking data versions."""
+from __future__ import annotations
+
+import dataclasses
+import json
+
+import numpy as np
+import pytest
+from ayon_mocha.api.track_data import TrackData
+from ayon_mocha.api.track_diff import diff_track_data, get_frame_ranges
+
+
+@pytest.fixture
+def track_data() -> TrackData:
+    """Return static surface.
+
+    Returns:
+        TrackData: Track data of frames 1001-1010.
+
+    """
+    corners = np.array([[0.0, 0.0], [10.0, 0.0], [10.0, 10.0], [0.0, 10.0]])
+    return TrackData(
+        layer_name="screen",
+        frames=np.arange(1001, 1011),
+        transform=np.tile(np.eye(3), (10, 1, 1)),
+        surface=np.tile(corners, (10, 1, 1)),
+        frame_size=(100, 100),
+        frame_rate=24.0,
+    )
+
+
+def test_get_frame_ranges() -> None:
+    """Test that consecutive frames are joined to ranges."""
+    assert get_frame_ranges(np.array([])) == []
+    assert get_frame_ranges(np.array([5])) == [[5, 5]]
+    assert get_frame_ranges(np.array([1, 2, 3, 7, 9, 10])) == [
+        [1, 3], [7, 7], [9, 10]]
+
+
+def test_unchanged(track_data: TrackData) -> None:
+    """Test that the same data have no changes."""
+    report = diff_track_data(track_data, track_data).to_dict()
+
+    assert report["changed_ranges"] == []
+    assert report["changed_frame_count"] == 0
+    assert report["max_displacement"] == pytest.approx(0.0)
+    assert "max_displacement_frame" not in report
+
+
+def test_changed_frames(track_data: TrackData) -> None:
+    """Test that moved corners are reported per frame."""
+    surface = track_data.surface.copy()
+    surface[2:4, 1] += (3.0, 4.0)
+    surface[7, 3, 0] += 0.001
+    surface[8, 0, 1] -= 2.0
+    diff = diff_track_data(
+        track_data, dataclasses.replace(track_data, surface=surface))
+
+    np.testing.assert_allclose(
+        diff.displacement, [0, 0, 5, 5, 0, 0, 0, 0.001, 2, 0])
+    report = diff.to_dict()
+    assert report["changed_ranges"] == [[1003, 1004], [1009, 1009]]
+    assert report["max_displacement"] == pytest.approx(5.0)
+    assert report["max_displacement_frame"] == 1003
+    json.dumps(report)
+
+
+def test_added_and_removed_frames(track_data: TrackData) -> None:
+    """Test that frames in one version only are reported as changed."""
+    new = dataclasses.replace(
+        track_data,
+        frames=track_data.frames + 3,
+    )
+    report = diff_track_data(track_data, new).to_dict()
+
+    assert report["added_ranges"] == [[1011, 1013]]
+    assert report["removed_ranges"] == [[1001, 1003]]
+    assert report["changed_ranges"] == [[1001, 1003], [1011, 1013]]
+    assert report["max_displacement"] == pytest.approx(0.0)
@@ -0,0 +1,89 @@
+"""Tests for the tracking format writers."""
+from __future__ import annotations
+
+from pathlib import Path
+
+import numpy as np
+import pytest
+from ayon_mocha.api.track_data import TrackData
+from ayon_mocha.api.track_writers import (
+    NUKE_TRACK_DEFAULTS,
+    WRITERS,
+    format_numbers,
+    get_track_writer,
+    write_track_file,
+)
+
+# reviewed writer outputs, not Mocha Pro exports (regression only)
+FIXTURES_DIR = Path(__file__).parent / "fixtures" / "track_writers"
+
+
+@pytest.fixture
+def track_data() -> TrackData:
+    """Return surface moving right by one pixel per frame.
+
+    Returns:
+        TrackData: Track data of three frames.
+
+    """
+    offsets = np.arange(3, dtype=np.float64)[:, None, None]
+    corners = np.array(
+        [[10.0, 20.0], [110.0, 20.0], [110.0, 70.5], [10.0, 70.5]])
+    surface = corners + offsets * [1.0, 0.0]
+    return TrackData(
+        layer_name="screen",
+        frames=np.arange(1001, 1004),
+        transform=np.tile(np.eye(3), (3, 1, 1)),
+        surface=surface,
+        frame_size=(200, 100),
+        frame_rate=24.0,
+    )
+
+
+def test_format_numbers() -> None:
+    """Test that numbers are written without trailing zeros."""
+    result = format_numbers(np.array([1.0, 0.5, -1e-9, 1.2345678]))
+
+    assert result.tolist() == ["1", "0.5", "0", "1.234568"]
+
+
+@pytest.mark.parametrize("short_name", sorted(WRITERS))
+def test_write_track_file(
+        tmp_path: Path, track_data: TrackData, short_name: str) -> None:
+    """Test that written files match the fixtures byte for byte.
+
+    Fixtures are reviewed outputs of the writers, not Mocha Pro
+    exports, so they only guard against regressions.
+    """
+    extension = WRITERS[short_name].extension
+    path = write_track_file(track_data, short_name, tmp_path / "track")
+
+    assert path.name == f"track.{extension}"
+    expected = FIXTURES_DIR / f"{short_name}.{extension}"
+    assert path.read_bytes() == expected.read_bytes()
+
+
+def test_unknown_writer(tmp_path: Path, track_data: TrackData) -> None:
+    """Test that formats without writer are refused."""
+    assert get_track_writer("NukeRotoBasic") is None
+    with pytest.raises(ValueError, match="No track writer"):
+        write_track_file(track_data, "NukeRotoBasic", tmp_path / "track")
+
+
+def test_unknown_frame_size(tmp_path: Path, track_data: TrackData) -> None:
+    """Test that formats needing frame size refuse data without it."""
+    track_data.frame_size = (0, 0)
+    with pytest.raises(ValueError, match="Frame size"):
+        write_track_file(track_data, "Nuke7Tracker", tmp_path / "track")
+
+
+def test_nuke_pattern_inside_search() -> None:
+    """Test that the pattern box of Nuke tracks is inside search box."""
+    values = NUKE_TRACK_DEFAULTS.split()
+    # pattern and search boxes follow error_min and error_max
+    start = values.index("0") + 2
+    pattern = [float(value) for value in values[start:start + 4]]
+    search = [float(value) for value in values[start + 4:start + 8]]
+
+    assert search[0] < pattern[0] < pattern[2] < search[2]
+    assert search[1] < pattern[1] < pattern[3] < search[3]
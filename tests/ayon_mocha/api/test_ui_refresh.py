@@ -0,0 +1,73 @@
+"""Tests for coalesced UI refreshing."""
+from __future__ import annotations
+
+import logging
+from unittest.mock import MagicMock
+
+import pytest
+from ayon_mocha.api import ui_refresh
+from ayon_mocha.api.ui_refresh import UIRefreshScheduler
+
+
+@pytest.fixture
+def application(monkeypatch: pytest.MonkeyPatch) -> MagicMock:
+    """Replace Qt application and timer.
+
+    Returns:
+        MagicMock: Mocked `QApplication` class.
+
+    """
+    application = MagicMock()
+    monkeypatch.setattr(ui_refresh, "QApplication", application)
+    timer = MagicMock()
+    timer.return_value.isActive.return_value = False
+    monkeypatch.setattr(ui_refresh, "QTimer", timer)
+    monkeypatch.setattr(ui_refresh.time, "monotonic", lambda: 10.0)
+    return application
+
+
+def test_request_coalesced(application: MagicMock) -> None:
+    """Test that requests within the interval are coalesced."""
+    scheduler = UIRefreshScheduler(interval=100)
+    scheduler.request()
+    scheduler.request()
+    scheduler.request()
+
+    assert application.processEvents.call_count == 1
+    timer = scheduler._timer  # noqa: SLF001
+    assert timer is not None
+    timer.start.assert_called_with(100)
+
+    scheduler._on_timeout()  # noqa: SLF001
+    assert application.processEvents.call_count == 2
+    assert scheduler.get_stats() == {"requested": 3, "pumped": 2}
+
+
+def test_suppressed(
+        application: MagicMock, caplog: pytest.LogCaptureFixture) -> None:
+    """Test that suppressed block refreshes once when it ends."""
+    caplog.set_level(logging.DEBUG, logger="ayon_mocha.ui_refresh")
+    scheduler = UIRefreshScheduler(interval=0)
+    with scheduler.suppressed():
+        with scheduler.suppressed():
+            scheduler.request()
+            scheduler.request()
+        scheduler.request()
+        application.processEvents.assert_not_called()
+    application.processEvents.assert_called_once_with()
+    assert scheduler.get_stats() == {"requested": 3, "pumped": 1}
+    assert "'requested': 3, 'pumped': 1" in caplog.text
+
+    with scheduler.suppressed():
+        pass
+    application.processEvents.assert_called_once_with()
+
+
+def test_request_without_application(
+        application: MagicMock) -> None:
+    """Test that nothing is pumped without Qt application."""
+    application.instance.return_value = None
+    scheduler = UIRefreshScheduler()
+    scheduler.request()
+    application.processEvents.assert_not_called()
+    assert scheduler.get_stats() == {"requested": 1, "pumped": 0}
@@ -0,0 +1,89 @@
+"""Tests for running host tasks without Qt application."""
+from __future__ import annotations
+
+from typing import Generator
+
+import pytest
+from ayon_mocha.api.worker import (
+    TASK_MONITOR,
+    HostTask,
+    TaskCancelledError,
+)
+from qtpy import QtCore
+
+
+def _steps(count: int) -> Generator[str, None, int]:
+    """Run steps and return their count.
+
+    Returns:
+        int: Number of steps.
+
+    Yields:
+        str: Step message.
+
+    """
+    for step in range(count):
+        yield f"step {step}"
+    return count  # noqa: B901
+
+
+def test_wait_runs_steps() -> None:
+    """Test that all steps run and their result is returned."""
+    assert QtCore.QCoreApplication.instance() is None
+    task = HostTask(_steps(3), total=3, label="steps")
+    progress: list[tuple[int, int]] = []
+    messages: list[str] = []
+    task.progress.connect(lambda done, total: progress.append((done, total)))
+    task.message.connect(messages.append)
+
+    assert task.wait() == 3
+    assert progress == [(1, 3), (2, 3), (3, 3)]
+    assert messages == ["step 0", "step 1", "step 2"]
+    assert not task.is_running
+
+
+def test_wait_reraises_error() -> None:
+    """Test that exception of the operation is raised by wait."""
+    def _fail() -> Generator[None, None, None]:
+        yield
+        msg = "No layer"
+        raise RuntimeError(msg)
+
+    task = HostTask(_fail(), label="fail")
+    errors: list[str] = []
+    task.failed.connect(errors.append)
+
+    with pytest.raises(RuntimeError, match="No layer"):
+        task.wait()
+    assert errors == ["No layer"]
+    assert not task.is_running
+
+
+def test_wait_cancelled() -> None:
+    """Test that cancelled task stops before the next step."""
+    task = HostTask(_steps(5), total=5, label="steps")
+    task.message.connect(
+        lambda message: task.cancel() if message == "step 1" else None)
+
+    with pytest.raises(TaskCancelledError, match="steps"):
+        task.wait()
+    assert task.result is None
+    assert not task.is_running
+
+
+def test_monitor_busy_while_running() -> None:
+    """Test that the monitor is busy only while the task runs."""
+    busy_states: list[bool] = []
+    step_states: list[bool] = []
+    TASK_MONITOR.busy_changed.connect(busy_states.append)
+    task = HostTask(_steps(2), total=2, label="steps")
+    task.message.connect(
+        lambda _message: step_states.append(TASK_MONITOR.is_busy))
+    try:
+        task.wait()
+    finally:
+        TASK_MONITOR.busy_changed.disconnect(busy_states.append)
+
+    assert step_states == [True, True]
+    assert busy_states == [True, False]
+    assert not TASK_MONITOR.is_busy
@@ -0,0 +1,143 @@
+"""Tests for the workfile metadata scanner."""
+from __future__ import annotations
+
+import csv
+import gzip
+import json
+from typing import TYPE_CHECKING
+
+import pytest
+from ayon_mocha.api.workfile_scanner import (
+    _iter_csv_rows,  # noqa: PLC2701
+    scan_workfile,
+    write_index,
+)
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+AYON_DATA = {
+    "context": {"publish_attributes": {}},
+    "containers": [
+        {
+            "name": "plate",
+            "loader": "LoadClip",
+            "representation": "abc",
+            "version": "3",
+        },
+    ],
+    "publish_instances": [
+        {
+            "productName": "trackpointsMain",
+            "productType": "trackpoints",
+            "creator_identifier": "io.ayon.creators.mochapro.trackpoints",
+            "folderPath": "/shots/sh010",
+            "task": "tracking",
+        },
+    ],
+}
+
+
+def _project_content(data: dict) -> bytes:
+    """Return fake project content with AYON data in the notes.
+
+    Returns:
+        bytes: Project file content.
+
+    """
+    return (
+        "<project><notes>"
+        f"AYON_CONTEXT::{json.dumps(data)}::AYON_CONTEXT_END"
+        "</notes></project>\n"
+    ).encode()
+
+
+@pytest.fixture
+def record(tmp_path: Path) -> dict:
+    """Scan workfile with one container and one instance.
+
+    Returns:
+        dict: Index record.
+
+    """
+    path = tmp_path / "sh010_tracking_v001.mocha"
+    path.write_bytes(_project_content(AYON_DATA))
+    return scan_workfile(path)
+
+
+def test_scan_workfile(record: dict) -> None:
+    """Test that the record has context, containers and instances."""
+    assert record["error"] is None
+    assert record["context"] == {
+        "folderPath": "/shots/sh010", "task": "tracking"}
+    assert record["containers"] == AYON_DATA["containers"]
+    assert record["publish_instances"] == [{
+        "productName": "trackpointsMain",
+        "productType": "trackpoints",
+        "creator_identifier": "io.ayon.creators.mochapro.trackpoints",
+        "active": True,
+    }]
+
+
+@pytest.mark.parametrize("content", [
+    # truncated compressed file raises EOFError
+    gzip.compress(_project_content(AYON_DATA))[:40],
+    # corrupted compressed stream
+    b"\x1f\x8b" + b"\x00" * 32,
+    # valid gzip header with corrupted deflate stream raises zlib.error
+    gzip.compress(_project_content(AYON_DATA), mtime=0)[:10] + b"\xff" * 64,
+])
+def test_scan_workfile_unreadable(tmp_path: Path, content: bytes) -> None:
+    """Test that unreadable workfile is recorded with the error."""
+    path = tmp_path / "broken.mocha"
+    path.write_bytes(content)
+
+    record = scan_workfile(path)
+    assert record["error"]
+    assert record["containers"] == []
+
+
+def test_iter_csv_rows(record: dict) -> None:
+    """Test that every container and instance has its own row."""
+    failed = {
+        "workfile": "broken.mocha",
+        "context": {},
+        "containers": [],
+        "publish_instances": [],
+        "error": "Compressed file ended before the end-of-stream marker",
+    }
+    rows = list(_iter_csv_rows([record, failed]))
+
+    assert [row.get("kind") for row in rows] == [
+        "container", "instance", None]
+    assert rows[0]["plugin"] == "LoadClip"
+    assert rows[0]["version"] == "3"
+    assert rows[1]["product_type"] == "trackpoints"
+    assert {row["folder_path"] for row in rows[:2]} == {"/shots/sh010"}
+    assert rows[2]["error"] == failed["error"]
+
+
+def test_write_index(tmp_path: Path, record: dict) -> None:
+    """Test writing JSON and CSV index."""
+    json_path = write_index_file(tmp_path / "index.json", record)
+    assert json.loads(json_path.read_text(encoding="utf-8")) == [record]
+
+    csv_path = write_index_file(tmp_path / "out" / "index.csv", record)
+    with open(csv_path, encoding="utf-8", newline="") as stream:
+        rows = list(csv.DictReader(stream))
+    assert [row["kind"] for row in rows] == ["container", "instance"]
+    assert rows[0]["task"] == "tracking"
+
+    with pytest.raises(ValueError, match="Unsupported"):
+        write_index([record], tmp_path / "index.txt")
+
+
+def write_index_file(path: Path, record: dict) -> Path:
+    """Write index of the record to the path.
+
+    Returns:
+        Path: Written file.
+
+    """
+    write_index([record], path)
+    return path
@@ -0,0 +1,149 @@
+"""Tests for loading multiple clips."""
+from __future__ import annotations
+
+import importlib.util
+import logging
+import sys
+from contextlib import contextmanager
+from pathlib import Path
+from types import SimpleNamespace
+from typing import TYPE_CHECKING, Generator
+from unittest.mock import MagicMock
+
+import pytest
+
+if TYPE_CHECKING:
+    from types import ModuleType
+
+LOAD_CLIP_PATH = (
+    Path(__file__).resolve().parents[3]
+    / "client" / "ayon_mocha" / "plugins" / "load" / "load_clip.py"
+)
+
+
+class LoadError(Exception):
+    """Stand-in for AYON load error."""
+
+
+class FakeProject:
+    """Project recording added clips and undo groups."""
+
+    def __init__(self, broken: str) -> None:
+        """Initialize the project.
+
+        Args:
+            broken (str): Name of the clip that fails to load.
+
+        """
+        self.broken = broken
+        self.clips: dict[str, SimpleNamespace] = {}
+        self.undo_groups = 0
+
+    def get_clips(self) -> dict[str, SimpleNamespace]:
+        """Return clips by their names."""
+        return self.clips
+
+    def add_clip(self, clip: SimpleNamespace, name: str) -> None:
+        """Add clip to the project.
+
+        Raises:
+            RuntimeError: If the clip is the broken one.
+
+        """
+        if name == self.broken:
+            msg = f"Cannot read {name}"
+            raise RuntimeError(msg)
+        clip.name = name
+        self.clips[name] = clip
+
+    def new_output_clip(self, clip: SimpleNamespace, name: str) -> None:
+        """Create output clip."""
+
+    @contextmanager
+    def undo_group(self) -> Generator[None, None, None]:
+        """Count undo groups."""
+        self.undo_groups += 1
+        yield
+
+
+class FakeClipLoader:
+    """Clip loader without AYON and Mocha Pro."""
+
+    log = logging.getLogger("test_load_clip")
+
+    def get_clip_source(  # noqa: PLR6301
+            self, context: dict, options: dict) -> SimpleNamespace:
+        """Return clip source of the context."""
+        return SimpleNamespace(
+            path=f"/plates/{context['product']['name']}.exr",
+            sequence=None,
+            resolution="full",
+            scale=1.0,
+        )
+
+    def get_frame_size(self, path: str) -> tuple[int, int]:  # noqa: PLR6301
+        """Return frame size."""
+        return 1920, 1080
+
+    def link_frames(self, *args: object) -> None:
+        """Link frames of the sequence."""
+
+
+@pytest.fixture
+def load_clip(monkeypatch: pytest.MonkeyPatch) -> ModuleType:
+    """Import the plugin with mocked AYON and Mocha Pro modules.
+
+    Returns:
+        ModuleType: `load_clip` plugin module.
+
+    """
+    transcoding = MagicMock()
+    transcoding.IMAGE_EXTENSIONS = [".exr"]
+    load = MagicMock()
+    load.LoadError = LoadError
+    pipeline = MagicMock()
+    pipeline.Container = SimpleNamespace
+    plugin = MagicMock()
+    plugin.MochaClipLoader = FakeClipLoader
+    project = MagicMock()
+    project.Clip = lambda path, **kwargs: SimpleNamespace(  # noqa: ARG005
+        path=path, name="")
+    for name, module in (
+        ("ayon_core.lib", MagicMock()),
+        ("ayon_core.lib.transcoding", transcoding),
+        ("ayon_core.pipeline", MagicMock()),
+        ("ayon_core.pipeline.load", load),
+        ("ayon_mocha.api.pipeline", pipeline),
+        ("ayon_mocha.api.plugin", plugin),
+        ("ayon_mocha.api.ui_refresh", MagicMock()),
+        ("mocha", MagicMock()),
+        ("mocha.project", project),
+    ):
+        monkeypatch.setitem(sys.modules, name, module)
+    spec = importlib.util.spec_from_file_location("load_clip", LOAD_CLIP_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def test_load_multiple(load_clip: ModuleType) -> None:
+    """Test that loaded clips get containers when one clip fails."""
+    project = FakeProject(broken="broken")
+    project.clips["fg"] = SimpleNamespace(name="fg")
+    host = MagicMock()
+    host.get_current_project.return_value = project
+    load_clip.registered_host.return_value = host
+    contexts = [
+        {"product": {"name": name}, "representation": {"id": name}}
+        for name in ("fg", "broken", "bg")
+    ]
+
+    with pytest.raises(LoadError, match="broken"):
+        load_clip.LoadClip().load(contexts)
+
+    assert project.undo_groups == 1
+    host.add_containers.assert_called_once()
+    containers = host.add_containers.call_args.args[0]
+    assert [container.name for container in containers] == ["fg_1", "bg"]
+    assert set(project.clips) == {"fg", "fg_1", "bg"}
+    load_clip.update_ui.assert_called_once_with()